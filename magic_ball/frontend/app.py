@@ -22,8 +22,7 @@ from game_config import GameConfig
 from models import PlayerSign, GameStatus, TileType
 from board_utils import BoardUtils
 from cards.compendium import Compendium
-from players.player_config import PlayerConfig, PlayerType, ScoreMultipliers
-from players.player import NoAvailableMoves
+from players.player_config import PlayerConfig, PlayerType, ScoreMultipliers, SearchConfig, MctsConfig
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for development
@@ -56,12 +55,16 @@ def load_config_from_file(config_name):
     # Create player configs
     white_config = PlayerConfig(
         type=PlayerType(config_data['white_player']['type']),
-        score_multipliers=ScoreMultipliers(**config_data['white_player'].get('score_multipliers', {})) if 'score_multipliers' in config_data['white_player'] else None
+        score_multipliers=ScoreMultipliers(**config_data['white_player'].get('score_multipliers', {})) if 'score_multipliers' in config_data['white_player'] else None,
+        search_config=SearchConfig(**config_data['white_player']['search_config']) if 'search_config' in config_data['white_player'] else None,
+        mcts_config=MctsConfig(**config_data['white_player']['mcts_config']) if 'mcts_config' in config_data['white_player'] else None
     )
     
     black_config = PlayerConfig(
         type=PlayerType(config_data['black_player']['type']),
-        score_multipliers=ScoreMultipliers(**config_data['black_player'].get('score_multipliers', {})) if 'score_multipliers' in config_data['black_player'] else None
+        score_multipliers=ScoreMultipliers(**config_data['black_player'].get('score_multipliers', {})) if 'score_multipliers' in config_data['black_player'] else None,
+        search_config=SearchConfig(**config_data['black_player']['search_config']) if 'search_config' in config_data['black_player'] else None,
+        mcts_config=MctsConfig(**config_data['black_player']['mcts_config']) if 'mcts_config' in config_data['black_player'] else None
     )
     
     return GameConfig(white_player=white_config, black_player=black_config)
@@ -132,7 +135,7 @@ def get_game_state():
     assert isinstance(game_manager, GameManager)
     try:
         # Get board state
-        board = game_manager.board._board
+        board = game_manager.board.copy_board()
         ball_position = game_manager.board.ball_position
 
         # Log to screen
@@ -273,23 +276,12 @@ def make_ai_move():
                 'error': 'Not AI turn'
             }), 400
         
-        # Get AI player
-        ai_player = game_manager._black_player if ai_side == 'black' else game_manager._white_player
-        
-        # Get AI move
-        try:
-            ai_move = ai_player.find_move(
-                board=game_manager.board,
-                player_cards=game_manager._get_player().cards,
-                opponent_cards=game_manager._get_opponent().cards,
-            )
-            game_manager._play_move(
-                move=ai_move,
-            )
+        # Play AI move
+        ai_move = game_manager.step()
+        if ai_move is not None:
             move_description = ai_move.description
-        except NoAvailableMoves:
+        else:
             # AI passes turn
-            game_manager.pass_turn()
             move_description = 'AI passes turn'
             # TODO: this should be a game-over draw scenario.
         
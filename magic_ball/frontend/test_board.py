@@ -24,11 +24,11 @@ def test_board_initialization():
         game_manager = GameManager.new(config=config)
         
         print(f"Game manager created successfully")
-        print(f"Board: {game_manager._board._board}")
+        print(f"Board: {game_manager._board.copy_board()}")
         print(f"Ball position: {game_manager._board.ball_position}")
         
         # Check board structure
-        board = game_manager._board._board
+        board = game_manager._board.copy_board()
         if len(board) != 5:
             print(f"ERROR: Board has {len(board)} rows, expected 5")
             return False
@@ -0,0 +1,72 @@
+import argparse
+import json
+
+from benchmark import Benchmark, BenchmarkReport
+from models import BenchmarkKind
+
+parser = argparse.ArgumentParser()
+subparsers = parser.add_subparsers(dest="command", required=True)
+
+run_parser = subparsers.add_parser("run", help="Run the benchmark cases and save the report (baseline)")
+run_parser.add_argument("-o", "--output_filename", default="results/benchmark.json")
+run_parser.add_argument("-k", "--kind", action="append", choices=[kind.value for kind in BenchmarkKind], default=None)
+run_parser.add_argument("-f", "--filter", default=None, help="Only cases whose name contains this")
+run_parser.add_argument("-r", "--repeat", type=int, default=3)
+run_parser.add_argument("--corpus_games", type=int, default=8)
+run_parser.add_argument("--macro_games", type=int, default=4)
+run_parser.add_argument("--throughput_games", type=int, default=20)
+
+compare_parser = subparsers.add_parser("compare", help="Compare a report to a baseline")
+compare_parser.add_argument("baseline_filename")
+compare_parser.add_argument("report_filename")
+compare_parser.add_argument(
+    "-t",
+    "--threshold",
+    type=float,
+    default=0.1,
+    help="Relative increase (time per iteration, memory per game) above which a case is a regression",
+)
+args = parser.parse_args()
+
+if args.command == "run":
+    benchmark = Benchmark(
+        num_corpus_games=args.corpus_games,
+        num_macro_games=args.macro_games,
+        num_throughput_games=args.throughput_games,
+        repeat=args.repeat,
+    )
+    report = benchmark.run(
+        kinds=[BenchmarkKind(kind) for kind in args.kind] if args.kind else None,
+        name_filter=args.filter,
+    )
+    for result in report.results.values():
+        if result.memory is not None:
+            print(
+                f"{result.name} ({result.kind}): {result.memory.peak_bytes / 1024:.1f} KiB peak, "
+                f"{result.memory.mean_peak_bytes_per_game / 1024:.1f} KiB per game, "
+                f"{result.memory.mean_peak_bytes_per_ply / 1024:.1f} KiB per ply, "
+                f"by category: {result.memory.mean_live_bytes_per_category}"
+            )
+            continue
+        print(
+            f"{result.name} ({result.kind}): {result.runtime_sec:.4f} sec, "
+            f"{result.sec_per_iteration() * 1e6:.1f} usec per iteration ({result.num_iterations} iterations)"
+        )
+    open(args.output_filename, 'w').write(report.model_dump_json(indent=2))
+else:
+    comparisons = Benchmark.compare(
+        baseline=BenchmarkReport.model_validate(json.load(open(args.baseline_filename))),
+        report=BenchmarkReport.model_validate(json.load(open(args.report_filename))),
+        threshold=args.threshold,
+    )
+    for comparison in comparisons:
+        flag = (
+            "REGRESSION"
+            if comparison.is_regression
+            else "improvement"
+            if comparison.is_improvement
+            else ""
+        )
+        print(f"{comparison.name}: {comparison.ratio():.2f}x baseline {flag}")
+    if any(comparison.is_regression for comparison in comparisons):
+        raise SystemExit(1)
@@ -0,0 +1,56 @@
+import argparse
+import json
+
+from perft import Perft
+
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "-p",
+    "--position",
+    action="append",
+    default=None,
+    help="Reference position name (repeatable), all reference positions by default",
+)
+parser.add_argument("-d", "--depth", type=int, default=3)
+parser.add_argument("--divide", action="store_true", help="Split the node counts by root move")
+parser.add_argument("-o", "--output_filename", default=None)
+args = parser.parse_args()
+
+positions = (
+    [Perft.get_reference_position(name=name) for name in args.position]
+    if args.position
+    else Perft.REFERENCE_POSITIONS
+)
+
+results = []
+is_any_mismatch = False
+for position in positions:
+    result = Perft.run_position(
+        position=position,
+        depth=args.depth,
+        divide=args.divide,
+    )
+    results.append(result)
+    expected_num_nodes = position.expected_num_nodes.get(args.depth)
+    if expected_num_nodes is None:
+        check = "no reference"
+    elif expected_num_nodes == result.num_nodes:
+        check = "OK"
+    else:
+        check = f"MISMATCH, expected {expected_num_nodes}"
+        is_any_mismatch = True
+    print(
+        f"{position.name} depth {args.depth}: {result.num_nodes} nodes ({check}), "
+        f"{result.num_terminal_nodes} terminal, {result.runtime_sec:.2f} sec, {result.nodes_per_sec():.0f} nodes/sec"
+    )
+    print(f"  per card: {result.num_nodes_per_card}")
+    print(f"  per kind: {result.num_nodes_per_kind}")
+    if args.divide:
+        for move_name, num_nodes in result.num_nodes_per_root_move.items():
+            print(f"  {move_name}: {num_nodes}")
+
+if args.output_filename is not None:
+    open(args.output_filename, 'w').write(json.dumps([result.model_dump() for result in results], indent=2))
+
+if is_any_mismatch:
+    raise SystemExit(1)
@@ -1,23 +1,77 @@
 import argparse
 import json
 import time
+from contextlib import nullcontext
 
+from batch_game_simulator import BatchGameSimulator
 from cards.compendium import Compendium
 from game_config import GameConfig
 from game_simulator import GameSimulator
+from models import PlayerSign
+from simulation_profiler import SimulationProfiler
 
 parser = argparse.ArgumentParser()
 parser.add_argument("-i", "--input_filename", default="config/ai_vs_ai.json")
 parser.add_argument("-o", "--output_filename", default="results/new_sim.json")
 parser.add_argument("-n", "--num_games", type=int, default=10000)
+parser.add_argument("-w", "--workers", type=int, default=1)
+parser.add_argument("-s", "--seed", type=int, default=None)
+parser.add_argument(
+    "-t",
+    "--target_half_width",
+    type=float,
+    default=None,
+    help="Stop each simulation once all outcome rates are known within +-this value (95%% confidence), "
+         "num_games is then the maximal number of games",
+)
+parser.add_argument(
+    "-c",
+    "--compare",
+    action="store_true",
+    help="Compare each card with the input config, on the player's win rate (GameSimulator.compare), "
+         "num_games is then the maximal number of games per config",
+)
+parser.add_argument(
+    "-l",
+    "--lockstep",
+    action="store_true",
+    help="Play the games in lockstep batches (BatchGameSimulator), single process",
+)
 parser.add_argument("-p", "--player", choices=["white", "black"], default="white")
+parser.add_argument(
+    "--profile",
+    action="store_true",
+    help="Profile each simulation (cProfile and stack sampling), single worker",
+)
+parser.add_argument("--profile_dir", default="results/profiles")
+parser.add_argument("--profile_top", type=int, default=20, help="Number of functions in the profile reports")
 args = parser.parse_args()
+if args.profile and args.workers > 1:
+    parser.error("--profile runs the simulations in-process, use a single worker")
+if args.compare and args.target_half_width is not None:
+    parser.error("--compare stops on significance, it cannot be combined with --target_half_width")
+if args.lockstep and args.compare:
+    parser.error("--lockstep runs a single config, it cannot be combined with --compare")
+if args.lockstep and args.workers > 1:
+    parser.error("--lockstep runs the games in-process, use a single worker")
+if args.lockstep and args.target_half_width is not None:
+    parser.error("--lockstep runs a fixed number of games, it cannot be combined with --target_half_width")
+
+profiler = (
+    SimulationProfiler(
+        output_dir=args.profile_dir,
+        top_n=args.profile_top,
+    )
+    if args.profile
+    else None
+)
 
 base_config = GameConfig.model_validate(json.load(open(args.input_filename)))
 card_to_summary = {}
 
 for card_name in Compendium.get_cards_names():
-    config = base_config.model_copy()
+    # Deep copy, the input config is kept as is to compare with.
+    config = base_config.model_copy(deep=True)
     if args.player == "white":
         config.cards_config.white_card_names = [
             card_name,
@@ -31,10 +85,41 @@ for card_name in Compendium.get_cards_names():
         config=config,
     )
     print(f"{time.strftime('%c')}: {card_name}")
-    summary = simulator.run(
-        num_games=args.num_games,
-    )
-    print(f"W: {summary.num_white_wins}, D: {summary.num_draws}, B: {summary.num_black_wins}")
+    with profiler.profile(segment=card_name) if profiler is not None else nullcontext():
+        if args.lockstep:
+            summary = BatchGameSimulator(
+                config=config,
+            ).run(
+                num_games=args.num_games,
+                seed=args.seed,
+            )
+        elif args.compare:
+            comparison = simulator.compare(
+                other_config=base_config,
+                player_sign=PlayerSign(args.player),
+                max_num_games=args.num_games,
+                workers=args.workers,
+                seed=args.seed,
+            )
+            summary = comparison.summary
+            print(
+                f"{args.player} win rate {comparison.win_rate_difference():+.3f} vs input config "
+                f"(p-value: {comparison.p_value:.4f}, {'significant' if comparison.is_decided else 'not significant'})"
+            )
+        elif args.target_half_width is None:
+            summary = simulator.run(
+                num_games=args.num_games,
+                workers=args.workers,
+                seed=args.seed,
+            )
+        else:
+            summary = simulator.run_until_confident(
+                max_num_games=args.num_games,
+                target_half_width=args.target_half_width,
+                workers=args.workers,
+                seed=args.seed,
+            )
+    print(f"W: {summary.num_white_wins}, D: {summary.num_draws}, B: {summary.num_black_wins} ({summary.num_games} games)")
     card_to_summary[card_name] = summary
 
 runtime_sec = sum(summary.runtime_sec for summary in card_to_summary.values())
@@ -2,14 +2,67 @@ import argparse
 import itertools
 import json
 import time
+from contextlib import nullcontext
 
 from game_config import GameConfig
+from batch_game_simulator import BatchGameSimulator
 from game_simulator import GameSimulator
+from models import PlayerSign
+from simulation_profiler import SimulationProfiler
 
 parser = argparse.ArgumentParser()
 parser.add_argument("-o", "--output_filename", default="results/new_sim.json")
 parser.add_argument("-n", "--num_games", type=int, default=10000)
+parser.add_argument("-w", "--workers", type=int, default=1)
+parser.add_argument("-s", "--seed", type=int, default=None)
+parser.add_argument(
+    "-t",
+    "--target_half_width",
+    type=float,
+    default=None,
+    help="Stop each simulation once all outcome rates are known within +-this value (95%% confidence), "
+         "num_games is then the maximal number of games",
+)
+parser.add_argument(
+    "-c",
+    "--compare",
+    action="store_true",
+    help="Compare each white strategy with the current one against the same black strategy, on white's win rate "
+         "(GameSimulator.compare), num_games is then the maximal number of games per config",
+)
+parser.add_argument(
+    "-l",
+    "--lockstep",
+    action="store_true",
+    help="Play the games in lockstep batches (BatchGameSimulator), single process",
+)
+parser.add_argument(
+    "--profile",
+    action="store_true",
+    help="Profile each simulation (cProfile and stack sampling), single worker",
+)
+parser.add_argument("--profile_dir", default="results/profiles")
+parser.add_argument("--profile_top", type=int, default=20, help="Number of functions in the profile reports")
 args = parser.parse_args()
+if args.profile and args.workers > 1:
+    parser.error("--profile runs the simulations in-process, use a single worker")
+if args.compare and args.target_half_width is not None:
+    parser.error("--compare stops on significance, it cannot be combined with --target_half_width")
+if args.lockstep and args.compare:
+    parser.error("--lockstep runs a single config, it cannot be combined with --compare")
+if args.lockstep and args.workers > 1:
+    parser.error("--lockstep runs the games in-process, use a single worker")
+if args.lockstep and args.target_half_width is not None:
+    parser.error("--lockstep runs a fixed number of games, it cannot be combined with --target_half_width")
+
+profiler = (
+    SimulationProfiler(
+        output_dir=args.profile_dir,
+        top_n=args.profile_top,
+    )
+    if args.profile
+    else None
+)
 
 base_config = GameConfig.model_validate(json.load(open("config/ai_vs_ai.json")))
 
@@ -20,26 +73,74 @@ configs = [
     ("defensive", -250, 100, -1000), # Very cards averse, especially last playable card
 ]
 
-name_to_summary = {}
-for config_1, config_2 in itertools.product(configs, configs):
-    name_1, penalty_score_per_used_card_1, ball_position_score_1, no_cards_play_available_penalty_score_1 = config_1
-    name_2, penalty_score_per_used_card_2, ball_position_score_2, no_cards_play_available_penalty_score_2 = config_2
-    config = base_config.model_copy()
+
+def strategies_config(config_1: tuple, config_2: tuple) -> GameConfig:
+    _, penalty_score_per_used_card_1, ball_position_score_1, no_cards_play_available_penalty_score_1 = config_1
+    _, penalty_score_per_used_card_2, ball_position_score_2, no_cards_play_available_penalty_score_2 = config_2
+    # Deep copy, configs of different cells must not share their players.
+    config = base_config.model_copy(deep=True)
     config.white_player.score_multipliers.penalty_score_per_used_card = penalty_score_per_used_card_1
     config.white_player.score_multipliers.ball_position_score = ball_position_score_1
     config.white_player.score_multipliers.no_cards_play_available_penalty_score = no_cards_play_available_penalty_score_1
     config.black_player.score_multipliers.penalty_score_per_used_card = penalty_score_per_used_card_2
     config.black_player.score_multipliers.ball_position_score = ball_position_score_2
     config.black_player.score_multipliers.no_cards_play_available_penalty_score = no_cards_play_available_penalty_score_2
+    return config
+
+
+name_to_summary = {}
+for config_1, config_2 in itertools.product(configs, configs):
+    name_1 = config_1[0]
+    name_2 = config_2[0]
+    if args.compare and config_1 == configs[0]:
+        continue
+    config = strategies_config(
+        config_1=config_1,
+        config_2=config_2,
+    )
 
     simulator = GameSimulator(
         config=config,
     )
     print(f"{time.strftime('%c')}: {name_1} v {name_2}")
-    summary = simulator.run(
-        num_games=args.num_games,
-    )
-    print(f"W: {summary.num_white_wins}, D: {summary.num_draws}, B: {summary.num_black_wins}")
+    with profiler.profile(segment=f"{name_1}_v_{name_2}") if profiler is not None else nullcontext():
+        if args.lockstep:
+            summary = BatchGameSimulator(
+                config=config,
+            ).run(
+                num_games=args.num_games,
+                seed=args.seed,
+            )
+        elif args.compare:
+            comparison = simulator.compare(
+                other_config=strategies_config(
+                    config_1=configs[0],
+                    config_2=config_2,
+                ),
+                player_sign=PlayerSign.white,
+                max_num_games=args.num_games,
+                workers=args.workers,
+                seed=args.seed,
+            )
+            summary = comparison.summary
+            print(
+                f"white win rate {comparison.win_rate_difference():+.3f} vs {configs[0][0]} v {name_2} "
+                f"(p-value: {comparison.p_value:.4f}, {'significant' if comparison.is_decided else 'not significant'})"
+            )
+        elif args.target_half_width is None:
+            summary = simulator.run(
+                num_games=args.num_games,
+                workers=args.workers,
+                seed=args.seed,
+            )
+        else:
+            summary = simulator.run_until_confident(
+                max_num_games=args.num_games,
+                target_half_width=args.target_half_width,
+                workers=args.workers,
+                seed=args.seed,
+            )
+    print(f"W: {summary.num_white_wins}, D: {summary.num_draws}, B: {summary.num_black_wins} ({summary.num_games} games)")
     name_to_summary[f"{name_1}_v_{name_2}"] = summary
 
 runtime_sec = sum(summary.runtime_sec for summary in name_to_summary.values())
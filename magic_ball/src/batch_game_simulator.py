@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import json
+import random
+import time
+
+import numpy as np
+
+from game_config import GameConfig
+from game_simulator import GameSimulator
+from headless_game import HeadlessGame
+from instrumentation import Instrumentation
+from models import PlayerSign, InstrumentationCategory
+from players.base_heuristic_player import BaseHeuristicPlayer
+from players.player import NoAvailableMoves
+from players.player_config import PlayerType
+from scores.batch_scorer import CandidateBatch
+from simulation_summary import SimulationSummary
+
+
+class LockstepGame(HeadlessGame):
+    """
+    A headless game advanced one ply at a time by BatchGameSimulator.
+    Keeps its own random state so it plays exactly as the same seeded game would on its own,
+    however games are interleaved.
+    """
+
+    __slots__ = ("game_index", "random_state")
+
+    def __init__(
+        self,
+        config: GameConfig,
+        game_index: int,
+        seed: int,
+    ):
+        random.seed(
+            GameSimulator.game_seed(
+                seed=seed,
+                game_index=game_index,
+            ),
+        )
+        super().__init__(
+            config=config,
+        )
+        self.game_index = game_index
+        self.random_state = random.getstate()
+
+
+class BatchGameSimulator:
+    """
+    Plays many AI-vs-AI games in lockstep: every step advances all active games by one ply,
+    and finished games are replaced by new ones until all games are played.
+
+    The candidate moves of all heuristic players to move are scored together in one BatchScorer call per side,
+    other players find their moves one game at a time.
+    Move generation is per card, so it stays per game.
+
+    Game i is seeded as in a seeded GameSimulator run, so both give the same summary for the same seed.
+    """
+
+    DEFAULT_BATCH_SIZE = 256
+
+    @classmethod
+    def from_config_filename(
+        cls,
+        config_filename: str,
+    ) -> BatchGameSimulator:
+        config = GameConfig.model_validate(json.load(open(config_filename)))
+        return BatchGameSimulator(
+            config=config,
+        )
+
+    def __init__(
+        self,
+        config: GameConfig,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        assert PlayerType.human not in [config.white_player.type, config.black_player.type], (
+            "Batch simulation requires AI players."
+        )
+        self._config = config
+        self._batch_size = batch_size
+
+    def run(
+        self,
+        num_games: int,
+        seed: int | None = None,
+    ) -> SimulationSummary:
+        """
+        Without a seed, one is drawn from the global random state. The global random state is restored when done.
+        """
+        if seed is None:
+            seed = random.getrandbits(64)
+
+        start_ts = time.time()
+        summary = SimulationSummary(
+            config=self._config,
+            num_games=num_games,
+            num_white_wins=0,
+            num_draws=0,
+            num_black_wins=0,
+        )
+        random_state = random.getstate()
+        next_game_index = 0
+        games: list[LockstepGame] = []
+        while games or next_game_index < num_games:
+            while len(games) < self._batch_size and next_game_index < num_games:
+                games.append(
+                    LockstepGame(
+                        config=self._config,
+                        game_index=next_game_index,
+                        seed=seed,
+                    )
+                )
+                next_game_index += 1
+
+            self._step(
+                games=games,
+            )
+
+            for game in games:
+                if not game.state.is_ongoing:
+                    match game.state.winner:
+                        case "white":
+                            summary.num_white_wins += 1
+                        case "black":
+                            summary.num_black_wins += 1
+                        case "draw":
+                            summary.num_draws += 1
+            games = [
+                game
+                for game in games
+                if game.state.is_ongoing
+            ]
+        random.setstate(random_state)
+
+        summary.runtime_sec = time.time() - start_ts
+        return summary
+
+    @classmethod
+    def _step(
+        cls,
+        games: list[LockstepGame],
+    ):
+        """
+        Play one ply in every game.
+        """
+        candidates_per_player_sign: dict[PlayerSign, list[tuple[LockstepGame, CandidateBatch]]] = {
+            player_sign: []
+            for player_sign in PlayerSign
+        }
+        for game in games:
+            player = game.player
+            try:
+                if isinstance(player, BaseHeuristicPlayer):
+                    # Candidates only, batch scored below.
+                    with Instrumentation.timer(
+                        category=InstrumentationCategory.find_move,
+                        key=type(player).__name__,
+                    ):
+                        candidates = player.get_candidates(
+                            board=game.state.board,
+                            player_cards=player.cards,
+                            opponent_cards=game.opponent.cards,
+                        )
+                    candidates_per_player_sign[game.state.player_turn].append(
+                        (
+                            game,
+                            candidates,
+                        )
+                    )
+                    continue
+
+                random.setstate(game.random_state)
+                with Instrumentation.timer(
+                    category=InstrumentationCategory.find_move,
+                    key=type(player).__name__,
+                ):
+                    move = player.find_move(
+                        board=game.state.board,
+                        player_cards=player.cards,
+                        opponent_cards=game.opponent.cards,
+                    )
+                game.random_state = random.getstate()
+                game.state.play_move(
+                    move=move,
+                )
+            except NoAvailableMoves:
+                # Pass turn, as GameManager does.
+                game.state.complete_turn()
+
+        for games_and_candidates in candidates_per_player_sign.values():
+            if not games_and_candidates:
+                continue
+            cls._play_best_moves(
+                games_and_candidates=games_and_candidates,
+            )
+
+    @classmethod
+    def _play_best_moves(
+        cls,
+        games_and_candidates: list[tuple[LockstepGame, CandidateBatch]],
+    ):
+        segment_ends = np.cumsum([len(candidates) for _, candidates in games_and_candidates]).tolist()
+        segments = list(zip([0] + segment_ends[:-1], segment_ends))
+
+        def draw_tie_breaks(is_ongoing: np.ndarray) -> list[float]:
+            # Every game draws its tie-breaks from its own random state.
+            tie_breaks = []
+            for (game, _), (start, end) in zip(games_and_candidates, segments):
+                num_tie_breaks = 2 * int(is_ongoing[start:end].sum())
+                if num_tie_breaks:
+                    random.setstate(game.random_state)
+                    tie_breaks.extend(random.random() for _ in range(num_tie_breaks))
+                    game.random_state = random.getstate()
+            return tie_breaks
+
+        # All games have the same player config per side, any of their scorers will do.
+        scorer = games_and_candidates[0][0].player.scorer
+        scores = scorer.score_candidates(
+            candidates=CandidateBatch.concatenate(
+                batches=[candidates for _, candidates in games_and_candidates],
+            ),
+            draw_tie_breaks=draw_tie_breaks,
+        )
+        for (game, candidates), (start, end) in zip(games_and_candidates, segments):
+            game.state.play_move(
+                move=candidates.moves[int(np.argmax(scores[start:end]))],
+            )
@@ -0,0 +1,422 @@
+from __future__ import annotations
+
+import platform
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+from cards.card import Card
+from cards.cards_config import CardsConfig
+from cards.compendium import Compendium
+from game_config import GameConfig
+from game_simulator import GameSimulator
+from game_state import GameState
+from headless_game import HeadlessGame
+from helper import Helper
+from memory_tracker import MemoryTracker, MemoryReport
+from models import BenchmarkKind, PlayerSign
+from players.player_config import PlayerConfig, PlayerType
+from scores.scorer import Scorer
+
+
+class BenchmarkResult(BaseModel):
+    name: str
+    kind: BenchmarkKind
+    num_iterations: int  # Per run: corpus positions, games...
+    runtime_sec: float  # Best of the repeated runs
+    memory: MemoryReport | None = None  # Memory cases only
+
+    def sec_per_iteration(self) -> float:
+        return self.runtime_sec / self.num_iterations
+
+    def value(self) -> float:
+        """
+        Compared to the baseline: mean peak traced bytes per game for memory cases, time per iteration otherwise.
+        """
+        if self.memory is not None:
+            return self.memory.mean_peak_bytes_per_game
+        return self.sec_per_iteration()
+
+
+class BenchmarkReport(BaseModel):
+    python_version: str
+    results: dict[str, BenchmarkResult]
+
+
+class BenchmarkComparison(BaseModel):
+    name: str
+    baseline_value: float
+    value: float  # See BenchmarkResult.value
+    is_regression: bool
+    is_improvement: bool
+
+    def ratio(self) -> float:
+        """
+        Above 1 is slower (or larger) than the baseline.
+        """
+        return self.value / self.baseline_value
+
+
+@dataclass(slots=True)
+class BenchmarkCase:
+    name: str
+    kind: BenchmarkKind
+    run: Callable[[Any], int]  # Given the setup output, return the number of iterations
+    setup: Callable[[], Any] = field(default=lambda: None)  # Not timed, called before every run
+
+
+@dataclass(slots=True)
+class MemoryBenchmarkCase:
+    name: str
+    config: GameConfig
+    kind: BenchmarkKind = BenchmarkKind.memory
+
+
+class Benchmark:
+    """
+    Engine benchmark cases, each timed as the best of a few runs:
+    - micro: Card.get_available_card_moves per card, Helper.get_available_moves, Scorer.score_board and Board.copy_board
+      over a corpus of positions from seeded random games
+    - macro: full AI-vs-AI games per deck size
+    - throughput: GameSimulator.run
+    - memory: traced memory of AI-vs-AI games per deck size (see MemoryTracker), measured once
+
+    Reports are saved as JSON baselines and compared with compare.
+    The global random state is kept as is.
+    """
+
+    # Decks (white, black) of the macro games, both are drawn from the 15 cards without overlap.
+    MACRO_DECK_SIZES = [(3, 3), (5, 5), (7, 7), (10, 5)]
+
+    def __init__(
+        self,
+        num_corpus_games: int = 8,
+        num_macro_games: int = 4,
+        num_throughput_games: int = 20,
+        repeat: int = 3,
+        seed: int = 0,
+    ):
+        self._num_corpus_games = num_corpus_games
+        self._num_macro_games = num_macro_games
+        self._num_throughput_games = num_throughput_games
+        self._repeat = repeat
+        self._seed = seed
+        self._corpus: list[GameState] | None = None
+
+    def cases(self) -> list[BenchmarkCase | MemoryBenchmarkCase]:
+        return self._micro_cases() + self._macro_cases() + self._throughput_cases() + self._memory_cases()
+
+    def run(
+        self,
+        kinds: list[BenchmarkKind] | None = None,
+        name_filter: str | None = None,
+    ) -> BenchmarkReport:
+        random_state = random.getstate()
+        results = {}
+        for case in self.cases():
+            if kinds is not None and case.kind not in kinds:
+                continue
+            if name_filter is not None and name_filter not in case.name:
+                continue
+            results[case.name] = (
+                self._run_memory_case(
+                    case=case,
+                )
+                if isinstance(case, MemoryBenchmarkCase)
+                else self._run_case(
+                    case=case,
+                )
+            )
+        random.setstate(random_state)
+        return BenchmarkReport(
+            python_version=platform.python_version(),
+            results=results,
+        )
+
+    @classmethod
+    def compare(
+        cls,
+        baseline: BenchmarkReport,
+        report: BenchmarkReport,
+        threshold: float = 0.1,
+    ) -> list[BenchmarkComparison]:
+        """
+        Compare the cases of both reports by value (time per iteration, or memory per game),
+        a case is a regression (improvement) if larger (smaller) by more than threshold (relative).
+        """
+        comparisons = []
+        for name, result in report.results.items():
+            baseline_result = baseline.results.get(name)
+            if baseline_result is None:
+                continue
+            ratio = result.value() / baseline_result.value()
+            comparisons.append(
+                BenchmarkComparison(
+                    name=name,
+                    baseline_value=baseline_result.value(),
+                    value=result.value(),
+                    is_regression=ratio > 1 + threshold,
+                    is_improvement=ratio < 1 - threshold,
+                )
+            )
+        return comparisons
+
+    def _run_case(
+        self,
+        case: BenchmarkCase,
+    ) -> BenchmarkResult:
+        runtime_sec = float("inf")
+        num_iterations = 0
+        for _ in range(self._repeat):
+            random.seed(self._seed)
+            setup_output = case.setup()
+            start_time = time.perf_counter()
+            num_iterations = case.run(setup_output)
+            runtime_sec = min(runtime_sec, time.perf_counter() - start_time)
+        return BenchmarkResult(
+            name=case.name,
+            kind=case.kind,
+            num_iterations=num_iterations,
+            runtime_sec=runtime_sec,
+        )
+
+    def _run_memory_case(
+        self,
+        case: MemoryBenchmarkCase,
+    ) -> BenchmarkResult:
+        start_time = time.perf_counter()
+        memory = MemoryTracker().measure(
+            config=case.config,
+            num_games=self._num_macro_games,
+            seed=self._seed,
+        )
+        return BenchmarkResult(
+            name=case.name,
+            kind=case.kind,
+            num_iterations=self._num_macro_games,
+            runtime_sec=time.perf_counter() - start_time,
+            memory=memory,
+        )
+
+    def _get_corpus(self) -> list[GameState]:
+        """
+        Every position of seeded random-vs-random games with 5-card decks.
+        """
+        if self._corpus is None:
+            config = GameConfig(
+                white_player=PlayerConfig(
+                    type=PlayerType.random,
+                ),
+                black_player=PlayerConfig(
+                    type=PlayerType.random,
+                ),
+            )
+            random_state = random.getstate()
+            self._corpus = []
+            for game_index in range(self._num_corpus_games):
+                random.seed(
+                    GameSimulator.game_seed(
+                        seed=self._seed,
+                        game_index=game_index,
+                    ),
+                )
+                game = HeadlessGame(
+                    config=config,
+                )
+                while game.state.is_ongoing:
+                    self._corpus.append(game.state.clone())
+                    game.step()
+            random.setstate(random_state)
+        return self._corpus
+
+    def _corpus_clones(self) -> list[GameState]:
+        # Clones, the move generation cache of the corpus boards stays empty.
+        return [
+            state.clone()
+            for state in self._get_corpus()
+        ]
+
+    def _micro_cases(self) -> list[BenchmarkCase]:
+        cases = [
+            BenchmarkCase(
+                name=f"card_moves_{card.name}",
+                kind=BenchmarkKind.micro,
+                run=self._card_moves_runner(
+                    card=card,
+                ),
+                setup=self._get_corpus,
+            )
+            for card in Compendium.get_cards()
+        ]
+        cases.append(
+            BenchmarkCase(
+                name="helper_available_moves",
+                kind=BenchmarkKind.micro,
+                run=self._run_helper_available_moves,
+                setup=self._corpus_clones,
+            )
+        )
+        cases.append(
+            BenchmarkCase(
+                name="scorer_score_board",
+                kind=BenchmarkKind.micro,
+                run=self._run_scorer_score_board,
+                setup=self._get_corpus,
+            )
+        )
+        cases.append(
+            BenchmarkCase(
+                name="board_copy_board",
+                kind=BenchmarkKind.micro,
+                run=self._run_board_copy_board,
+                setup=self._get_corpus,
+            )
+        )
+        return cases
+
+    def _card_moves_runner(
+        self,
+        card: Card,
+    ) -> Callable[[Any], int]:
+        def run(states: list[GameState]) -> int:
+            for state in states:
+                card.get_available_card_moves(
+                    player_sign=state.player_turn,
+                    board=state.board,
+                    card_index=0,
+                )
+            return len(states)
+        return run
+
+    def _run_helper_available_moves(
+        self,
+        states: list[GameState],
+    ) -> int:
+        for state in states:
+            Helper.get_available_moves(
+                player_sign=state.player_turn,
+                board=state.board,
+                cards=state.cards(
+                    player_sign=state.player_turn,
+                ),
+                num_allowed_playable_cards=state.num_allowed_playable_cards,
+            )
+        return len(states)
+
+    def _run_scorer_score_board(
+        self,
+        states: list[GameState],
+    ) -> int:
+        config = PlayerConfig.default_ai_opponent(
+            random_tie_break=False,
+        )
+        scorers = {
+            player_sign: Scorer(
+                player_sign=player_sign,
+                config=config,
+            )
+            for player_sign in PlayerSign
+        }
+        for state in states:
+            board = state.board
+            scorers[state.player_turn].score_board(
+                board=board,
+                ball_position=board.ball_position,
+                num_used_player_cards=board.num_used_cards(
+                    player_sign=state.player_turn,
+                ),
+                num_used_opponent_cards=board.num_used_cards(
+                    player_sign=PlayerSign.black if state.player_turn == PlayerSign.white else PlayerSign.white,
+                ),
+                num_allowed_playable_cards=state.num_allowed_playable_cards,
+            )
+        return len(states)
+
+    def _run_board_copy_board(
+        self,
+        states: list[GameState],
+    ) -> int:
+        for state in states:
+            state.board.copy_board()
+        return len(states)
+
+    def _macro_cases(self) -> list[BenchmarkCase]:
+        return [
+            BenchmarkCase(
+                name=f"ai_vs_ai_game_{num_white_cards}v{num_black_cards}_cards",
+                kind=BenchmarkKind.macro,
+                run=self._ai_vs_ai_games_runner(
+                    config=self._ai_vs_ai_config(
+                        num_white_cards=num_white_cards,
+                        num_black_cards=num_black_cards,
+                    ),
+                ),
+            )
+            for num_white_cards, num_black_cards in self.MACRO_DECK_SIZES
+        ]
+
+    def _ai_vs_ai_games_runner(
+        self,
+        config: GameConfig,
+    ) -> Callable[[Any], int]:
+        def run(_) -> int:
+            for game_index in range(self._num_macro_games):
+                random.seed(
+                    GameSimulator.game_seed(
+                        seed=self._seed,
+                        game_index=game_index,
+                    ),
+                )
+                HeadlessGame(
+                    config=config,
+                ).run_until_done()
+            return self._num_macro_games
+        return run
+
+    def _throughput_cases(self) -> list[BenchmarkCase]:
+        simulator = GameSimulator(
+            config=self._ai_vs_ai_config(),
+            memoize=False,
+        )
+        return [
+            BenchmarkCase(
+                name="game_simulator_run",
+                kind=BenchmarkKind.throughput,
+                run=lambda _: simulator.run(
+                    num_games=self._num_throughput_games,
+                    seed=self._seed,
+                ).num_games,
+            ),
+        ]
+
+    def _memory_cases(self) -> list[MemoryBenchmarkCase]:
+        return [
+            MemoryBenchmarkCase(
+                name=f"memory_ai_vs_ai_game_{num_white_cards}v{num_black_cards}_cards",
+                config=self._ai_vs_ai_config(
+                    num_white_cards=num_white_cards,
+                    num_black_cards=num_black_cards,
+                ),
+            )
+            for num_white_cards, num_black_cards in self.MACRO_DECK_SIZES
+        ]
+
+    @classmethod
+    def _ai_vs_ai_config(
+        cls,
+        num_white_cards: int | None = None,
+        num_black_cards: int | None = None,
+    ) -> GameConfig:
+        cards_config = CardsConfig()
+        if num_white_cards is not None:
+            cards_config.num_white_cards = num_white_cards
+        if num_black_cards is not None:
+            cards_config.num_black_cards = num_black_cards
+        return GameConfig(
+            white_player=PlayerConfig.default_ai_opponent(),
+            black_player=PlayerConfig.default_ai_opponent(),
+            cards_config=cards_config,
+        )
@@ -0,0 +1,304 @@
+from typing import Iterator
+
+from models import BoardType, MoveKind, PlayerSign, TileType
+
+
+class BitboardUtils:
+    """
+    A board is represented by three 25-bit masks: white pawns, black pawns and walls.
+    Squares are indexed column-major: square = col_i * 5 + row_i (A1 = 0, A5 = 4, B1 = 5, ..., E5 = 24).
+    Iterating over the set bits of a mask follows the same column-then-row order as a full board scan.
+    """
+
+    FULL_MASK = (1 << 25) - 1
+    ROW_MASKS = tuple(
+        sum(1 << (col_i * 5 + row_i) for col_i in range(5))
+        for row_i in range(5)
+    )
+    COLUMN_MASKS = tuple(
+        0b11111 << (col_i * 5)
+        for col_i in range(5)
+    )
+    ROW_MAJOR_SQUARES = tuple(
+        col_i * 5 + row_i
+        for row_i in range(5)
+        for col_i in range(5)
+    )
+
+    @classmethod
+    def square(
+        cls,
+        col_i: int,
+        row_i: int,
+    ) -> int:
+        return col_i * 5 + row_i
+
+    @classmethod
+    def square_to_indices(
+        cls,
+        square: int,
+    ) -> tuple[int, int]:
+        return divmod(square, 5)
+
+    @classmethod
+    def square_to_tile(
+        cls,
+        square: int,
+    ) -> str:
+        col_i, row_i = divmod(square, 5)
+        return "ABCDE"[col_i] + "12345"[row_i]
+
+    @classmethod
+    def iter_squares(
+        cls,
+        mask: int,
+    ) -> Iterator[int]:
+        while mask:
+            lowest_bit = mask & -mask
+            yield lowest_bit.bit_length() - 1
+            mask ^= lowest_bit
+
+    @classmethod
+    def iter_squares_row_major(
+        cls,
+        mask: int,
+    ) -> Iterator[int]:
+        for square in cls.ROW_MAJOR_SQUARES:
+            if mask >> square & 1:
+                yield square
+
+    @classmethod
+    def indices(
+        cls,
+        mask: int,
+    ) -> list[tuple[int, int]]:
+        return [
+            divmod(square, 5)
+            for square in cls.iter_squares(mask)
+        ]
+
+    @classmethod
+    def from_board_type(
+        cls,
+        board: BoardType,
+    ) -> tuple[int, int, int]:
+        """
+        Return (white, black, wall) masks of the input grid board.
+        """
+        white = black = wall = 0
+        for row_i in range(5):
+            for col_i in range(5):
+                match board[row_i][col_i]:
+                    case TileType.white:
+                        white |= 1 << (col_i * 5 + row_i)
+                    case TileType.black:
+                        black |= 1 << (col_i * 5 + row_i)
+                    case TileType.wall:
+                        wall |= 1 << (col_i * 5 + row_i)
+        return white, black, wall
+
+    @classmethod
+    def to_board_type(
+        cls,
+        white: int,
+        black: int,
+        wall: int,
+    ) -> BoardType:
+        return [
+            [
+                cls.square_to_tile_type(
+                    square=col_i * 5 + row_i,
+                    white=white,
+                    black=black,
+                    wall=wall,
+                )
+                for col_i in range(5)
+            ]
+            for row_i in range(5)
+        ]
+
+    @classmethod
+    def square_to_tile_type(
+        cls,
+        square: int,
+        white: int,
+        black: int,
+        wall: int,
+    ) -> TileType:
+        if white >> square & 1:
+            return TileType.white
+        if black >> square & 1:
+            return TileType.black
+        if wall >> square & 1:
+            return TileType.wall
+        return TileType.vacant
+
+    @classmethod
+    def forward_shift(
+        cls,
+        player_sign: PlayerSign,
+        mask: int,
+    ) -> int:
+        """
+        Shift every square of the mask one row towards the opponent's start row.
+        Squares on the last row are dropped.
+        """
+        if player_sign == PlayerSign.white:
+            return (mask & ~cls.ROW_MASKS[4]) << 1
+        return (mask & ~cls.ROW_MASKS[0]) >> 1
+
+    @classmethod
+    def backward_fill(
+        cls,
+        player_sign: PlayerSign,
+        mask: int,
+    ) -> int:
+        """
+        Return all squares which have a square of the input mask in front of them in the same column.
+        "In front" is the direction of the input player's pawns advance.
+        """
+        backward_player_sign = (
+            PlayerSign.black
+            if player_sign == PlayerSign.white
+            else PlayerSign.white
+        )
+        fill = cls.forward_shift(
+            player_sign=backward_player_sign,
+            mask=mask,
+        )
+        for _ in range(3):
+            fill |= cls.forward_shift(
+                player_sign=backward_player_sign,
+                mask=fill,
+            )
+        return fill
+
+    @classmethod
+    def is_player_win(
+        cls,
+        player_sign: PlayerSign,
+        pawns: int,
+    ) -> bool:
+        last_row_mask = (
+            cls.ROW_MASKS[4]
+            if player_sign == PlayerSign.white
+            else cls.ROW_MASKS[0]
+        )
+        return bool(pawns & last_row_mask)
+
+    @classmethod
+    def push_targets(
+        cls,
+        player_sign: PlayerSign,
+        pawns: int,
+        vacant: int,
+    ) -> int:
+        return cls.forward_shift(
+            player_sign=player_sign,
+            mask=pawns,
+        ) & vacant
+
+    @classmethod
+    def is_player_single_push_to_win(
+        cls,
+        player_sign: PlayerSign,
+        pawns: int,
+        vacant: int,
+    ) -> bool:
+        return cls.is_player_win(
+            player_sign=player_sign,
+            pawns=cls.push_targets(
+                player_sign=player_sign,
+                pawns=pawns,
+                vacant=vacant,
+            ),
+        )
+
+    @classmethod
+    def free_pawns(
+        cls,
+        player_sign: PlayerSign,
+        pawns: int,
+        occupied: int,
+    ) -> int:
+        """
+        A free pawn has only vacant tiles in front of it, up to the opponent's start row.
+        """
+        return pawns & ~cls.backward_fill(
+            player_sign=player_sign,
+            mask=occupied,
+        )
+
+    @classmethod
+    def apply_move(
+        cls,
+        player_sign: PlayerSign,
+        kind: MoveKind,
+        source_square: int,
+        target_square: int,
+        white: int,
+        black: int,
+        wall: int,
+    ) -> tuple[int, int, int]:
+        """
+        Return the (white, black, wall) masks after playing an encoded move on the input masks.
+        Moves are assumed to be valid, i.e. generated from these masks.
+        """
+        target_bit = 1 << target_square
+        match kind:
+            case MoveKind.push | MoveKind.move_tile:
+                return cls._move_tile(
+                    source_bit=1 << source_square,
+                    target_bit=target_bit,
+                    white=white,
+                    black=black,
+                    wall=wall,
+                )
+            case MoveKind.tank:
+                white, black, wall = cls._move_tile(
+                    source_bit=target_bit,
+                    target_bit=1 << (2 * target_square - source_square),
+                    white=white,
+                    black=black,
+                    wall=wall,
+                )
+                return cls._move_tile(
+                    source_bit=1 << source_square,
+                    target_bit=target_bit,
+                    white=white,
+                    black=black,
+                    wall=wall,
+                )
+            case MoveKind.eliminate:
+                return white & ~target_bit, black & ~target_bit, wall
+            case MoveKind.eliminate_pair:
+                pair_mask = ~(target_bit | 1 << source_square)
+                return white & pair_mask, black & pair_mask, wall
+            case MoveKind.spawn:
+                if player_sign == PlayerSign.white:
+                    return white | target_bit, black, wall
+                return white, black | target_bit, wall
+            case MoveKind.wall:
+                return white, black, wall | target_bit
+            case MoveKind.fire:
+                row_mask = ~cls.ROW_MASKS[target_square % 5]
+                return white & row_mask, black & row_mask, wall & row_mask
+            case MoveKind.pull:
+                return white, black, wall
+        raise RuntimeError(f"Unknown move kind: {kind}")
+
+    @classmethod
+    def _move_tile(
+        cls,
+        source_bit: int,
+        target_bit: int,
+        white: int,
+        black: int,
+        wall: int,
+    ) -> tuple[int, int, int]:
+        swap_mask = source_bit | target_bit
+        if white & source_bit:
+            return white ^ swap_mask, black, wall
+        if black & source_bit:
+            return white, black ^ swap_mask, wall
+        return white, black, wall ^ swap_mask
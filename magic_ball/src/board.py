@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-import copy
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from models import BoardType, BallPosition, TileType
+from bitboard_utils import BitboardUtils
+from instrumentation import Instrumentation
+from models import BoardType, BallPosition, PlayerSign, TileType, InstrumentationCategory
 from move import Move
+from zobrist import Zobrist
+
+if TYPE_CHECKING:
+    from cards.card import Card
 
 
 @dataclass
@@ -12,13 +18,101 @@ class InvalidMove(Exception):
     description: str
 
 
+@dataclass
+class MoveUndo:
+    """
+    Everything make_move changes, enough to restore the board (and used card) exactly.
+    """
+    white: int
+    black: int
+    wall: int
+    ball_position: BallPosition
+    white_used_cards: int
+    black_used_cards: int
+    position_hash: int
+    used_card: Card | None = None
+
 
 class Board:
+    """
+    Tiles are kept as white / black / wall bitboard masks (see BitboardUtils).
+    Indexing (board[row_i][col_i]) materializes a row of tile types for display and backward compatibility.
+
+    The cards used by the moves played on the board are kept as a bitmask of card indices per player,
+    the source of truth for card availability in move generation (Card.already_used is for display).
+
+    The board also keeps a Zobrist hash of its tiles, ball position and used cards,
+    and a cache of the available moves of the current position (see Helper.get_available_moves),
+    cleared whenever the board changes.
+    """
+
+    __slots__ = (
+        "_white",
+        "_black",
+        "_wall",
+        "_ball_position",
+        "_white_used_cards",
+        "_black_used_cards",
+        "_hash",
+        "_undo_stack",
+        "_moves_cache",
+    )
 
     @classmethod
     def new(cls) -> Board:
+        return Board.from_masks(
+            white=BitboardUtils.ROW_MASKS[0],
+            black=BitboardUtils.ROW_MASKS[4],
+            wall=0,
+            ball_position=BallPosition.middle,
+        )
+
+    @classmethod
+    def from_masks(
+        cls,
+        white: int,
+        black: int,
+        wall: int,
+        ball_position: BallPosition,
+        white_used_cards: int = 0,
+        black_used_cards: int = 0,
+        position_hash: int | None = None,
+    ) -> Board:
+        board = cls.__new__(cls)
+        board._white = white
+        board._black = black
+        board._wall = wall
+        board._ball_position = ball_position
+        board._white_used_cards = white_used_cards
+        board._black_used_cards = black_used_cards
+        board._hash = (
+            position_hash
+            if position_hash is not None
+            else Zobrist.hash_board(
+                white=white,
+                black=black,
+                wall=wall,
+                ball_position=ball_position,
+                white_used_cards=white_used_cards,
+                black_used_cards=black_used_cards,
+            )
+        )
+        board._undo_stack = []
+        board._moves_cache = {}
+        return board
+
+    @classmethod
+    def wrap(
+        cls,
+        board: Board | BoardType,
+    ) -> Board:
+        """
+        Accept either a board or a raw grid, ball position of a raw grid is irrelevant (middle).
+        """
+        if isinstance(board, Board):
+            return board
         return Board(
-            board=cls._init_board(),
+            board=board,
             ball_position=BallPosition.middle,
         )
 
@@ -27,29 +121,200 @@ class Board:
         board: BoardType,
         ball_position: BallPosition,
     ):
-        self._board = board
+        self._white, self._black, self._wall = BitboardUtils.from_board_type(
+            board=board,
+        )
         self._ball_position = ball_position
+        self._white_used_cards = 0
+        self._black_used_cards = 0
+        self._hash = Zobrist.hash_board(
+            white=self._white,
+            black=self._black,
+            wall=self._wall,
+            ball_position=ball_position,
+        )
+        self._undo_stack: list[MoveUndo] = []
+        self._moves_cache: dict[tuple, list[Move]] = {}
 
     def __getitem__(self, item: int) -> list[str]:
-        return self._board[item]
+        return [
+            self.get_tile(
+                col_i=col_i,
+                row_i=item,
+            )
+            for col_i in range(5)
+        ]
 
     def clone(self) -> Board:
-        return Board(
-            board=self.copy_board(),
+        if Instrumentation.counters is not None:
+            Instrumentation.counters.count(
+                category=InstrumentationCategory.board_copies,
+                key="clone",
+            )
+        return Board.from_masks(
+            white=self._white,
+            black=self._black,
+            wall=self._wall,
             ball_position=self._ball_position,
+            white_used_cards=self._white_used_cards,
+            black_used_cards=self._black_used_cards,
+            position_hash=self._hash,
         )
 
     def copy_board(self) -> BoardType:
-        return copy.deepcopy(self._board)
+        if Instrumentation.counters is not None:
+            Instrumentation.counters.count(
+                category=InstrumentationCategory.board_copies,
+                key="copy_board",
+            )
+        return BitboardUtils.to_board_type(
+            white=self._white,
+            black=self._black,
+            wall=self._wall,
+        )
 
     @property
     def ball_position(self) -> BallPosition:
         return self._ball_position
 
+    @property
+    def position_hash(self) -> int:
+        return self._hash
+
+    @property
+    def white_mask(self) -> int:
+        return self._white
+
+    @property
+    def black_mask(self) -> int:
+        return self._black
+
+    @property
+    def wall_mask(self) -> int:
+        return self._wall
+
+    @property
+    def occupied_mask(self) -> int:
+        return self._white | self._black | self._wall
+
+    @property
+    def vacant_mask(self) -> int:
+        return BitboardUtils.FULL_MASK & ~(self._white | self._black | self._wall)
+
+    def used_cards_mask(
+        self,
+        player_sign: PlayerSign,
+    ) -> int:
+        """
+        Bit i is set if the player's card i was used.
+        """
+        return (
+            self._white_used_cards
+            if player_sign == PlayerSign.white
+            else self._black_used_cards
+        )
+
+    def num_used_cards(
+        self,
+        player_sign: PlayerSign,
+    ) -> int:
+        return self.used_cards_mask(
+            player_sign=player_sign,
+        ).bit_count()
+
+    def pawns_mask(
+        self,
+        player_sign: PlayerSign,
+    ) -> int:
+        return (
+            self._white
+            if player_sign == PlayerSign.white
+            else self._black
+        )
+
+    def get_tile(
+        self,
+        col_i: int,
+        row_i: int,
+    ) -> TileType:
+        return BitboardUtils.square_to_tile_type(
+            square=col_i * 5 + row_i,
+            white=self._white,
+            black=self._black,
+            wall=self._wall,
+        )
+
+    def is_vacant(
+        self,
+        col_i: int,
+        row_i: int,
+    ) -> bool:
+        return not (self._white | self._black | self._wall) >> (col_i * 5 + row_i) & 1
+
+    def is_player_pawn(
+        self,
+        player_sign: PlayerSign,
+        col_i: int,
+        row_i: int,
+    ) -> bool:
+        return bool(
+            self.pawns_mask(
+                player_sign=player_sign,
+            ) >> (col_i * 5 + row_i) & 1
+        )
+
+    def is_pawn(
+        self,
+        col_i: int,
+        row_i: int,
+    ) -> bool:
+        return bool((self._white | self._black) >> (col_i * 5 + row_i) & 1)
+
+    def set_tile(
+        self,
+        tile_type: TileType,
+        col_i: int,
+        row_i: int,
+    ):
+        """
+        Notice: change the board in-place.
+        """
+        bit = 1 << (col_i * 5 + row_i)
+        white = self._white & ~bit
+        black = self._black & ~bit
+        wall = self._wall & ~bit
+        match tile_type:
+            case TileType.white:
+                white |= bit
+            case TileType.black:
+                black |= bit
+            case TileType.wall:
+                wall |= bit
+        self._hash ^= Zobrist.masks_delta(
+            white_delta=white ^ self._white,
+            black_delta=black ^ self._black,
+            wall_delta=wall ^ self._wall,
+        )
+        self._white, self._black, self._wall = white, black, wall
+        self._moves_cache = {}
+
+    def get_cached_moves(
+        self,
+        key: tuple,
+    ) -> list[Move] | None:
+        return self._moves_cache.get(key)
+
+    def set_cached_moves(
+        self,
+        key: tuple,
+        moves: list[Move],
+    ):
+        self._moves_cache[key] = moves
+
     def display(self):
         print()
         for row_i in range(4, -1, -1):
-            print(' '.join([str(row_i + 1)] + self._board[row_i]))
+            print(' '.join([str(row_i + 1)] + self[row_i]))
         print("  A B C D E")
         print()
         print(f"Ball position: {self._ball_position}")
@@ -59,15 +324,89 @@ class Board:
         self,
         move: Move,
     ):
-        # TODO: consider adding the cards to the board, as they're part of the full state
-        # TODO: then they could be set as "used" in this function
-        self._board = move.result_board
-        self._ball_position = move.result_ball_position
+        white, black, wall = move.result_masks
+        ball_position = move.result_ball_position
+        self._hash ^= Zobrist.masks_delta(
+            white_delta=white ^ self._white,
+            black_delta=black ^ self._black,
+            wall_delta=wall ^ self._wall,
+        ) ^ Zobrist.ball_delta(
+            old_ball_position=self._ball_position,
+            new_ball_position=ball_position,
+        ) ^ Zobrist.card_used_delta(
+            player_sign=move.player_sign,
+            card_index=move.used_card_index,
+        )
+        self._white, self._black, self._wall = white, black, wall
+        self._ball_position = ball_position
+        if move.used_card_index is not None:
+            if move.player_sign == PlayerSign.white:
+                self._white_used_cards |= 1 << move.used_card_index
+            else:
+                self._black_used_cards |= 1 << move.used_card_index
+        self._moves_cache = {}
 
-    @classmethod
-    def _init_board(cls) -> BoardType:
-        board = [[TileType.vacant for _ in range(5)] for _ in range(5)]
-        board[0] = [TileType.white for _ in range(5)]  # White pawns
-        board[4] = [TileType.black for _ in range(5)]  # Black pawns
-        return board
+    def next_board(
+        self,
+        move: Move,
+    ) -> Board:
+        """
+        Return a new board of the position after the move, keep this board as is.
+        """
+        white, black, wall = move.result_masks
+        used_card = 0 if move.used_card_index is None else 1 << move.used_card_index
+        return Board.from_masks(
+            white=white,
+            black=black,
+            wall=wall,
+            ball_position=move.result_ball_position,
+            white_used_cards=self._white_used_cards | (used_card if move.player_sign == PlayerSign.white else 0),
+            black_used_cards=self._black_used_cards | (used_card if move.player_sign == PlayerSign.black else 0),
+            position_hash=move.result_hash,
+        )
+
+    def make_move(
+        self,
+        move: Move,
+        cards: list[Card] | None = None,
+    ) -> MoveUndo:
+        """
+        Play the move in-place and push an undo record, revert with unmake_move.
+        If the player cards are given, the move's card is also set as already used (and restored on unmake).
+        """
+        used_card = (
+            cards[move.used_card_index]
+            if cards is not None and move.used_card_index is not None
+            else None
+        )
+        undo = MoveUndo(
+            white=self._white,
+            black=self._black,
+            wall=self._wall,
+            ball_position=self._ball_position,
+            white_used_cards=self._white_used_cards,
+            black_used_cards=self._black_used_cards,
+            position_hash=self._hash,
+            used_card=used_card,
+        )
+        self._undo_stack.append(undo)
+        self.play_move(
+            move=move,
+        )
+        if used_card is not None:
+            used_card.use_card()
+        return undo
 
+    def unmake_move(self) -> MoveUndo:
+        undo = self._undo_stack.pop()
+        self._white = undo.white
+        self._black = undo.black
+        self._wall = undo.wall
+        self._ball_position = undo.ball_position
+        self._white_used_cards = undo.white_used_cards
+        self._black_used_cards = undo.black_used_cards
+        self._hash = undo.position_hash
+        self._moves_cache = {}
+        if undo.used_card is not None:
+            undo.used_card.restore_card()
+        return undo
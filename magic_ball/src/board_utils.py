@@ -1,3 +1,6 @@
+from bitboard_utils import BitboardUtils
+from board import Board
+from geometry import Geometry
 from models import PlayerSign, TileType, BoardType
 
 
@@ -18,23 +21,22 @@ class BoardUtils:
     def is_player_win(
         cls,
         player_sign: PlayerSign,
-        board: BoardType,
+        board: Board | BoardType,
     ) -> bool:
-        if player_sign == PlayerSign.white:
-            return any(
-                board[4][col_i] == TileType.white
-                for col_i in range(5)
-            )
-        return any(
-            board[0][col_i] == TileType.black
-            for col_i in range(5)
+        board = Board.wrap(board)
+        return BitboardUtils.is_player_win(
+            player_sign=player_sign,
+            pawns=board.pawns_mask(
+                player_sign=player_sign,
+            ),
         )
 
     @classmethod
     def is_any_player_win(
         cls,
-        board: BoardType,
+        board: Board | BoardType,
     ) -> bool:
+        board = Board.wrap(board)
         return cls.is_player_win(
             player_sign=PlayerSign.white,
             board=board,
@@ -47,16 +49,15 @@ class BoardUtils:
     def is_player_single_push_to_win(
         cls,
         player_sign: PlayerSign,
-        board: BoardType,
+        board: Board | BoardType,
     ) -> bool:
-        if player_sign == PlayerSign.white:
-            return any(
-                board[3][col_i] == TileType.white and board[4][col_i] == TileType.vacant
-                for col_i in range(5)
-            )
-        return any(
-            board[1][col_i] == TileType.black and board[0][col_i] == TileType.vacant
-            for col_i in range(5)
+        board = Board.wrap(board)
+        return BitboardUtils.is_player_single_push_to_win(
+            player_sign=player_sign,
+            pawns=board.pawns_mask(
+                player_sign=player_sign,
+            ),
+            vacant=board.vacant_mask,
         )
 
     @classmethod
@@ -116,36 +117,16 @@ class BoardUtils:
         cls,
         col_i: int,
         row_i: int,
-    ) -> list[tuple[int, int]]:
-        all_neighbor_tiles_indices = [
-            (col_i, row_i + 1),
-            (col_i, row_i - 1),
-            (col_i + 1, row_i),
-            (col_i - 1, row_i),
-        ]
-        return [
-            (col_i, row_i)
-            for col_i, row_i in all_neighbor_tiles_indices
-            if 0 <= col_i <= 4 and 0 <= row_i <= 4
-        ]
+    ) -> tuple[tuple[int, int], ...]:
+        return Geometry.NEIGHBORS[col_i * 5 + row_i]
 
     @classmethod
     def get_diagonal_neighbor_tiles_indices(
         cls,
         col_i: int,
         row_i: int,
-    ) -> list[tuple[int, int]]:
-        all_neighbor_tiles_indices = [
-            (col_i + 1, row_i + 1),
-            (col_i + 1, row_i - 1),
-            (col_i - 1, row_i - 1),
-            (col_i - 1, row_i + 1),
-        ]
-        return [
-            (col_i, row_i)
-            for col_i, row_i in all_neighbor_tiles_indices
-            if 0 <= col_i <= 4 and 0 <= row_i <= 4
-        ]
+    ) -> tuple[tuple[int, int], ...]:
+        return Geometry.DIAGONAL_NEIGHBORS[col_i * 5 + row_i]
 
     @classmethod
     def describe_pawn_move(
@@ -1,8 +1,8 @@
 from board import Board
 from cards.card import Card
-from cards.card_utils import CardUtils
+from geometry import Geometry
 from helper import Helper
-from models import PlayerSign, TileType
+from models import PlayerSign, MoveKind
 from move import CardMove
 
 
@@ -23,7 +23,7 @@ class Bishop(Card):
             player_sign=player_sign,
             board=board,
         )
-        direction_offsets = [
+        directions = [
             (1, 1),
             (1, -1),
             (-1, 1),
@@ -31,30 +31,23 @@ class Bishop(Card):
         ]
         move_indices: list[tuple[int, int, int, int]] = []
         for source_col_i, source_row_i in pawn_indices:
-            for col_i_offset, row_i_offset in direction_offsets:
-                target_col_i = source_col_i
-                target_row_i = source_row_i
-                while True:
-                    target_col_i += col_i_offset
-                    target_row_i += row_i_offset
-                    if (
-                        not 0 <= target_col_i <= 4
-                        or not 0 <= target_row_i <= 4
-                        or board[target_row_i][target_col_i] != TileType.vacant
-                    ):
+            rays = Geometry.RAYS[source_col_i * 5 + source_row_i]
+            for direction in directions:
+                for target_col_i, target_row_i in rays[direction]:
+                    if not board.is_vacant(col_i=target_col_i, row_i=target_row_i):
                         break
                     move_indices.append((source_col_i, source_row_i, target_col_i, target_row_i))
 
         return [
-            CardUtils.pawn_move(
+            cls._card_move(
                 player_sign=player_sign,
+                kind=MoveKind.move_tile,
+                board=board,
+                card_index=card_index,
                 source_col_i=source_col_i,
                 source_row_i=source_row_i,
                 target_col_i=target_col_i,
                 target_row_i=target_row_i,
-                board=board,
-                card_name=str(cls.name),
-                card_index=card_index,
             )
             for source_col_i, source_row_i, target_col_i, target_row_i in move_indices
         ]
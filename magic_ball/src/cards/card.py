@@ -1,8 +1,11 @@
+import time
 from abc import abstractmethod
 
+from bitboard_utils import BitboardUtils
 from board import Board
 from board_utils import BoardUtils
-from models import PlayerSign, BallPosition
+from instrumentation import Instrumentation
+from models import PlayerSign, BallPosition, MoveKind, InstrumentationCategory
 from move import Move, CardMove
 
 
@@ -31,33 +34,121 @@ class Card:
         assert not self._already_used
         self._already_used = True
 
+    def restore_card(self):
+        assert self._already_used
+        self._already_used = False
+
     def get_available_card_moves(
         self,
         player_sign: PlayerSign,
         board: Board,
         card_index: int,
     ) -> list[CardMove]:
-        if self._already_used or not self._ball_position_allowed(
+        counters = Instrumentation.counters
+        if counters is None:
+            return self._generate_card_moves(
+                player_sign=player_sign,
+                board=board,
+                card_index=card_index,
+            )
+        start_time = time.perf_counter()
+        available_moves = self._generate_card_moves(
+            player_sign=player_sign,
+            board=board,
+            card_index=card_index,
+        )
+        counters.add_time(
+            category=InstrumentationCategory.movegen,
+            key=self.name,
+            runtime_sec=time.perf_counter() - start_time,
+        )
+        return available_moves
+
+    def _generate_card_moves(
+        self,
+        player_sign: PlayerSign,
+        board: Board,
+        card_index: int,
+    ) -> list[CardMove]:
+        if not self._ball_position_allowed(
             player_sign=player_sign,
             ball_position=board.ball_position,
         ):
             return []
+        # Moves are materialized lazily from the board they were generated from, keep it unchanged.
         available_moves = self._get_available_moves(
             player_sign=player_sign,
-            board=board,
+            board=board.clone(),
             card_index=card_index,
         )
-        available_moves = self._filter_duplicate_description_moves(
+        available_moves = self._filter_duplicate_moves(
             moves=available_moves,
         )
         return [
             move
             for move in available_moves
-            if not BoardUtils.is_any_player_win(
-                board=move.result_board,
+            if not self._is_any_player_win(
+                move=move,
             )
         ]
 
+    @classmethod
+    def result_ball_position(
+        cls,
+        player_sign: PlayerSign,
+        ball_position: BallPosition,
+    ) -> BallPosition:
+        match player_sign, ball_position:
+            case PlayerSign.white, BallPosition.middle:
+                return BallPosition.black
+            case PlayerSign.white, BallPosition.white:
+                return BallPosition.middle
+            case PlayerSign.black, BallPosition.middle:
+                return BallPosition.white
+            case PlayerSign.black, BallPosition.black:
+                return BallPosition.middle
+        raise RuntimeError(f"Cannot push ball. Player: {player_sign}, ball position: {ball_position}")
+
+    @classmethod
+    def describe_move(
+        cls,
+        move: Move,
+    ) -> str:
+        source_col_i, source_row_i = BitboardUtils.square_to_indices(square=move.source_square)
+        target_col_i, target_row_i = BitboardUtils.square_to_indices(square=move.target_square)
+        match move.kind:
+            case MoveKind.move_tile | MoveKind.tank:
+                return cls._describe_pawn_move(
+                    source_col_i=source_col_i,
+                    source_row_i=source_row_i,
+                    target_col_i=target_col_i,
+                    target_row_i=target_row_i,
+                )
+            case MoveKind.eliminate_pair:
+                return BoardUtils.describe_pawns_elimination_move(
+                    card_name=str(cls.name),
+                    player_pawn_col_i=source_col_i,
+                    player_pawn_row_i=source_row_i,
+                    opponent_pawn_col_i=target_col_i,
+                    opponent_pawn_row_i=target_row_i,
+                )
+        return f"{cls.name}: {BoardUtils.indices_to_tile(col_i=target_col_i, row_i=target_row_i)}"
+
+    @classmethod
+    def tile_markers(
+        cls,
+        move: Move,
+    ) -> tuple[str | None, str | None]:
+        match move.kind:
+            case MoveKind.move_tile | MoveKind.tank | MoveKind.eliminate_pair:
+                return (
+                    BitboardUtils.square_to_tile(square=move.source_square),
+                    BitboardUtils.square_to_tile(square=move.target_square),
+                )
+            case MoveKind.eliminate | MoveKind.spawn | MoveKind.wall:
+                return BitboardUtils.square_to_tile(square=move.target_square), None
+        return None, None
+
     @classmethod
     @abstractmethod
     def _get_available_moves(
@@ -69,18 +160,56 @@ class Card:
         pass
 
     @classmethod
-    def _filter_duplicate_description_moves(
+    def _card_move(
+        cls,
+        player_sign: PlayerSign,
+        kind: MoveKind,
+        board: Board,
+        card_index: int,
+        target_col_i: int,
+        target_row_i: int,
+        source_col_i: int = 0,
+        source_row_i: int = 0,
+    ) -> CardMove:
+        return CardMove(
+            player_sign=player_sign,
+            code=Move.encode(
+                kind=kind,
+                source_square=source_col_i * 5 + source_row_i,
+                target_square=target_col_i * 5 + target_row_i,
+                card_index=card_index,
+            ),
+            source_board=board,
+            card=cls,
+        )
+
+    @classmethod
+    def _filter_duplicate_moves(
         cls,
         moves: list[CardMove],
     ) -> list[CardMove]:
-        move_descriptions = set()
-        non_duplicate_description_moves = []
+        move_codes = set()
+        non_duplicate_moves = []
         for move in moves:
-            if move.description in move_descriptions:
+            if move.code in move_codes:
                 continue
-            move_descriptions.add(move.description)
-            non_duplicate_description_moves.append(move)
-        return non_duplicate_description_moves
+            move_codes.add(move.code)
+            non_duplicate_moves.append(move)
+        return non_duplicate_moves
+
+    @classmethod
+    def _is_any_player_win(
+        cls,
+        move: Move,
+    ) -> bool:
+        white, black, _ = move.result_masks
+        return BitboardUtils.is_player_win(
+            player_sign=PlayerSign.white,
+            pawns=white,
+        ) or BitboardUtils.is_player_win(
+            player_sign=PlayerSign.black,
+            pawns=black,
+        )
 
     @classmethod
     def _ball_position_allowed(
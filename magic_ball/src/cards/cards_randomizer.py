@@ -15,76 +15,98 @@ class CardsRandomizer:
         num_black_cards: int = DEFAULT_NUM_CARDS_PER_PLAYER,
         cards_pull: list[str] | None = None,
     ) -> tuple[list[Card], list[Card]]:
+        """
+        New card instances, only for the drawn cards.
+        """
+        white_card_ids, black_card_ids = cls.draw_card_ids(
+            white_card_names=white_card_names,
+            black_card_names=black_card_names,
+            num_white_cards=num_white_cards,
+            num_black_cards=num_black_cards,
+            cards_pull=cards_pull,
+        )
+        return Compendium.new_cards(card_ids=white_card_ids), Compendium.new_cards(card_ids=black_card_ids)
+
+    @classmethod
+    def draw_card_ids(
+        cls,
+        white_card_names: list[str] | None = None,
+        black_card_names: list[str] | None = None,
+        num_white_cards: int = DEFAULT_NUM_CARDS_PER_PLAYER,
+        num_black_cards: int = DEFAULT_NUM_CARDS_PER_PLAYER,
+        cards_pull: list[str] | None = None,
+    ) -> tuple[list[int], list[int]]:
+        """
+        Draw as draw_cards, but card ids (see Compendium), without building any card.
+        """
         if not cards_pull and cards_pull is not None:
             return [], []
 
-        all_cards = Compendium.get_cards()
-        if cards_pull is None:
-            cards_pull = all_cards
-        else:
-            cards_pull = cls._get_cards(
+        card_ids_pull = (
+            list(range(len(Compendium.CARD_CLASSES)))
+            if cards_pull is None
+            else Compendium.card_ids(
                 card_names=cards_pull,
-                cards_pull=all_cards,
-                total_num_cards=len(cards_pull),
             )
+        )
         if not white_card_names and not black_card_names:
-            white_cards = cls._randomize_from_pull(
-                cards_pull=cards_pull,
+            white_card_ids = cls._randomize_from_pull(
+                cards_pull=card_ids_pull,
                 num_cards=num_white_cards,
                 ignore_cards=[],
             )
-            black_cards = cls._randomize_from_pull(
-                cards_pull=cards_pull,
+            black_card_ids = cls._randomize_from_pull(
+                cards_pull=card_ids_pull,
                 num_cards=num_black_cards,
-                ignore_cards=white_cards,
+                ignore_cards=white_card_ids,
             )
         elif white_card_names and not black_card_names:
-            white_cards = cls._get_cards(
+            white_card_ids = cls._get_cards(
                 card_names=white_card_names,
-                cards_pull=cards_pull,
+                cards_pull=card_ids_pull,
                 total_num_cards=num_white_cards,
             )
-            black_cards = cls._randomize_from_pull(
-                cards_pull=cards_pull,
+            black_card_ids = cls._randomize_from_pull(
+                cards_pull=card_ids_pull,
                 num_cards=num_black_cards,
-                ignore_cards=white_cards,
+                ignore_cards=white_card_ids,
             )
         elif not white_card_names and black_card_names:
-            black_cards = cls._get_cards(
+            black_card_ids = cls._get_cards(
                 card_names=black_card_names,
-                cards_pull=cards_pull,
+                cards_pull=card_ids_pull,
                 total_num_cards=num_black_cards,
             )
-            white_cards = cls._randomize_from_pull(
-                cards_pull=cards_pull,
+            white_card_ids = cls._randomize_from_pull(
+                cards_pull=card_ids_pull,
                 num_cards=num_white_cards,
-                ignore_cards=black_cards,
+                ignore_cards=black_card_ids,
             )
         else:
-            white_cards = cls._get_cards(
+            white_card_ids = cls._get_cards(
                 card_names=white_card_names,
-                cards_pull=cards_pull,
+                cards_pull=card_ids_pull,
                 total_num_cards=num_white_cards,
             )
-            black_cards = cls._get_cards(
+            black_card_ids = cls._get_cards(
                 card_names=black_card_names,
-                cards_pull=cards_pull,
+                cards_pull=card_ids_pull,
                 total_num_cards=num_black_cards,
-                ignore_cards=white_cards,
+                ignore_cards=white_card_ids,
             )
-        return white_cards, black_cards
+        return white_card_ids, black_card_ids
 
     @classmethod
     def _randomize_from_pull(
         cls,
-        cards_pull: list[Card],
+        cards_pull: list[int],
         num_cards: int,
-        ignore_cards: list[Card],
-    ) -> list[Card]:
+        ignore_cards: list[int],
+    ) -> list[int]:
         all_valid_cards = [
-            card
-            for card in cards_pull
-            if card not in ignore_cards
+            card_id
+            for card_id in cards_pull
+            if card_id not in ignore_cards
         ]
         assert len(all_valid_cards) >= num_cards, "Cannot randomize enough cards"
         random.shuffle(all_valid_cards)
@@ -94,17 +116,17 @@ class CardsRandomizer:
     def _get_cards(
         cls,
         card_names: list[str],
-        cards_pull: list[Card],
+        cards_pull: list[int],
         total_num_cards: int,
-        ignore_cards: list[Card] = [],
-    ) -> list[Card]:
+        ignore_cards: list[int] = [],
+    ) -> list[int]:
         assert total_num_cards >= len(card_names), "Total num cards is larger than input card names list"
-        name_to_card = {
-            card.name: card
-            for card in cards_pull
+        name_to_card_id = {
+            Compendium.CARD_NAMES[card_id]: card_id
+            for card_id in cards_pull
         }
         cards = [
-            name_to_card[card_name]
+            name_to_card_id[card_name]
             for card_name in card_names
         ]
         if total_num_cards == len(card_names):
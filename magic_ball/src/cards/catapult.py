@@ -1,9 +1,8 @@
 from board import Board
 from board_utils import BoardUtils
 from cards.card import Card
-from cards.card_utils import CardUtils
 from helper import Helper
-from models import PlayerSign, TileType
+from models import PlayerSign, MoveKind
 from move import Move, CardMove
 
 
@@ -34,35 +33,19 @@ class Catapult(Card):
         move_indices = [
             (col_i, source_row_i, opponent_start_row_i)
             for col_i, source_row_i in opponent_pawn_indices
-            if board[opponent_start_row_i][col_i] == TileType.vacant
+            if board.is_vacant(col_i=col_i, row_i=opponent_start_row_i)
         ]
 
         return [
-            CardMove(
+            cls._card_move(
                 player_sign=player_sign,
-                result_board=Helper.move_pawn(
-                    player_sign=BoardUtils.inverse_player_sign(
-                        player_sign=player_sign,
-                    ),
-                    source_col_i=col_i,
-                    source_row_i=source_row_i,
-                    target_col_i=col_i,
-                    target_row_i=target_row_i,
-                    board=board.copy_board(),
-                ),
-                result_ball_position=CardUtils.push_ball(
-                    player_sign=player_sign,
-                    ball_position=board.ball_position,
-                ),
-                description=cls._describe_pawn_move(
-                    source_col_i=col_i,
-                    source_row_i=source_row_i,
-                    target_col_i=col_i,
-                    target_row_i=target_row_i,
-                ),
-                used_card_index=card_index,
-                tile_marker_1=BoardUtils.indices_to_tile(col_i=col_i, row_i=source_row_i),
-                tile_marker_2=BoardUtils.indices_to_tile(col_i=col_i, row_i=target_row_i),
+                kind=MoveKind.move_tile,
+                board=board,
+                card_index=card_index,
+                source_col_i=col_i,
+                source_row_i=source_row_i,
+                target_col_i=col_i,
+                target_row_i=target_row_i,
             )
             for col_i, source_row_i, target_row_i in move_indices
         ]
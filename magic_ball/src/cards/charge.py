@@ -1,9 +1,7 @@
 from board import Board
-from board_utils import BoardUtils
 from cards.card import Card
-from cards.card_utils import CardUtils
 from helper import Helper
-from models import PlayerSign, TileType
+from models import PlayerSign, MoveKind
 from move import Move, CardMove
 
 
@@ -36,24 +34,24 @@ class Charge(Card):
         move_indices: list[tuple[int, int, int]] = []
         for col_i, source_row_i in pawn_indices:
             target_row_i = source_row_i + direction
-            if board[target_row_i][col_i] != TileType.vacant:
+            if not board.is_vacant(col_i=col_i, row_i=target_row_i):
                 continue
             while True:
                 target_row_i += direction
-                if target_row_i <= 0 or target_row_i >= 4 or board[target_row_i][col_i] != TileType.vacant:
+                if target_row_i <= 0 or target_row_i >= 4 or not board.is_vacant(col_i=col_i, row_i=target_row_i):
                     break
                 move_indices.append((col_i, source_row_i, target_row_i))
 
         return [
-            CardUtils.pawn_move(
+            cls._card_move(
                 player_sign=player_sign,
+                kind=MoveKind.move_tile,
+                board=board,
+                card_index=card_index,
                 source_col_i=col_i,
                 source_row_i=source_row_i,
                 target_col_i=col_i,
                 target_row_i=target_row_i,
-                board=board,
-                card_name=str(cls.name),
-                card_index=card_index,
             )
             for col_i, source_row_i, target_row_i in move_indices
         ]
@@ -1,4 +1,5 @@
 import math
+from typing import Iterable
 
 from cards.bishop import Bishop
 from cards.card import Card
@@ -20,31 +21,65 @@ from constants import DEFAULT_NUM_CARDS_PER_PLAYER
 
 
 class Compendium:
+    """
+    Registry of the card classes, built once at import. A card id is the card's index in CARD_CLASSES.
+    Card instances (which keep per-game state) are built only on demand, see new_cards.
+    """
+
+    CARD_CLASSES: list[type[Card]] = [
+        Wall,
+        Knife,
+        Charge,
+        Bishop,
+        Catapult,
+        Fire,
+        SideStep,
+        Jump,
+        Tank,
+        Kamikaze,
+        Spawn,
+        Dagger,
+        Peace,
+        Knight,
+        Forklift,
+    ]
+    CARD_NAMES: list[str] = [
+        card_class.name
+        for card_class in CARD_CLASSES
+    ]
+    NAME_TO_CARD_ID: dict[str, int] = {
+        card_name: card_id
+        for card_id, card_name in enumerate(CARD_NAMES)
+    }
+
     @classmethod
     def get_cards(cls) -> list[Card]:
+        return cls.new_cards(
+            card_ids=range(len(cls.CARD_CLASSES)),
+        )
+
+    @classmethod
+    def get_cards_names(cls) -> list[str]:
+        return list(cls.CARD_NAMES)
+
+    @classmethod
+    def card_ids(
+        cls,
+        card_names: list[str],
+    ) -> list[int]:
         return [
-            Wall(),
-            Knife(),
-            Charge(),
-            Bishop(),
-            Catapult(),
-            Fire(),
-            SideStep(),
-            Jump(),
-            Tank(),
-            Kamikaze(),
-            Spawn(),
-            Dagger(),
-            Peace(),
-            Knight(),
-            Forklift(),
+            cls.NAME_TO_CARD_ID[card_name]
+            for card_name in card_names
         ]
 
     @classmethod
-    def get_cards_names(cls) -> list[str]:
+    def new_cards(
+        cls,
+        card_ids: Iterable[int],
+    ) -> list[Card]:
         return [
-            card.name
-            for card in cls.get_cards()
+            cls.CARD_CLASSES[card_id]()
+            for card_id in card_ids
         ]
 
     @classmethod
@@ -54,5 +89,5 @@ class Compendium:
         num_cards_in_pull: int | None = None,
     ) -> int:
         if num_cards_in_pull is None:
-            num_cards_in_pull = len(cls.get_cards())
+            num_cards_in_pull = len(cls.CARD_CLASSES)
         return math.comb(num_cards_in_pull, num_cards)
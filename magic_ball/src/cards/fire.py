@@ -1,8 +1,7 @@
+from bitboard_utils import BitboardUtils
 from board import Board
 from cards.card import Card
-from cards.card_utils import CardUtils
-from helper import Helper
-from models import PlayerSign, TileType
+from models import PlayerSign, MoveKind
 from move import Move, CardMove
 
 
@@ -38,6 +37,14 @@ class Fire(Card):
             )
         ]
 
+    @classmethod
+    def describe_move(
+        cls,
+        move: Move,
+    ) -> str:
+        _, row_i = BitboardUtils.square_to_indices(square=move.target_square)
+        return f"{cls.name} in row: {row_i + 1}"
+
     @classmethod
     def _fire_row_to_move(
         cls,
@@ -46,24 +53,14 @@ class Fire(Card):
         board: Board,
         card_index: int,
     ) -> CardMove:
-        result_board = board.copy_board()
-        for col_i in range(5):
-            result_board = Helper.eliminate_pawn(
-                col_i=col_i,
-                row_i=row_i,
-                board=result_board,
-                safe=True,  # Don't break if the tile is vacant
-            )
-        return CardMove(
+        # TODO: tile markers
+        return cls._card_move(
             player_sign=player_sign,
-            result_board=result_board,
-            result_ball_position=CardUtils.push_ball(
-                player_sign=player_sign,
-                ball_position=board.ball_position,
-            ),
-            description=f"{cls.name} in row: {row_i + 1}",
-            used_card_index=card_index,
-            # TODO!
+            kind=MoveKind.fire,
+            board=board,
+            card_index=card_index,
+            target_col_i=0,
+            target_row_i=row_i,
         )
 
     @classmethod
@@ -72,7 +69,4 @@ class Fire(Card):
         row_i: int,
         board: Board,
     ) -> bool:
-        return all(
-            board[row_i][col_i] == TileType.vacant
-            for col_i in range(5)
-        )
+        return not board.occupied_mask & BitboardUtils.ROW_MASKS[row_i]
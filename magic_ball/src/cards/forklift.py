@@ -1,10 +1,9 @@
 from board import Board
-from board_utils import BoardUtils
 from cards.card import Card
-from cards.card_utils import CardUtils
+from geometry import Geometry
 from helper import Helper
-from models import PlayerSign, TileType
-from move import Move, CardMove
+from models import PlayerSign, MoveKind
+from move import CardMove
 
 
 class Forklift(Card):
@@ -24,59 +23,36 @@ class Forklift(Card):
             player_sign=player_sign,
             board=board,
         )
-        move_indices: list[tuple[int, int, int, int, PlayerSign]] = []
+        move_indices: list[tuple[int, int, int, int]] = []
         for col_i, row_i in pawn_indices:
-            all_neighbor_tiles_indices = BoardUtils.get_neighbor_tiles_indices(
-                col_i=col_i,
-                row_i=row_i,
-            ) + BoardUtils.get_diagonal_neighbor_tiles_indices(
-                col_i=col_i,
-                row_i=row_i,
-            )
+            all_neighbor_tiles_indices = Geometry.ADJACENT[col_i * 5 + row_i]
 
             source_indices = [
                 (source_col_i, source_row_i)
                 for source_col_i, source_row_i in all_neighbor_tiles_indices
-                if board[source_row_i][source_col_i] not in [TileType.vacant, TileType.wall]
+                if board.is_pawn(col_i=source_col_i, row_i=source_row_i)
             ]
             target_indices = [
                 (target_col_i, target_row_i)
                 for target_col_i, target_row_i in all_neighbor_tiles_indices
-                if board[target_row_i][target_col_i] == TileType.vacant
+                if board.is_vacant(col_i=target_col_i, row_i=target_row_i)
             ]
             move_indices += [
-                (
-                    source_col_i, source_row_i, target_col_i, target_row_i,
-                    BoardUtils.tile_to_player_sign(tile=board[source_row_i][source_col_i]),
-                )
+                (source_col_i, source_row_i, target_col_i, target_row_i)
                 for source_col_i, source_row_i in source_indices
                 for target_col_i, target_row_i in target_indices
             ]
 
         return [
-            CardMove(
+            cls._card_move(
                 player_sign=player_sign,
-                result_board=Helper.move_pawn(
-                    player_sign=source_pawn_player_sign,
-                    source_col_i=source_col_i,
-                    source_row_i=source_row_i,
-                    target_col_i=target_col_i,
-                    target_row_i=target_row_i,
-                    board=board.copy_board(),
-                ),
-                result_ball_position=CardUtils.push_ball(
-                    player_sign=player_sign,
-                    ball_position=board.ball_position,
-                ),
-                description=cls._describe_pawn_move(
-                    source_col_i=source_col_i,
-                    source_row_i=source_row_i,
-                    target_col_i=target_col_i,
-                    target_row_i=target_row_i,
-                ),
-                used_card_index=card_index,
-                tile_marker_1=BoardUtils.indices_to_tile(col_i=source_col_i, row_i=source_row_i),
-                tile_marker_2=BoardUtils.indices_to_tile(col_i=target_col_i, row_i=target_row_i),
+                kind=MoveKind.move_tile,
+                board=board,
+                card_index=card_index,
+                source_col_i=source_col_i,
+                source_row_i=source_row_i,
+                target_col_i=target_col_i,
+                target_row_i=target_row_i,
             )
-            for source_col_i, source_row_i, target_col_i, target_row_i, source_pawn_player_sign in move_indices
+            for source_col_i, source_row_i, target_col_i, target_row_i in move_indices
         ]
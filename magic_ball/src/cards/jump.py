@@ -1,9 +1,7 @@
 from board import Board
-from board_utils import BoardUtils
 from cards.card import Card
-from cards.card_utils import CardUtils
 from helper import Helper
-from models import PlayerSign, TileType
+from models import PlayerSign, MoveKind
 from move import Move, CardMove
 
 
@@ -33,19 +31,19 @@ class Jump(Card):
             (col_i, source_row_i, source_row_i + direction)
             for col_i, source_row_i in pawn_indices
             if 0 <= source_row_i + direction <= 4
-            and board[source_row_i + direction][col_i] == TileType.vacant
+            and board.is_vacant(col_i=col_i, row_i=source_row_i + direction)
         ]
 
         return [
-            CardUtils.pawn_move(
+            cls._card_move(
                 player_sign=player_sign,
+                kind=MoveKind.move_tile,
+                board=board,
+                card_index=card_index,
                 source_col_i=col_i,
                 source_row_i=source_row_i,
                 target_col_i=col_i,
                 target_row_i=target_row_i,
-                board=board,
-                card_name=str(cls.name),
-                card_index=card_index,
             )
             for col_i, source_row_i, target_row_i in move_indices
         ]
@@ -1,10 +1,10 @@
 from board import Board
 from board_utils import BoardUtils
 from cards.card import Card
-from cards.card_utils import CardUtils
+from geometry import Geometry
 from helper import Helper
-from models import PlayerSign, TileType
-from move import Move, CardMove
+from models import PlayerSign, MoveKind
+from move import CardMove
 
 
 class Kamikaze(Card):
@@ -24,72 +24,34 @@ class Kamikaze(Card):
             player_sign=player_sign,
             board=board,
         )
-        direction_offsets = [
-            (0, 1),
-            (1, 1),
-            (1, 0),
-            (1, -1),
-            (0, -1),
-            (-1, -1),
-            (-1, 0),
-            (-1, 1),
-        ]
+        opponent_player_sign = BoardUtils.inverse_player_sign(
+            player_sign=player_sign,
+        )
         indices_pairs_to_eliminate: list[tuple[int, int, int, int]] = []
         for source_col_i, source_row_i in pawn_indices:
-            for col_i_offset, row_i_offset in direction_offsets:
-                target_col_i = source_col_i
-                target_row_i = source_row_i
-                while True:
-                    target_col_i += col_i_offset
-                    target_row_i += row_i_offset
-                    if (
-                        not 0 <= target_col_i <= 4
-                        or not 0 <= target_row_i <= 4
-                    ):
-                        break
-
-                    target_tile = board[target_row_i][target_col_i]
-                    if target_tile == TileType.vacant:
+            for ray in Geometry.RAYS[source_col_i * 5 + source_row_i].values():
+                for target_col_i, target_row_i in ray:
+                    if board.is_vacant(col_i=target_col_i, row_i=target_row_i):
                         continue
-                    elif target_tile == TileType.wall or BoardUtils.is_tile_player_pawn(
-                        player_sign=player_sign,
-                        tile=target_tile,
-                    ):
-                        break
-                    elif BoardUtils.is_tile_opponent_pawn(
-                        player_sign=player_sign,
-                        tile=target_tile,
+                    if board.is_player_pawn(
+                        player_sign=opponent_player_sign,
+                        col_i=target_col_i,
+                        row_i=target_row_i,
                     ):
                         indices_pairs_to_eliminate.append((source_col_i, source_row_i, target_col_i, target_row_i))
-                        break
-                    assert RuntimeError("Shouldn't reach here")
+                    # Wall, friendly or opponent pawn blocks the line-of-sight.
+                    break
 
         return [
-            CardMove(
+            cls._card_move(
                 player_sign=player_sign,
-                result_board=Helper.eliminate_pawn(
-                    col_i=player_pawn_col_i,
-                    row_i=player_pawn_row_i,
-                    board=Helper.eliminate_pawn(
-                        col_i=opponent_pawn_col_i,
-                        row_i=opponent_pawn_row_i,
-                        board=board.copy_board(),
-                    ),
-                ),
-                result_ball_position=CardUtils.push_ball(
-                    player_sign=player_sign,
-                    ball_position=board.ball_position,
-                ),
-                description=BoardUtils.describe_pawns_elimination_move(
-                    card_name=str(cls.name),
-                    player_pawn_col_i=player_pawn_col_i,
-                    player_pawn_row_i=player_pawn_row_i,
-                    opponent_pawn_col_i=opponent_pawn_col_i,
-                    opponent_pawn_row_i=opponent_pawn_row_i,
-                ),
-                used_card_index=card_index,
-                tile_marker_1=BoardUtils.indices_to_tile(col_i=player_pawn_col_i, row_i=player_pawn_row_i),
-                tile_marker_2=BoardUtils.indices_to_tile(col_i=opponent_pawn_col_i, row_i=opponent_pawn_row_i),
+                kind=MoveKind.eliminate_pair,
+                board=board,
+                card_index=card_index,
+                source_col_i=player_pawn_col_i,
+                source_row_i=player_pawn_row_i,
+                target_col_i=opponent_pawn_col_i,
+                target_row_i=opponent_pawn_row_i,
             )
             for player_pawn_col_i, player_pawn_row_i, opponent_pawn_col_i, opponent_pawn_row_i in indices_pairs_to_eliminate
         ]
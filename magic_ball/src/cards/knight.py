@@ -1,8 +1,8 @@
 from board import Board
 from cards.card import Card
-from cards.card_utils import CardUtils
+from geometry import Geometry
 from helper import Helper
-from models import PlayerSign, TileType
+from models import PlayerSign, MoveKind
 from move import Move, CardMove
 
 
@@ -23,35 +23,23 @@ class Knight(Card):
             player_sign=player_sign,
             board=board,
         )
-        direction_offsets = [
-            (1, 2),
-            (2, 1),
-            (2, -1),
-            (1, -2),
-            (-1, -2),
-            (-2, -1),
-            (-2, 1),
-            (-1, 2),
-        ]
         move_indices = [
-            (source_col_i, source_row_i, source_col_i + col_i_offset, source_row_i + row_i_offset)
+            (source_col_i, source_row_i, target_col_i, target_row_i)
             for source_col_i, source_row_i in pawn_indices
-            for col_i_offset, row_i_offset in direction_offsets
-            if 0 <= source_col_i + col_i_offset <= 4
-            and 0 <= source_row_i + row_i_offset <= 4
-            and board[source_row_i + row_i_offset][source_col_i + col_i_offset] == TileType.vacant
+            for target_col_i, target_row_i in Geometry.KNIGHT_TARGETS[source_col_i * 5 + source_row_i]
+            if board.is_vacant(col_i=target_col_i, row_i=target_row_i)
         ]
 
         return [
-            CardUtils.pawn_move(
+            cls._card_move(
                 player_sign=player_sign,
+                kind=MoveKind.move_tile,
+                board=board,
+                card_index=card_index,
                 source_col_i=source_col_i,
                 source_row_i=source_row_i,
                 target_col_i=target_col_i,
                 target_row_i=target_row_i,
-                board=board,
-                card_name=str(cls.name),
-                card_index=card_index,
             )
             for source_col_i, source_row_i, target_col_i, target_row_i in move_indices
         ]
@@ -1,10 +1,9 @@
 from board import Board
 from board_utils import BoardUtils
 from cards.card import Card
-from cards.card_utils import CardUtils
 from helper import Helper
-from models import PlayerSign
-from move import Move, CardMove
+from models import PlayerSign, MoveKind
+from move import CardMove
 
 
 class Peace(Card):
@@ -64,31 +63,15 @@ class Peace(Card):
         ]
 
         return [
-            CardMove(
+            cls._card_move(
                 player_sign=player_sign,
-                result_board=Helper.eliminate_pawn(
-                    col_i=player_pawn_col_i,
-                    row_i=player_pawn_row_i,
-                    board=Helper.eliminate_pawn(
-                        col_i=opponent_pawn_col_i,
-                        row_i=opponent_pawn_row_i,
-                        board=board.copy_board(),
-                    ),
-                ),
-                result_ball_position=CardUtils.push_ball(
-                    player_sign=player_sign,
-                    ball_position=board.ball_position,
-                ),
-                description=BoardUtils.describe_pawns_elimination_move(
-                    card_name=str(cls.name),
-                    player_pawn_col_i=player_pawn_col_i,
-                    player_pawn_row_i=player_pawn_row_i,
-                    opponent_pawn_col_i=opponent_pawn_col_i,
-                    opponent_pawn_row_i=opponent_pawn_row_i,
-                ),
-                used_card_index=card_index,
-                tile_marker_1=BoardUtils.indices_to_tile(col_i=player_pawn_col_i, row_i=player_pawn_row_i),
-                tile_marker_2=BoardUtils.indices_to_tile(col_i=opponent_pawn_col_i, row_i=opponent_pawn_row_i),
+                kind=MoveKind.eliminate_pair,
+                board=board,
+                card_index=card_index,
+                source_col_i=player_pawn_col_i,
+                source_row_i=player_pawn_row_i,
+                target_col_i=opponent_pawn_col_i,
+                target_row_i=opponent_pawn_row_i,
             )
             for player_pawn_col_i, player_pawn_row_i, opponent_pawn_col_i, opponent_pawn_row_i in indices_pairs_to_eliminate
         ]
@@ -1,7 +1,7 @@
 from board import Board
 from cards.card import Card
-from models import PlayerSign, BallPosition
-from move import Move
+from models import PlayerSign, BallPosition, MoveKind
+from move import Move, CardMove
 
 
 class Pull(Card):
@@ -33,7 +33,7 @@ class Pull(Card):
                 return True
 
     @classmethod
-    def _pull_ball(
+    def result_ball_position(
         cls,
         player_sign: PlayerSign,
         ball_position: BallPosition,
@@ -47,8 +47,14 @@ class Pull(Card):
                 return BallPosition.black
             case PlayerSign.black, BallPosition.white:
                 return BallPosition.middle
-        raise RuntimeError(f"Cannot push ball. Player: {player_sign}, ball position: {ball_position}")
+        raise RuntimeError(f"Cannot pull ball. Player: {player_sign}, ball position: {ball_position}")
 
+    @classmethod
+    def describe_move(
+        cls,
+        move: Move,
+    ) -> str:
+        return "pull ball"
 
     @classmethod
     def _get_available_moves(
@@ -56,16 +62,14 @@ class Pull(Card):
         player_sign: PlayerSign,
         board: Board,
         card_index: int,
-    ) -> list[Move]:
+    ) -> list[CardMove]:
         return [
-            Move(
+            cls._card_move(
                 player_sign=player_sign,
-                result_board=board.copy_board(),
-                result_ball_position=cls._pull_ball(
-                    player_sign=player_sign,
-                    ball_position=board.ball_position,
-                ),
-                description=f"pull ball",
-                used_card_index=card_index,
+                kind=MoveKind.pull,
+                board=board,
+                card_index=card_index,
+                target_col_i=0,
+                target_row_i=0,
             ),
         ]
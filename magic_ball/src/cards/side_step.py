@@ -1,9 +1,7 @@
 from board import Board
-from board_utils import BoardUtils
 from cards.card import Card
-from cards.card_utils import CardUtils
 from helper import Helper
-from models import PlayerSign, TileType
+from models import PlayerSign, MoveKind
 from move import Move, CardMove
 
 
@@ -30,20 +28,20 @@ class SideStep(Card):
                 target_col_i = source_col_i
                 while True:
                     target_col_i += direction
-                    if target_col_i == -1 or target_col_i == 5 or board[row_i][target_col_i] != TileType.vacant:
+                    if target_col_i == -1 or target_col_i == 5 or not board.is_vacant(col_i=target_col_i, row_i=row_i):
                         break
                     move_indices.append((source_col_i, target_col_i, row_i))
 
         return [
-            CardUtils.pawn_move(
+            cls._card_move(
                 player_sign=player_sign,
+                kind=MoveKind.move_tile,
+                board=board,
+                card_index=card_index,
                 source_col_i=source_col_i,
                 source_row_i=row_i,
                 target_col_i=target_col_i,
                 target_row_i=row_i,
-                board=board,
-                card_name=str(cls.name),
-                card_index=card_index,
             )
             for source_col_i, target_col_i, row_i in move_indices
         ]
@@ -1,10 +1,7 @@
 from board import Board
-from board_utils import BoardUtils
 from cards.card import Card
-from cards.card_utils import CardUtils
-from helper import Helper
-from models import PlayerSign, TileType
-from move import Move, CardMove
+from models import PlayerSign, MoveKind
+from move import CardMove
 
 
 class Spawn(Card):
@@ -29,24 +26,16 @@ class Spawn(Card):
             (col_i, row_i)
             for col_i in range(5)
             for row_i in allowed_rows
-            if board[row_i][col_i] == TileType.vacant
+            if board.is_vacant(col_i=col_i, row_i=row_i)
         ]
         return [
-            CardMove(
+            cls._card_move(
                 player_sign=player_sign,
-                result_board=Helper.set_pawn_tile(
-                    player_sign=player_sign,
-                    col_i=col_i,
-                    row_i=row_i,
-                    board=board.copy_board(),
-                ),
-                result_ball_position=CardUtils.push_ball(
-                    player_sign=player_sign,
-                    ball_position=board.ball_position,
-                ),
-                description=f"{cls.name}: {BoardUtils.indices_to_tile(col_i=col_i, row_i=row_i)}",
-                used_card_index=card_index,
-                tile_marker_1=BoardUtils.indices_to_tile(col_i=col_i, row_i=row_i),
+                kind=MoveKind.spawn,
+                board=board,
+                card_index=card_index,
+                target_col_i=col_i,
+                target_row_i=row_i,
             )
             for col_i, row_i in vacant_indices
         ]
@@ -1,9 +1,8 @@
 from board import Board
-from board_utils import BoardUtils
 from cards.card import Card
-from cards.card_utils import CardUtils
+from geometry import Geometry
 from helper import Helper
-from models import PlayerSign, TileType
+from models import PlayerSign, MoveKind
 from move import Move, CardMove
 
 
@@ -27,64 +26,23 @@ class Tank(Card):
         tank_move_indices = [
             (pawn_col_i, pawn_row_i, target_col_i, target_row_i, neighbor_target_col_i, neighbor_target_row_i)
             for pawn_col_i, pawn_row_i in pawn_indices
-            for target_col_i, target_row_i, neighbor_target_col_i, neighbor_target_row_i in cls._get_tank_target_move_indices(
-                pawn_col_i=pawn_col_i,
-                pawn_row_i=pawn_row_i,
-            )
-            if board[target_row_i][target_col_i] != TileType.vacant  # Must push some non-vacant tile
-            and board[neighbor_target_row_i][neighbor_target_col_i] == TileType.vacant  # Target tile must be vacant
+            for target_col_i, target_row_i, neighbor_target_col_i, neighbor_target_row_i in Geometry.TWO_STEPS[
+                pawn_col_i * 5 + pawn_row_i
+            ]
+            if not board.is_vacant(col_i=target_col_i, row_i=target_row_i)  # Must push some non-vacant tile
+            and board.is_vacant(col_i=neighbor_target_col_i, row_i=neighbor_target_row_i)  # Target tile must be vacant
         ]
         return [
-            CardMove(
+            cls._card_move(
                 player_sign=player_sign,
-                result_board=Helper.move_tile(
-                    source_col_i=source_col_i,
-                    source_row_i=source_row_i,
-                    target_col_i=target_col_i,
-                    target_row_i=target_row_i,
-                    board=Helper.move_tile(
-                        source_col_i=target_col_i,
-                        source_row_i=target_row_i,
-                        target_col_i=neighbor_target_col_1,
-                        target_row_i=neighbor_target_row_1,
-                        board=board.copy_board(),
-                    ),
-                ),
-                result_ball_position=CardUtils.push_ball(
-                    player_sign=player_sign,
-                    ball_position=board.ball_position,
-                ),
-                description=cls._describe_pawn_move(
-                    source_col_i=source_col_i,
-                    source_row_i=source_row_i,
-                    target_col_i=target_col_i,
-                    target_row_i=target_row_i,
-                ),
-                used_card_index=card_index,
-                tile_marker_1=BoardUtils.indices_to_tile(col_i=source_col_i, row_i=source_row_i),
-                tile_marker_2=BoardUtils.indices_to_tile(col_i=target_col_i, row_i=target_row_i),
+                kind=MoveKind.tank,
+                board=board,
+                card_index=card_index,
+                source_col_i=source_col_i,
+                source_row_i=source_row_i,
+                target_col_i=target_col_i,
+                target_row_i=target_row_i,
             )
-            for source_col_i, source_row_i, target_col_i, target_row_i, neighbor_target_col_1, neighbor_target_row_1
-            in tank_move_indices
+            for source_col_i, source_row_i, target_col_i, target_row_i, _, _ in tank_move_indices
         ]
 
-    @classmethod
-    def _get_tank_target_move_indices(
-        cls,
-        pawn_col_i: int,
-        pawn_row_i: int,
-    ) -> list[tuple[int, int, int, int]]:
-        all_neighbor_tiles_indices = [
-            (pawn_col_i, pawn_row_i + 1, pawn_col_i, pawn_row_i + 2),
-            (pawn_col_i, pawn_row_i - 1, pawn_col_i, pawn_row_i - 2),
-            (pawn_col_i + 1, pawn_row_i, pawn_col_i + 2, pawn_row_i),
-            (pawn_col_i - 1, pawn_row_i, pawn_col_i - 2, pawn_row_i),
-        ]
-        return [
-            indices
-            for indices in all_neighbor_tiles_indices
-            if all(
-                0 <= index <= 4
-                for index in indices
-            )
-        ]
@@ -1,10 +1,9 @@
 from board import Board
 from board_utils import BoardUtils
 from cards.card import Card
-from cards.card_utils import CardUtils
 from helper import Helper
-from models import PlayerSign, TileType
-from move import Move, CardMove
+from models import PlayerSign, MoveKind
+from move import CardMove
 
 
 class Wall(Card):
@@ -31,24 +30,16 @@ class Wall(Card):
                 col_i=pawn_col_i,
                 row_i=pawn_row_i,
             )
-            if board[row_i][col_i] == TileType.vacant
+            if board.is_vacant(col_i=col_i, row_i=row_i)
         ]
         return [
-            CardMove(
+            cls._card_move(
                 player_sign=player_sign,
-                result_board=Helper.set_tile(
-                    tile_type=TileType.wall,
-                    col_i=col_i,
-                    row_i=row_i,
-                    board=board.copy_board(),
-                ),
-                result_ball_position=CardUtils.push_ball(
-                    player_sign=player_sign,
-                    ball_position=board.ball_position,
-                ),
-                description=f"{cls.name}: {BoardUtils.indices_to_tile(col_i=col_i, row_i=row_i)}",
-                used_card_index=card_index,
-                tile_marker_1=BoardUtils.indices_to_tile(col_i=col_i, row_i=row_i),
+                kind=MoveKind.wall,
+                board=board,
+                card_index=card_index,
+                target_col_i=col_i,
+                target_row_i=row_i,
             )
             for col_i, row_i in neighbor_vacant_indices
         ]
@@ -0,0 +1,76 @@
+from bitboard_utils import BitboardUtils
+from models import PlayerSign
+
+# (free pawns, farthest free pawn distance, is single push to win, is win), see ColumnTables.
+ColumnEntry = tuple[int, int, bool, bool]
+
+
+def _build_column_table(
+    player_sign: PlayerSign,
+) -> tuple[ColumnEntry | None, ...]:
+    table = []
+    for code in range(1 << 10):
+        pawns = code & 0b11111
+        occupied = code >> 5
+        if pawns & ~occupied:
+            table.append(None)
+            continue
+        # The column is evaluated as column A of an otherwise empty board.
+        free_pawns = BitboardUtils.free_pawns(
+            player_sign=player_sign,
+            pawns=pawns,
+            occupied=occupied,
+        )
+        free_pawn_distances = [
+            row_i if player_sign == PlayerSign.white else 4 - row_i
+            for _, row_i in BitboardUtils.indices(mask=free_pawns)
+        ]
+        table.append(
+            (
+                free_pawns,
+                max(free_pawn_distances, default=-1),
+                BitboardUtils.is_player_single_push_to_win(
+                    player_sign=player_sign,
+                    pawns=pawns,
+                    vacant=BitboardUtils.COLUMN_MASKS[0] & ~occupied,
+                ),
+                BitboardUtils.is_player_win(
+                    player_sign=player_sign,
+                    pawns=pawns,
+                ),
+            )
+        )
+    return tuple(table)
+
+
+class ColumnTables:
+    """
+    Free pawns, push threats and wins only depend on the contents of one column at a time.
+    A column is coded by the player's pawns and the occupied tiles in it (5 bits each), i.e. its own pawn /
+    other tile / vacant state per row, and every code (32 * 32 = 1024) is precomputed per player.
+    Scanning a board is then 5 table lookups per player instead of a chain of whole-board mask operations.
+
+    An entry (None for impossible codes, pawns outside occupied tiles) holds:
+        - free pawns of the column (row bits, see BitboardUtils.free_pawns)
+        - farthest free pawn distance from the start row, -1 if there are no free pawns
+        - whether a single push wins
+        - whether a pawn is already on the last row
+    """
+
+    TABLES: dict[PlayerSign, tuple[ColumnEntry | None, ...]] = {
+        player_sign: _build_column_table(
+            player_sign=player_sign,
+        )
+        for player_sign in PlayerSign
+    }
+    COLUMN_SHIFTS = (0, 5, 10, 15, 20)
+
+    @classmethod
+    def column_code(
+        cls,
+        pawns: int,
+        occupied: int,
+        col_i: int,
+    ) -> int:
+        shift = col_i * 5
+        return (pawns >> shift) & 0b11111 | ((occupied >> shift) & 0b11111) << 5
@@ -1,3 +1,6 @@
 NUM_COLUMNS = 5  # Not used
 NUM_ROWS = 5  # Not used
 DEFAULT_NUM_CARDS_PER_PLAYER = 3
+MAX_NUM_CARDS_PER_PLAYER = 16  # Card index slots of the position hash keys
+ZOBRIST_SEED = 0x5EED
+DEFAULT_TRANSPOSITION_TABLE_NUM_ENTRIES = 1 << 16
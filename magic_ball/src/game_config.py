@@ -28,6 +28,23 @@ class GameConfig(BaseModel):
 
         return config
 
+    def is_deterministic(self) -> bool:
+        """
+        A deterministic game is a pure function of the drawn cards (names and order) of both players.
+        """
+        return self.white_player.is_deterministic() and self.black_player.is_deterministic()
+
+    def clone_with_drawn_cards(
+        self,
+        white_card_names: list[str],
+        black_card_names: list[str],
+    ) -> GameConfig:
+        clone = self.model_copy()
+        clone.cards_config = self.cards_config.model_copy()
+        clone.cards_config.white_card_names = white_card_names
+        clone.cards_config.black_card_names = black_card_names
+        return clone
+
     def clone_with_white_cards(
         self,
         white_card_names: list[str],
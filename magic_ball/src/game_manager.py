@@ -1,23 +1,28 @@
 from __future__ import annotations
 
 import json
+from typing import Iterator
 
 from board import InvalidMove, Board
-from board_utils import BoardUtils
 from cards.card import Card
 from cards.cards_config import CardsConfig
 from cards.cards_randomizer import CardsRandomizer
 from cards.compendium import Compendium
 from game_config import GameConfig
+from game_state import GameState
 from game_summary import GameSummary
 from helper import Helper
+from instrumentation import Instrumentation
 from move import Move, CardMove
 from players.player import Player, NoAvailableMoves
-from models import PlayerSign, GameStatus
+from models import PlayerSign, GameStatus, InstrumentationCategory
 from players.player_factory import PlayerFactory
 
 
 class GameManager:
+    """
+    Interactive game: human / AI players, game log and printing, over a headless GameState.
+    """
 
     @classmethod
     def new(
@@ -48,25 +53,31 @@ class GameManager:
         webpage_mode: bool = False,
     ):
         self._config = config
-        self._board = board or Board.new()
-        self._player_turn = player_turn
         self._webpage_mode = webpage_mode
 
         self._white_player = PlayerFactory.generate_player(
             player_config=config.white_player,
             player_sign=PlayerSign.white,
+            rules_config=config.rules_config,
         )
         self._black_player = PlayerFactory.generate_player(
             player_config=config.black_player,
             player_sign=PlayerSign.black,
+            rules_config=config.rules_config,
         )
         self._draw_cards(
             cards_config=self._config.cards_config,
         )
+        self._state = GameState(
+            white_cards=self._white_player.cards,
+            black_cards=self._black_player.cards,
+            rules_config=config.rules_config,
+            board=board,
+            player_turn=player_turn,
+        )
 
-        self._game_status: GameStatus = GameStatus.ongoing
         self._game_log: list[str] = []
-        self._play_ai_player_turn_if_necessary()  # Also displays board on human's turn.
+        self._play_ai_player_turns_if_necessary()  # Also displays board on human's turn.
 
     def __repr__(self) -> str:
         self._display()
@@ -92,6 +103,13 @@ class GameManager:
     def game_status(self) -> GameStatus:
         return self._game_status
 
+    @property
+    def position_hash(self) -> int:
+        """
+        Zobrist hash of the full game position: board, ball, used cards and side to move.
+        """
+        return self._state.position_hash
+
     def push(
         self,
         target_tile: str,
@@ -108,6 +126,7 @@ class GameManager:
             self._play_move(
                 move=move,
             )
+            self._play_ai_player_turns_if_necessary()
             return move
         except InvalidMove as e:
             self._print(f"** Invalid move: {e.description}")
@@ -125,7 +144,7 @@ class GameManager:
 
         possible_opponent_card_names = [
             card_name
-            for card_name in Compendium.get_cards_names()
+            for card_name in Compendium.CARD_NAMES
             if card_name not in self._get_player().card_names
             and card_name not in used_opponent_card_names
         ]
@@ -168,6 +187,7 @@ class GameManager:
             self._play_move(
                 move=move,
             )
+            self._play_ai_player_turns_if_necessary()
             return move
         except InvalidMove as e:
             self._print(f"** Invalid move: {e.description}")
@@ -178,7 +198,7 @@ class GameManager:
             self._print("Game is already over.")
             return
 
-        available_moves = Helper.get_available_moves(
+        if Helper.has_available_moves(
             player_sign=self._player_turn,
             board=self._board,
             cards=(
@@ -187,13 +207,58 @@ class GameManager:
                 else self._black_player.cards
             ),
             num_allowed_playable_cards=self._num_allowed_playable_cards(),
-        )
-        if available_moves:
+        ):
             self._print("Cannot pass turn, there are available moves.")
         else:
-            self._print("Pass turn, no available moves for player.")
-            self._game_log.append("pass")
-            self._complete_turn()
+            self._pass_turn()
+            self._play_ai_player_turns_if_necessary()
+
+    # Game loop: AI plies are played one step at a time (no recursion between turns).
+
+    @property
+    def is_ai_turn(self) -> bool:
+        return self._game_on and not self._get_player().is_human
+
+    def step(self) -> Move | None:
+        """
+        Play one AI ply: the AI player's move, or a pass if they have no available moves (returns None).
+        Works in webpage mode as well, where AI plies are never played automatically.
+        """
+        assert self.is_ai_turn, "Not an AI player turn."
+        player = self._get_player()
+        try:
+            with Instrumentation.timer(
+                category=InstrumentationCategory.find_move,
+                key=type(player).__name__,
+            ):
+                move = player.find_move(
+                    board=self._board,
+                    player_cards=player.cards,
+                    opponent_cards=self._get_opponent().cards,
+                )
+        except NoAvailableMoves:
+            self._print("Skip player turn since there are no available moves.")
+            self._pass_turn()
+            return None
+        self._play_move(
+            move=move,
+        )
+        return move
+
+    def iter_moves(self) -> Iterator[Move | None]:
+        """
+        Play AI plies until the game is over or it's a human player's turn, yield each ply as it is played
+        (None for a pass). Stop iterating to pause the game, and resume with step / iter_moves / run_until_done.
+        """
+        while self.is_ai_turn:
+            yield self.step()
+
+    def run_until_done(self):
+        """
+        Play AI plies until the game is over or it's a human player's turn.
+        """
+        for _ in self.iter_moves():
+            pass
 
     def log(self):
         if self._game_status == GameStatus.ongoing:
@@ -242,6 +307,18 @@ class GameManager:
             ),
         )
 
+    @property
+    def _board(self) -> Board:
+        return self._state.board
+
+    @property
+    def _player_turn(self) -> PlayerSign:
+        return self._state.player_turn
+
+    @property
+    def _game_status(self) -> GameStatus:
+        return self._state.status
+
     @property
     def _verbose(self) -> bool:
         return self._white_player.is_human or self._black_player.is_human
@@ -278,13 +355,19 @@ class GameManager:
     ):
         self._print(f"{move.player_sign} play: {move.description}")
         if move.used_card_index is not None:
-            player = self._get_player()
-            player.cards[move.used_card_index].use_card()
-        self._board.play_move(
+            # Card usage is kept on the board, the card flag is for display.
+            self._get_player().cards[move.used_card_index].use_card()
+        self._state.play_move(
             move=move,
         )
         self._game_log.append(move.description)
-        self._complete_turn()
+        self._print_game_over_if_necessary()
+
+    def _pass_turn(self):
+        self._print("Pass turn, no available moves for player.")
+        self._state.complete_turn()
+        self._game_log.append("pass")
+        self._print_game_over_if_necessary()
 
     def _display(self):
         if not self._verbose:
@@ -323,20 +406,6 @@ class GameManager:
         for i, move in enumerate(available_card_moves):
             self._print(f" {i}. {move.description}")
 
-    def _complete_turn(self):
-        self._player_turn = BoardUtils.inverse_player_sign(
-            player_sign=self._player_turn,
-        )
-        self._game_status = Helper.get_game_status(
-            board=self._board,
-            player_turn=self._player_turn,
-            white_cards=self._white_player.cards,
-            black_cards=self._black_player.cards,
-            rules_config=self._config.rules_config,
-        )
-        self._print_game_over_if_necessary()
-        self._play_ai_player_turn_if_necessary()
-
     def _print_game_log(self):
         for i, (white_move, black_move) in enumerate(zip(self._game_log[::2], self._game_log[1::2])):
             print(f" {i+1}. {white_move} ; {black_move}")
@@ -397,6 +466,8 @@ class GameManager:
     ) -> list[CardMove]:
         assert 0 <= card_index <= self._num_allowed_playable_cards() - 1, f"invalid card index: {card_index}"
         player = self._get_player()
+        if self._board.used_cards_mask(player_sign=player.player_sign) >> card_index & 1:
+            return []
         return player.cards[card_index].get_available_card_moves(
             player_sign=player.player_sign,
             board=self._board,
@@ -406,27 +477,13 @@ class GameManager:
     def _num_allowed_playable_cards(self) -> int:
         return min(len(self._white_player.cards), len(self._black_player.cards))
 
-    def _play_ai_player_turn_if_necessary(self):
-        if not self._game_on or self._webpage_mode:
+    def _play_ai_player_turns_if_necessary(self):
+        if self._webpage_mode:
             return
-
-        player = self._get_player()
-        if player.is_human:
+        self.run_until_done()
+        if self._game_on:
+            # Human player's turn.
             self._display()
-            return
-
-        try:
-            move = player.find_move(
-                board=self._board,
-                player_cards=self._get_player().cards,
-                opponent_cards=self._get_opponent().cards,
-            )
-            self._play_move(
-                move=move,
-            )
-        except NoAvailableMoves:
-            self._print("Skip player turn since there are no available moves.")
-            self.pass_turn()
 
     @classmethod
     def _get_num_unused_cards(
@@ -1,16 +1,27 @@
 from __future__ import annotations
 
 import json
+import random
 import time
+from concurrent.futures import ProcessPoolExecutor
 
+from cards.cards_randomizer import CardsRandomizer
+from cards.compendium import Compendium
 from game_config import GameConfig
 from game_manager import GameManager
+from headless_game import HeadlessGame
 from models import PlayerSign
-from simulation_summary import SimulationSummary
+from simulation_statistics import SimulationStatistics
+from simulation_summary import SimulationSummary, SimulationComparison
+
+MatchupKey = tuple[tuple[str, ...], tuple[str, ...]]
 
 
 class GameSimulator:
 
+    # Several chunks per worker, so the pool stays busy when games are of uneven length.
+    NUM_CHUNKS_PER_WORKER = 4
+
     @classmethod
     def from_config_filename(
         cls,
@@ -24,8 +35,15 @@ class GameSimulator:
     def __init__(
         self,
         config: GameConfig,
+        memoize: bool = True,
     ):
         self._config = config
+        # Winner per matchup (white card names, black card names, in drawn order), for deterministic configs only.
+        self._outcome_cache: dict[MatchupKey, str] | None = (
+            {}
+            if memoize and config.is_deterministic()
+            else None
+        )
 
     def clone_config(self) -> GameConfig:
         return self._config.model_copy()
@@ -33,34 +51,207 @@ class GameSimulator:
     def run(
         self,
         num_games: int,
+        workers: int = 1,
+        seed: int | None = None,
     ) -> SimulationSummary:
-        summary = SimulationSummary(
-            config=self._config,
-            num_games=num_games,
-            num_white_wins=0,
-            num_draws=0,
-            num_black_wins=0,
+        """
+        With a seed, every game is seeded from (seed, game index), so results are identical for any number of workers.
+        Without a seed, a serial run keeps using the global random state as is, and a parallel run draws a seed from it.
+        """
+        if workers > 1 and seed is None:
+            seed = random.getrandbits(64)
+
+        start_ts = time.time()
+        summary = self._run_game_indices(
+            game_indices=range(num_games),
+            workers=workers,
+            seed=seed,
         )
+        summary.runtime_sec = time.time() - start_ts
+        return summary
+
+    def run_until_confident(
+        self,
+        max_num_games: int,
+        target_half_width: float = 0.01,
+        confidence: float = 0.95,
+        batch_size: int = 500,
+        workers: int = 1,
+        seed: int | None = None,
+    ) -> SimulationSummary:
+        """
+        Play batches of games until the confidence interval of every outcome rate (white win / draw / black win)
+        is at most +-target_half_width, or max_num_games are played.
+        The summary holds the number of games actually played and the intervals.
+        """
+        if seed is None:
+            seed = random.getrandbits(64)
 
         start_ts = time.time()
-        for _ in range(num_games):
-            gm = GameManager.new(
+        batch_summaries: list[SimulationSummary] = []
+        num_played_games = 0
+        while True:
+            num_batch_games = min(batch_size, max_num_games - num_played_games)
+            batch_summaries.append(
+                self._run_game_indices(
+                    game_indices=range(num_played_games, num_played_games + num_batch_games),
+                    workers=workers,
+                    seed=seed,
+                )
+            )
+            num_played_games += num_batch_games
+
+            summary = SimulationSummary.merge(
                 config=self._config,
+                summaries=batch_summaries,
             )
-            game_summary = gm.export_summary()
-            match game_summary.winner:
-                case "white":
-                    summary.num_white_wins += 1
-                case "black":
-                    summary.num_black_wins += 1
-                case "draw":
-                    summary.num_draws += 1
-                case _:
-                    raise RuntimeError(f"Unexpected game summary winner value: {game_summary.winner}")
+            summary.set_confidence_intervals(
+                confidence=confidence,
+            )
+            if summary.max_interval_half_width() <= target_half_width or num_played_games >= max_num_games:
+                break
 
         summary.runtime_sec = time.time() - start_ts
         return summary
 
+    def compare(
+        self,
+        other_config: GameConfig,
+        player_sign: PlayerSign,
+        max_num_games: int,
+        confidence: float = 0.95,
+        batch_size: int = 500,
+        workers: int = 1,
+        seed: int | None = None,
+    ) -> SimulationComparison:
+        """
+        Play batches of games of both configs (same game seeds) until the player's win rate is significantly different,
+        or max_num_games per config are played.
+        The significance level is split evenly between all possible looks (Bonferroni), so stopping early
+        doesn't inflate the false decision rate.
+        """
+        if seed is None:
+            seed = random.getrandbits(64)
+
+        other_simulator = GameSimulator(
+            config=other_config,
+        )
+        max_num_looks = -(-max_num_games // batch_size)
+        p_value_threshold = (1 - confidence) / max_num_looks
+
+        start_ts = time.time()
+        batch_summaries: list[SimulationSummary] = []
+        other_batch_summaries: list[SimulationSummary] = []
+        num_played_games = 0
+        while True:
+            game_indices = range(num_played_games, min(num_played_games + batch_size, max_num_games))
+            batch_summaries.append(
+                self._run_game_indices(
+                    game_indices=game_indices,
+                    workers=workers,
+                    seed=seed,
+                )
+            )
+            other_batch_summaries.append(
+                other_simulator._run_game_indices(
+                    game_indices=game_indices,
+                    workers=workers,
+                    seed=seed,
+                )
+            )
+            num_played_games += len(game_indices)
+
+            summary = SimulationSummary.merge(
+                config=self._config,
+                summaries=batch_summaries,
+            )
+            other_summary = SimulationSummary.merge(
+                config=other_config,
+                summaries=other_batch_summaries,
+            )
+            p_value = SimulationStatistics.two_proportions_p_value(
+                num_successes_1=summary.num_wins(player_sign=player_sign),
+                num_trials_1=summary.num_games,
+                num_successes_2=other_summary.num_wins(player_sign=player_sign),
+                num_trials_2=other_summary.num_games,
+            )
+            if p_value < p_value_threshold or num_played_games >= max_num_games:
+                break
+
+        runtime_sec = time.time() - start_ts
+        for simulation_summary in [summary, other_summary]:
+            simulation_summary.set_confidence_intervals(
+                confidence=confidence,
+            )
+            simulation_summary.runtime_sec = runtime_sec / 2
+        return SimulationComparison(
+            summary=summary,
+            other_summary=other_summary,
+            player_sign=player_sign,
+            confidence=confidence,
+            p_value=p_value,
+            is_decided=p_value < p_value_threshold,
+        )
+
+    def _run_game_indices(
+        self,
+        game_indices: range,
+        workers: int,
+        seed: int | None,
+    ) -> SimulationSummary:
+        if workers <= 1:
+            summary, _ = _run_games(
+                config=self._config,
+                seed=seed,
+                game_indices=game_indices,
+                outcome_cache=self._outcome_cache,
+            )
+            return summary
+
+        game_indices_chunks = self._split_game_indices(
+            game_indices=game_indices,
+            num_chunks=workers * self.NUM_CHUNKS_PER_WORKER,
+        )
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunk_results = list(
+                executor.map(
+                    _run_games,
+                    [self._config] * len(game_indices_chunks),
+                    [seed] * len(game_indices_chunks),
+                    game_indices_chunks,
+                    [self._outcome_cache] * len(game_indices_chunks),
+                )
+            )
+        chunk_summaries = []
+        for chunk_summary, chunk_outcome_cache in chunk_results:
+            chunk_summaries.append(chunk_summary)
+            if self._outcome_cache is not None:
+                self._outcome_cache.update(chunk_outcome_cache)
+        return SimulationSummary.merge(
+            config=self._config,
+            summaries=chunk_summaries,
+        )
+
+    @classmethod
+    def game_seed(
+        cls,
+        seed: int,
+        game_index: int,
+    ) -> int:
+        return (seed << 32) + game_index
+
+    @classmethod
+    def _split_game_indices(
+        cls,
+        game_indices: range,
+        num_chunks: int,
+    ) -> list[range]:
+        chunk_size = max(1, -(-len(game_indices) // num_chunks))
+        return [
+            game_indices[start:start + chunk_size]
+            for start in range(0, len(game_indices), chunk_size)
+        ]
+
     def find_first(
         self,
         winner_player_sign: PlayerSign,
@@ -76,3 +267,80 @@ class GameSimulator:
 
         print(f"Couldn't find a winning game for {winner_player_sign} after {max_num_games} simulations.")
         return None
+
+
+def _run_games(
+    config: GameConfig,
+    seed: int | None,
+    game_indices: range,
+    outcome_cache: dict[MatchupKey, str] | None = None,
+) -> tuple[SimulationSummary, dict[MatchupKey, str] | None]:
+    """
+    Module level so it can be sent to the worker processes, which return their (copy of the) outcome cache.
+    Notice: a seeded run sets the global random state per game, and restores it when done.
+    """
+    summary = SimulationSummary(
+        config=config,
+        num_games=len(game_indices),
+        num_white_wins=0,
+        num_draws=0,
+        num_black_wins=0,
+    )
+    random_state = random.getstate()
+    for game_index in game_indices:
+        if seed is not None:
+            random.seed(
+                GameSimulator.game_seed(
+                    seed=seed,
+                    game_index=game_index,
+                ),
+            )
+        if outcome_cache is None:
+            winner = _play_game(
+                config=config,
+            )
+        else:
+            # Draw the cards as the game would, a deterministic game consumes no other randomness.
+            white_card_ids, black_card_ids = CardsRandomizer.draw_card_ids(
+                white_card_names=config.cards_config.white_card_names,
+                black_card_names=config.cards_config.black_card_names,
+                num_white_cards=config.cards_config.num_white_cards,
+                num_black_cards=config.cards_config.num_black_cards,
+                cards_pull=config.cards_config.cards_pull,
+            )
+            matchup_key = (
+                tuple(Compendium.CARD_NAMES[card_id] for card_id in white_card_ids),
+                tuple(Compendium.CARD_NAMES[card_id] for card_id in black_card_ids),
+            )
+            winner = outcome_cache.get(matchup_key)
+            if winner is None:
+                winner = _play_game(
+                    config=config.clone_with_drawn_cards(
+                        white_card_names=list(matchup_key[0]),
+                        black_card_names=list(matchup_key[1]),
+                    ),
+                )
+                outcome_cache[matchup_key] = winner
+            else:
+                summary.num_memoized_games += 1
+
+        match winner:
+            case "white":
+                summary.num_white_wins += 1
+            case "black":
+                summary.num_black_wins += 1
+            case "draw":
+                summary.num_draws += 1
+            case _:
+                raise RuntimeError(f"Unexpected game summary winner value: {winner}")
+    if seed is not None:
+        random.setstate(random_state)
+    return summary, outcome_cache
+
+
+def _play_game(
+    config: GameConfig,
+) -> str:
+    return HeadlessGame(
+        config=config,
+    ).run_until_done()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from board import Board
+from board_utils import BoardUtils
+from cards.card import Card
+from cards.cards_config import RulesConfig
+from helper import Helper
+from instrumentation import Instrumentation
+from models import PlayerSign, GameStatus, InstrumentationCategory
+from move import Move
+from zobrist import Zobrist
+
+
+class GameState:
+    """
+    The full state of a game: board (with ball position and used cards), side to move, both players' cards
+    and the game status.
+    Headless, no logs or printing, for simulations. GameManager wraps it for interactive play.
+
+    Cards are only read: which ones are used is kept on the board (see Board.used_cards_mask),
+    so the state is a handful of ints over shared card lists, cheap to clone, hash and pickle.
+    """
+
+    __slots__ = ("board", "player_turn", "status", "white_cards", "black_cards", "rules_config")
+
+    def __init__(
+        self,
+        white_cards: list[Card],
+        black_cards: list[Card],
+        rules_config: RulesConfig,
+        board: Board | None = None,
+        player_turn: PlayerSign = PlayerSign.white,
+    ):
+        self.board = board or Board.new()
+        self.player_turn = player_turn
+        self.status = GameStatus.ongoing
+        self.white_cards = white_cards
+        self.black_cards = black_cards
+        self.rules_config = rules_config
+
+    @property
+    def is_ongoing(self) -> bool:
+        return self.status == GameStatus.ongoing
+
+    @property
+    def winner(self) -> str:
+        """
+        As in GameSummary: white / black / draw.
+        """
+        match self.status:
+            case GameStatus.white_win | GameStatus.white_defensive_win:
+                return "white"
+            case GameStatus.black_win | GameStatus.black_defensive_win:
+                return "black"
+        return "draw"
+
+    @property
+    def num_allowed_playable_cards(self) -> int:
+        return min(len(self.white_cards), len(self.black_cards))
+
+    def cards(
+        self,
+        player_sign: PlayerSign,
+    ) -> list[Card]:
+        return (
+            self.white_cards
+            if player_sign == PlayerSign.white
+            else self.black_cards
+        )
+
+    @property
+    def position_hash(self) -> int:
+        """
+        Zobrist hash of the full game position: board, ball, used cards and side to move.
+        """
+        return self.board.position_hash ^ Zobrist.side_to_move_key(
+            player_turn=self.player_turn,
+        )
+
+    def clone(self) -> GameState:
+        clone = GameState(
+            white_cards=self.white_cards,
+            black_cards=self.black_cards,
+            rules_config=self.rules_config,
+            board=self.board.clone(),
+            player_turn=self.player_turn,
+        )
+        clone.status = self.status
+        return clone
+
+    def play_move(
+        self,
+        move: Move,
+    ):
+        if Instrumentation.counters is not None:
+            Instrumentation.counters.count(
+                category=InstrumentationCategory.moves,
+                key=(
+                    "push"
+                    if move.used_card_index is None
+                    else self.cards(player_sign=move.player_sign)[move.used_card_index].name
+                ),
+            )
+        self.board.play_move(
+            move=move,
+        )
+        self.complete_turn()
+
+    def complete_turn(self):
+        """
+        Pass the turn to the other player (also used as is for a pass) and update the game status.
+        """
+        self.player_turn = BoardUtils.inverse_player_sign(
+            player_sign=self.player_turn,
+        )
+        self.status = Helper.get_game_status(
+            board=self.board,
+            player_turn=self.player_turn,
+            white_cards=self.white_cards,
+            black_cards=self.black_cards,
+            rules_config=self.rules_config,
+        )
+        if Instrumentation.counters is not None and self.status != GameStatus.ongoing:
+            Instrumentation.counters.count(
+                category=InstrumentationCategory.games,
+                key=self.winner,
+            )
@@ -0,0 +1,84 @@
+TileIndices = tuple[int, int]
+Offset = tuple[int, int]
+
+NEIGHBOR_OFFSETS: tuple[Offset, ...] = ((0, 1), (0, -1), (1, 0), (-1, 0))
+DIAGONAL_OFFSETS: tuple[Offset, ...] = ((1, 1), (1, -1), (-1, -1), (-1, 1))
+KNIGHT_OFFSETS: tuple[Offset, ...] = ((1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2))
+RAY_DIRECTIONS: tuple[Offset, ...] = ((0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1))
+
+
+def _is_on_board(
+    col_i: int,
+    row_i: int,
+) -> bool:
+    return 0 <= col_i <= 4 and 0 <= row_i <= 4
+
+
+def _build_offset_table(
+    offsets: tuple[Offset, ...],
+) -> tuple[tuple[TileIndices, ...], ...]:
+    return tuple(
+        tuple(
+            (col_i + col_i_offset, row_i + row_i_offset)
+            for col_i_offset, row_i_offset in offsets
+            if _is_on_board(col_i=col_i + col_i_offset, row_i=row_i + row_i_offset)
+        )
+        for col_i in range(5)
+        for row_i in range(5)
+    )
+
+
+def _build_two_steps_table() -> tuple[tuple[tuple[int, int, int, int], ...], ...]:
+    return tuple(
+        tuple(
+            (col_i + col_i_offset, row_i + row_i_offset, col_i + 2 * col_i_offset, row_i + 2 * row_i_offset)
+            for col_i_offset, row_i_offset in NEIGHBOR_OFFSETS
+            if _is_on_board(col_i=col_i + 2 * col_i_offset, row_i=row_i + 2 * row_i_offset)
+        )
+        for col_i in range(5)
+        for row_i in range(5)
+    )
+
+
+def _build_rays_table() -> tuple[dict[Offset, tuple[TileIndices, ...]], ...]:
+    return tuple(
+        {
+            (col_i_offset, row_i_offset): tuple(
+                (col_i + distance * col_i_offset, row_i + distance * row_i_offset)
+                for distance in range(1, 5)
+                if _is_on_board(col_i=col_i + distance * col_i_offset, row_i=row_i + distance * row_i_offset)
+            )
+            for col_i_offset, row_i_offset in RAY_DIRECTIONS
+        }
+        for col_i in range(5)
+        for row_i in range(5)
+    )
+
+
+class Geometry:
+    """
+    Board geometry, precomputed once per square: tile indices (col_i, row_i) reachable from it,
+    in a fixed direction order and already within the board. Tables are indexed by square (col_i * 5 + row_i).
+
+    - NEIGHBORS: up, down, right, left
+    - DIAGONAL_NEIGHBORS: up-right, down-right, down-left, up-left
+    - ADJACENT: NEIGHBORS then DIAGONAL_NEIGHBORS
+    - KNIGHT_TARGETS: the L-shapes, clockwise from (1, 2)
+    - TWO_STEPS: (neighbor, tile behind it) pairs, in NEIGHBORS order
+    - RAYS: per direction (col_i offset, row_i offset, in RAY_DIRECTIONS order), the tiles along it, nearest first
+    """
+
+    NEIGHBORS = _build_offset_table(
+        offsets=NEIGHBOR_OFFSETS,
+    )
+    DIAGONAL_NEIGHBORS = _build_offset_table(
+        offsets=DIAGONAL_OFFSETS,
+    )
+    ADJACENT = _build_offset_table(
+        offsets=NEIGHBOR_OFFSETS + DIAGONAL_OFFSETS,
+    )
+    KNIGHT_TARGETS = _build_offset_table(
+        offsets=KNIGHT_OFFSETS,
+    )
+    TWO_STEPS = _build_two_steps_table()
+    RAYS = _build_rays_table()
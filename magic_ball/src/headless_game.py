@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from cards.cards_randomizer import CardsRandomizer
+from game_config import GameConfig
+from game_state import GameState
+from instrumentation import Instrumentation
+from models import PlayerSign, InstrumentationCategory
+from move import Move
+from players.player import Player, NoAvailableMoves
+from players.player_factory import PlayerFactory
+
+
+class HeadlessGame:
+    """
+    An AI-vs-AI game on a GameState, without GameManager's logs, printing and summaries.
+    Players are generated and cards drawn as GameManager does, so a seeded game is the same game with either.
+    """
+
+    __slots__ = ("state", "players")
+
+    def __init__(
+        self,
+        config: GameConfig,
+    ):
+        self.players: dict[PlayerSign, Player] = {
+            player_sign: PlayerFactory.generate_player(
+                player_config=config.white_player if player_sign == PlayerSign.white else config.black_player,
+                player_sign=player_sign,
+                rules_config=config.rules_config,
+            )
+            for player_sign in PlayerSign
+        }
+        white_cards, black_cards = CardsRandomizer.draw_cards(
+            white_card_names=config.cards_config.white_card_names,
+            black_card_names=config.cards_config.black_card_names,
+            num_white_cards=config.cards_config.num_white_cards,
+            num_black_cards=config.cards_config.num_black_cards,
+            cards_pull=config.cards_config.cards_pull,
+        )
+        self.players[PlayerSign.white].set_cards(
+            cards=white_cards,
+        )
+        self.players[PlayerSign.black].set_cards(
+            cards=black_cards,
+        )
+        self.state = GameState(
+            white_cards=white_cards,
+            black_cards=black_cards,
+            rules_config=config.rules_config,
+        )
+
+    @property
+    def player(self) -> Player:
+        return self.players[self.state.player_turn]
+
+    @property
+    def opponent(self) -> Player:
+        return self.players[PlayerSign.black if self.state.player_turn == PlayerSign.white else PlayerSign.white]
+
+    def step(self) -> Move | None:
+        """
+        Play one ply, return the move (None for a pass).
+        """
+        player = self.player
+        try:
+            with Instrumentation.timer(
+                category=InstrumentationCategory.find_move,
+                key=type(player).__name__,
+            ):
+                move = player.find_move(
+                    board=self.state.board,
+                    player_cards=player.cards,
+                    opponent_cards=self.opponent.cards,
+                )
+        except NoAvailableMoves:
+            self.state.complete_turn()
+            return None
+        self.state.play_move(
+            move=move,
+        )
+        return move
+
+    def run_until_done(self) -> str:
+        """
+        Play until the game is over, return the winner (white / black / draw).
+        """
+        while self.state.is_ongoing:
+            self.step()
+        return self.state.winner
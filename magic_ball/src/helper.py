@@ -1,9 +1,13 @@
+import time
+
+from bitboard_utils import BitboardUtils
 from board import Board, InvalidMove
 from board_utils import BoardUtils
 from cards.card import Card
 from cards.cards_config import RulesConfig
+from instrumentation import Instrumentation
 from move import Move
-from models import PlayerSign, TileType, GameStatus, BoardType
+from models import PlayerSign, TileType, GameStatus, BoardType, MoveKind, InstrumentationCategory
 
 
 class Helper:
@@ -16,15 +20,48 @@ class Helper:
         white_cards: list[Card],
         black_cards: list[Card],
         rules_config: RulesConfig,
+    ) -> GameStatus:
+        counters = Instrumentation.counters
+        if counters is None:
+            return cls._get_game_status(
+                board=board,
+                player_turn=player_turn,
+                white_cards=white_cards,
+                black_cards=black_cards,
+                rules_config=rules_config,
+            )
+        start_time = time.perf_counter()
+        game_status = cls._get_game_status(
+            board=board,
+            player_turn=player_turn,
+            white_cards=white_cards,
+            black_cards=black_cards,
+            rules_config=rules_config,
+        )
+        counters.add_time(
+            category=InstrumentationCategory.status_checks,
+            key="get_game_status",
+            runtime_sec=time.perf_counter() - start_time,
+        )
+        return game_status
+
+    @classmethod
+    def _get_game_status(
+        cls,
+        board: Board,
+        player_turn: PlayerSign,
+        white_cards: list[Card],
+        black_cards: list[Card],
+        rules_config: RulesConfig,
     ) -> GameStatus:
         if BoardUtils.is_player_win(
             player_sign=PlayerSign.white,
-            board=board.copy_board(),
+            board=board,
         ):
             return GameStatus.white_win
         if BoardUtils.is_player_win(
             player_sign=PlayerSign.black,
-            board=board.copy_board(),
+            board=board,
         ):
             return GameStatus.black_win
         if cls._no_available_moves(
@@ -55,17 +92,79 @@ class Helper:
         cards: list[Card],
         num_allowed_playable_cards: int,
     ) -> list[Move]:
-        available_push_moves = cls._get_available_push_moves(
-            player_sign=player_sign,
-            board=board,
-        )
-        available_card_moves = cls._get_available_card_moves(
+        """
+        Moves are cached on the board until it changes, so the status check, pass turn and the player
+        share one move generation per position.
+        Returns a new list, callers may reorder it.
+        """
+        cache_key = cls._moves_cache_key(
             player_sign=player_sign,
-            board=board,
             cards=cards,
             num_allowed_playable_cards=num_allowed_playable_cards,
         )
-        return available_push_moves + available_card_moves
+        available_moves = board.get_cached_moves(
+            key=cache_key,
+        )
+        if Instrumentation.counters is not None:
+            Instrumentation.counters.count(
+                category=InstrumentationCategory.moves_cache,
+                key="miss" if available_moves is None else "hit",
+            )
+        if available_moves is None:
+            available_push_moves = cls._get_available_push_moves(
+                player_sign=player_sign,
+                board=board,
+            )
+            available_card_moves = cls._get_available_card_moves(
+                player_sign=player_sign,
+                board=board,
+                cards=cards,
+                num_allowed_playable_cards=num_allowed_playable_cards,
+            )
+            available_moves = available_push_moves + available_card_moves
+            board.set_cached_moves(
+                key=cache_key,
+                moves=available_moves,
+            )
+        return list(available_moves)
+
+    @classmethod
+    def has_available_moves(
+        cls,
+        player_sign: PlayerSign,
+        board: Board,
+        cards: list[Card],
+        num_allowed_playable_cards: int,
+    ) -> bool:
+        """
+        Stop at the first available push, without generating any move.
+        Otherwise only card moves are left: generate (and cache) them, the player to move needs them anyway.
+        """
+        cached_moves = board.get_cached_moves(
+            key=cls._moves_cache_key(
+                player_sign=player_sign,
+                cards=cards,
+                num_allowed_playable_cards=num_allowed_playable_cards,
+            ),
+        )
+        if cached_moves is not None:
+            return bool(cached_moves)
+        if BitboardUtils.push_targets(
+            player_sign=player_sign,
+            pawns=board.pawns_mask(
+                player_sign=player_sign,
+            ),
+            vacant=board.vacant_mask,
+        ):
+            return True
+        return bool(
+            cls.get_available_moves(
+                player_sign=player_sign,
+                board=board,
+                cards=cards,
+                num_allowed_playable_cards=num_allowed_playable_cards,
+            )
+        )
 
     @classmethod
     def generate_push_move(
@@ -82,19 +181,23 @@ class Helper:
             if player_sign == PlayerSign.white
             else row_i + 1
         )
-        new_board = cls.move_pawn(
+        # Validate the push on a scratch board, raises InvalidMove.
+        cls.move_pawn(
             player_sign=player_sign,
             source_col_i=col_i,
             source_row_i=source_row_i,
             target_col_i=col_i,
             target_row_i=row_i,
-            board=board.copy_board(),
+            board=board.clone(),
         )
         return Move(
             player_sign=player_sign,
-            result_board=new_board,
-            result_ball_position=board.ball_position,
-            description=target_tile,
+            code=Move.encode(
+                kind=MoveKind.push,
+                source_square=BitboardUtils.square(col_i=col_i, row_i=source_row_i),
+                target_square=BitboardUtils.square(col_i=col_i, row_i=row_i),
+            ),
+            source_board=board.clone(),
         )
 
     @classmethod
@@ -105,20 +208,21 @@ class Helper:
         source_row_i: int,
         target_col_i: int,
         target_row_i: int,
-        board: BoardType,
-    ) -> BoardType:
+        board: Board,
+    ) -> Board:
         """
         Notice: change input board argument in-place.
         """
-        source_board_tile = board[source_row_i][source_col_i]
-        if not BoardUtils.is_tile_player_pawn(
+        if not board.is_player_pawn(
             player_sign=player_sign,
-            tile=source_board_tile,
+            col_i=source_col_i,
+            row_i=source_row_i,
         ):
             raise InvalidMove(
                 description=(
                     f"source board tile is not a valid pawn: "
-                    f"{BoardUtils.indices_to_tile(col_i=source_col_i, row_i=source_row_i)} = {source_board_tile}"
+                    f"{BoardUtils.indices_to_tile(col_i=source_col_i, row_i=source_row_i)} = "
+                    f"{board.get_tile(col_i=source_col_i, row_i=source_row_i)}"
                 ),
             )
 
@@ -137,8 +241,8 @@ class Helper:
         source_row_i: int,
         target_col_i: int,
         target_row_i: int,
-        board: BoardType,
-    ) -> BoardType:
+        board: Board,
+    ) -> Board:
         """
         Notice: change input board argument in-place.
         """
@@ -147,12 +251,14 @@ class Helper:
         assert 0 <= target_col_i <= 4
         assert 0 <= target_row_i <= 4
 
-        target_board_tile = board[target_row_i][target_col_i]
-        if target_board_tile != TileType.vacant:
+        if not board.is_vacant(
+            col_i=target_col_i,
+            row_i=target_row_i,
+        ):
             raise InvalidMove(
                 description=(
                     f"target tile {BoardUtils.indices_to_tile(col_i=target_col_i, row_i=target_row_i)} "
-                    f"not vacant: {target_board_tile}"
+                    f"not vacant: {board.get_tile(col_i=target_col_i, row_i=target_row_i)}"
                 ),
             )
 
@@ -161,7 +267,10 @@ class Helper:
             col_i=source_col_i,
             row_i=source_row_i,
             board=cls.set_tile(
-                tile_type=TileType(board[source_row_i][source_col_i]),
+                tile_type=board.get_tile(
+                    col_i=source_col_i,
+                    row_i=source_row_i,
+                ),
                 col_i=target_col_i,
                 row_i=target_row_i,
                 board=board,
@@ -174,17 +283,21 @@ class Helper:
         tile_type: TileType,
         col_i: int,
         row_i: int,
-        board: BoardType,
+        board: Board,
         safe: bool = False,
-    ) -> BoardType:
+    ) -> Board:
         """
         Notice: change input board argument in-place.
         """
         assert 0 <= col_i <= 4
         assert 0 <= row_i <= 4
         if not safe:
-            assert board[row_i][col_i] != tile_type
-        board[row_i][col_i] = tile_type
+            assert board.get_tile(col_i=col_i, row_i=row_i) != tile_type
+        board.set_tile(
+            tile_type=tile_type,
+            col_i=col_i,
+            row_i=row_i,
+        )
         return board
 
     @classmethod
@@ -193,8 +306,8 @@ class Helper:
         player_sign: PlayerSign,
         col_i: int,
         row_i: int,
-        board: BoardType,
-    ) -> BoardType:
+        board: Board,
+    ) -> Board:
         return cls.set_tile(
             tile_type=(
                 TileType.white
@@ -211,11 +324,11 @@ class Helper:
         cls,
         col_i: int,
         row_i: int,
-        board: BoardType,
+        board: Board,
         safe: bool = False,
-    ) -> BoardType:
+    ) -> Board:
         if not safe:
-            assert board[row_i][col_i] in [TileType.white, TileType.black]
+            assert board.is_pawn(col_i=col_i, row_i=row_i)
         return cls.vacate_tile(
             col_i=col_i,
             row_i=row_i,
@@ -228,9 +341,9 @@ class Helper:
         cls,
         col_i: int,
         row_i: int,
-        board: BoardType,
+        board: Board,
         safe: bool = False,
-    ) -> BoardType:
+    ) -> Board:
         return cls.set_tile(
             tile_type=TileType.vacant,
             col_i=col_i,
@@ -245,15 +358,11 @@ class Helper:
         player_sign: PlayerSign,
         board: Board | BoardType,
     ) -> list[tuple[int, int]]:
-        return [
-            (col_i, row_i)
-            for col_i in range(5)
-            for row_i in range(5)
-            if BoardUtils.is_tile_player_pawn(
+        return BitboardUtils.indices(
+            mask=Board.wrap(board).pawns_mask(
                 player_sign=player_sign,
-                tile=board[row_i][col_i],
-            )
-        ]
+            ),
+        )
 
     @classmethod
     def _no_available_moves(
@@ -265,23 +374,38 @@ class Helper:
         allow_pass_turn: bool,
     ) -> bool:
         num_allowed_playable_cards = min(len(white_cards), len(black_cards))
-        white_available_moves = Helper.get_available_moves(
-            player_sign=PlayerSign.white,
-            board=board,
-            cards=white_cards,
-            num_allowed_playable_cards=num_allowed_playable_cards,
+        player_signs = (
+            [player_turn, BoardUtils.inverse_player_sign(player_sign=player_turn)]
+            if allow_pass_turn
+            else [player_turn]
         )
-        black_available_moves = Helper.get_available_moves(
-            player_sign=PlayerSign.black,
-            board=board,
-            cards=black_cards,
-            num_allowed_playable_cards=num_allowed_playable_cards,
+        return not any(
+            cls.has_available_moves(
+                player_sign=player_sign,
+                board=board,
+                cards=white_cards if player_sign == PlayerSign.white else black_cards,
+                num_allowed_playable_cards=num_allowed_playable_cards,
+            )
+            for player_sign in player_signs
+        )
+
+    @classmethod
+    def _moves_cache_key(
+        cls,
+        player_sign: PlayerSign,
+        cards: list[Card],
+        num_allowed_playable_cards: int,
+    ) -> tuple:
+        # Card objects (not names), the same board may be searched with other cards.
+        # Card usage is part of the board, the cache is cleared when it changes.
+        return (
+            player_sign,
+            num_allowed_playable_cards,
+            tuple(
+                id(card)
+                for card in cards
+            ),
         )
-        if allow_pass_turn:
-            return not white_available_moves and not black_available_moves
-        elif player_turn == PlayerSign.white:
-            return not white_available_moves
-        return not black_available_moves
 
     @classmethod
     def _get_available_push_moves(
@@ -289,31 +413,27 @@ class Helper:
         player_sign: PlayerSign,
         board: Board,
     ) -> list[Move]:
-        available_push_moves = []
-        for row_i in range(5):
-            for col_i in range(5):
-                if BoardUtils.is_tile_player_pawn(
-                    player_sign=player_sign,
-                    tile=board[row_i][col_i],
-                ):
-                    if player_sign == PlayerSign.white and row_i < 4 and board[row_i + 1][col_i] == TileType.vacant:
-                        available_push_moves.append(
-                            cls.generate_push_move(
-                                player_sign=PlayerSign.white,
-                                target_tile=BoardUtils.indices_to_tile(col_i=col_i, row_i=row_i + 1),
-                                board=board,
-                            )
-                        )
-                    elif player_sign == PlayerSign.black and row_i > 0 and board[row_i - 1][col_i] == TileType.vacant:
-                        available_push_moves.append(
-                            cls.generate_push_move(
-                                player_sign=PlayerSign.black,
-                                target_tile=BoardUtils.indices_to_tile(col_i=col_i, row_i=row_i - 1),
-                                board=board,
-                            )
-                        )
-
-        return available_push_moves
+        push_targets = BitboardUtils.push_targets(
+            player_sign=player_sign,
+            pawns=board.pawns_mask(
+                player_sign=player_sign,
+            ),
+            vacant=board.vacant_mask,
+        )
+        source_square_offset = -1 if player_sign == PlayerSign.white else 1
+        source_board = board.clone()
+        return [
+            Move(
+                player_sign=player_sign,
+                code=Move.encode(
+                    kind=MoveKind.push,
+                    source_square=target_square + source_square_offset,
+                    target_square=target_square,
+                ),
+                source_board=source_board,
+            )
+            for target_square in BitboardUtils.iter_squares_row_major(mask=push_targets)
+        ]
 
     @classmethod
     def _get_available_card_moves(
@@ -323,18 +443,17 @@ class Helper:
         cards: list[Card],
         num_allowed_playable_cards: int,
     ) -> list[Move]:
-        num_used_cards = len([
-            card
-            for card in cards
-            if card.already_used
-        ])
-        if num_used_cards >= num_allowed_playable_cards:
+        used_cards = board.used_cards_mask(
+            player_sign=player_sign,
+        )
+        if used_cards.bit_count() >= num_allowed_playable_cards:
             # Forbid using more than allowed number of cards.
             return []
 
         return [
             card_move
             for card_index, card in enumerate(cards)
+            if not used_cards >> card_index & 1
             for card_move in card.get_available_card_moves(
                 player_sign=player_sign,
                 board=board,
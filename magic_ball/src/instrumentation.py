@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Iterator
+
+from pydantic import BaseModel
+
+from models import InstrumentationCategory
+
+
+class InstrumentationReport(BaseModel):
+    counts: dict[str, dict[str, int]]  # Per category, per key (card name, player class...)
+    times_sec: dict[str, dict[str, float]]  # Per category, per key, for the timed calls only
+    num_games: int
+    moves_per_game: float | None
+
+
+class InstrumentationCounters:
+    """
+    Call counts and cumulative times, per category and key.
+    """
+
+    __slots__ = ("counts", "times_sec")
+
+    def __init__(self):
+        self.counts: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self.times_sec: defaultdict[str, defaultdict[str, float]] = defaultdict(lambda: defaultdict(float))
+
+    def count(
+        self,
+        category: InstrumentationCategory,
+        key: str,
+        num: int = 1,
+    ):
+        self.counts[category][key] += num
+
+    def add_time(
+        self,
+        category: InstrumentationCategory,
+        key: str,
+        runtime_sec: float,
+    ):
+        """
+        Add a timed call, counted as well.
+        """
+        self.counts[category][key] += 1
+        self.times_sec[category][key] += runtime_sec
+
+    def merge(
+        self,
+        other: InstrumentationCounters,
+    ):
+        for category, counts in other.counts.items():
+            self.counts[category].update(counts)
+        for category, times_sec in other.times_sec.items():
+            for key, runtime_sec in times_sec.items():
+                self.times_sec[category][key] += runtime_sec
+
+    def report(self) -> InstrumentationReport:
+        num_games = sum(self.counts[InstrumentationCategory.games].values())
+        num_moves = sum(self.counts[InstrumentationCategory.moves].values())
+        return InstrumentationReport(
+            counts={
+                category: dict(counts)
+                for category, counts in self.counts.items()
+                if counts
+            },
+            times_sec={
+                category: dict(times_sec)
+                for category, times_sec in self.times_sec.items()
+            },
+            num_games=num_games,
+            moves_per_game=num_moves / num_games if num_games else None,
+        )
+
+    def to_json(self) -> str:
+        return self.report().model_dump_json(
+            indent=2,
+        )
+
+
+class Instrumentation:
+    """
+    Opt-in engine counters and timers: movegen per card, scoring, board copies, status checks,
+    find_move per player class, and played moves and finished games.
+
+        with Instrumentation.collect() as counters:
+            simulator.run(num_games=100)
+        print(counters.to_json())
+
+    While nothing is collected, counters is None, and an instrumented call site costs a single attribute check.
+    Only the current process is counted: parallel GameSimulator workers are not.
+    """
+
+    counters: InstrumentationCounters | None = None
+
+    @classmethod
+    @contextmanager
+    def collect(cls) -> Iterator[InstrumentationCounters]:
+        """
+        Collect until exit, nested collections are added to the enclosing one.
+        """
+        enclosing_counters = cls.counters
+        counters = InstrumentationCounters()
+        cls.counters = counters
+        try:
+            yield counters
+        finally:
+            cls.counters = enclosing_counters
+            if enclosing_counters is not None:
+                enclosing_counters.merge(
+                    other=counters,
+                )
+
+    @classmethod
+    def timer(
+        cls,
+        category: InstrumentationCategory,
+        key: str,
+    ) -> ContextManager:
+        """
+        Time the block if collecting. For call sites outside the hot paths (a context manager is not free).
+        """
+        if cls.counters is None:
+            return nullcontext()
+        return cls._timer(
+            counters=cls.counters,
+            category=category,
+            key=key,
+        )
+
+    @classmethod
+    @contextmanager
+    def _timer(
+        cls,
+        counters: InstrumentationCounters,
+        category: InstrumentationCategory,
+        key: str,
+    ) -> Iterator[None]:
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            counters.add_time(
+                category=category,
+                key=key,
+                runtime_sec=time.perf_counter() - start_time,
+            )
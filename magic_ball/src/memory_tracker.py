@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import os
+import random
+import sys
+import tracemalloc
+from collections import Counter
+
+from pydantic import BaseModel
+
+from game_config import GameConfig
+from game_simulator import GameSimulator
+from headless_game import HeadlessGame
+
+try:
+    import resource
+except ImportError:  # Not on Windows
+    resource = None
+
+# Allocation site (source file) to category, by file name or directory, anything else is "other".
+ALLOCATION_SITE_CATEGORIES = {
+    "cards": "movegen",
+    "helper.py": "movegen",
+    "move.py": "movegen",
+    "geometry.py": "movegen",
+    "board.py": "board",
+    "bitboard_utils.py": "board",
+    "zobrist.py": "board",
+    "scores": "scorer",
+    "column_tables.py": "scorer",
+    "pydantic": "config",
+    "pydantic_core": "config",
+    "game_config.py": "config",
+    "player_config.py": "config",
+    "cards_config.py": "config",
+    "game_state.py": "game",
+    "headless_game.py": "game",
+    "players": "game",
+}
+
+
+class MemoryReport(BaseModel):
+    num_games: int
+    num_plies: int
+    peak_bytes: int  # Over the whole simulation, above the memory traced before it
+    mean_peak_bytes_per_game: float  # Above the memory traced before each game
+    mean_peak_bytes_per_ply: float  # Above the memory traced before each ply
+    retained_bytes: int  # Still allocated after the simulation (caches...)
+    mean_live_bytes_per_category: dict[str, float]  # At the end of each ply, by allocation site category
+    top_sites: dict[str, int]  # file:line to live bytes, at the end of the ply with the most live memory
+    peak_rss_bytes: int | None  # Of the process over its lifetime, None if unavailable
+
+
+class MemoryTracker:
+    """
+    Memory footprint of seeded games, with tracemalloc (Python allocations only) and the process peak RSS.
+    Games are slower while traced, use it for memory only.
+    The global random state is kept as is.
+    """
+
+    # Enough to get from library frames (numpy, pydantic...) back to the engine frame that called them.
+    NUM_TRACEBACK_FRAMES = 12
+
+    def __init__(
+        self,
+        top_n: int = 10,
+        snapshot_every_num_plies: int = 10,
+    ):
+        self._top_n = top_n
+        self._snapshot_every_num_plies = snapshot_every_num_plies
+
+    def measure(
+        self,
+        config: GameConfig,
+        num_games: int,
+        seed: int = 0,
+    ) -> MemoryReport:
+        random_state = random.getstate()
+        # Warm up untraced, one-time lazy initializations (imports, caches) are not the games' memory.
+        random.seed(seed)
+        HeadlessGame(
+            config=config,
+        ).run_until_done()
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start(self.NUM_TRACEBACK_FRAMES)
+        try:
+            return self._measure(
+                config=config,
+                num_games=num_games,
+                seed=seed,
+            )
+        finally:
+            random.setstate(random_state)
+            if not was_tracing:
+                tracemalloc.stop()
+
+    def _measure(
+        self,
+        config: GameConfig,
+        num_games: int,
+        seed: int,
+    ) -> MemoryReport:
+        tracemalloc.reset_peak()
+        baseline_snapshot = self._take_snapshot()
+        simulation_start_bytes, _ = tracemalloc.get_traced_memory()
+        simulation_peak_bytes = 0
+        game_peak_bytes = []
+        ply_peak_bytes = []
+        live_bytes_per_category = Counter()
+        num_snapshots = 0
+        max_live_bytes = -1
+        top_sites = {}
+
+        for game_index in range(num_games):
+            random.seed(
+                GameSimulator.game_seed(
+                    seed=seed,
+                    game_index=game_index,
+                ),
+            )
+            game_start_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            simulation_peak_bytes = max(simulation_peak_bytes, peak_bytes - simulation_start_bytes)
+            tracemalloc.reset_peak()
+            game = HeadlessGame(
+                config=config,
+            )
+            game_peak = 0
+            while game.state.is_ongoing:
+                ply_start_bytes, peak_bytes = tracemalloc.get_traced_memory()
+                game_peak = max(game_peak, peak_bytes)
+                tracemalloc.reset_peak()
+                game.step()
+                _, peak_bytes = tracemalloc.get_traced_memory()
+                ply_peak_bytes.append(peak_bytes - ply_start_bytes)
+                game_peak = max(game_peak, peak_bytes)
+                if len(ply_peak_bytes) % self._snapshot_every_num_plies == 0:
+                    # Snapshots are traced as well, keep them out of the peaks.
+                    live_bytes_per_site = self._live_bytes_per_site(
+                        baseline_snapshot=baseline_snapshot,
+                    )
+                    for (category, _), live_bytes in live_bytes_per_site.items():
+                        live_bytes_per_category[category] += live_bytes
+                    num_snapshots += 1
+                    if live_bytes_per_site.total() > max_live_bytes:
+                        max_live_bytes = live_bytes_per_site.total()
+                        top_sites = {
+                            site: live_bytes
+                            for (_, site), live_bytes in live_bytes_per_site.most_common(self._top_n)
+                        }
+                    del live_bytes_per_site
+                    tracemalloc.reset_peak()
+            game_peak_bytes.append(game_peak - game_start_bytes)
+            simulation_peak_bytes = max(simulation_peak_bytes, game_peak - simulation_start_bytes)
+            del game
+
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        return MemoryReport(
+            num_games=num_games,
+            num_plies=len(ply_peak_bytes),
+            peak_bytes=max(simulation_peak_bytes, peak_bytes - simulation_start_bytes),
+            mean_peak_bytes_per_game=sum(game_peak_bytes) / num_games if num_games else 0.0,
+            mean_peak_bytes_per_ply=sum(ply_peak_bytes) / len(ply_peak_bytes) if ply_peak_bytes else 0.0,
+            retained_bytes=self._live_bytes_per_site(
+                baseline_snapshot=baseline_snapshot,
+            ).total(),
+            mean_live_bytes_per_category={
+                category: live_bytes / num_snapshots
+                for category, live_bytes in live_bytes_per_category.most_common()
+            },
+            top_sites=top_sites,
+            peak_rss_bytes=self.peak_rss_bytes(),
+        )
+
+    @classmethod
+    def peak_rss_bytes(cls) -> int | None:
+        if resource is None:
+            return None
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kilobytes on Linux, bytes on macOS.
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+    @classmethod
+    def _take_snapshot(cls) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+
+    @classmethod
+    def _live_bytes_per_site(
+        cls,
+        baseline_snapshot: tracemalloc.Snapshot,
+    ) -> Counter[tuple[str, str]]:
+        """
+        Bytes allocated since the baseline and still alive, per (category, file:line).
+        The site of an allocation is its most recent frame of a known category (its caller in the engine).
+        """
+        live_bytes_per_site = Counter()
+        for stat in cls._take_snapshot().compare_to(baseline_snapshot, "traceback"):
+            if stat.size_diff <= 0:
+                continue
+            live_bytes_per_site[cls._site(traceback=stat.traceback)] += stat.size_diff
+        return live_bytes_per_site
+
+    @classmethod
+    def _site(
+        cls,
+        traceback: tracemalloc.Traceback,
+    ) -> tuple[str, str]:
+        for frame in reversed(traceback):  # Most recent first
+            category = cls._category(
+                filename=frame.filename,
+            )
+            if category is not None:
+                return category, f"{os.path.basename(frame.filename)}:{frame.lineno}"
+        frame = traceback[-1]
+        return "other", f"{os.path.basename(frame.filename)}:{frame.lineno}"
+
+    @classmethod
+    def _category(
+        cls,
+        filename: str,
+    ) -> str | None:
+        for part in reversed(filename.split(os.sep)):
+            category = ALLOCATION_SITE_CATEGORIES.get(part)
+            if category is not None:
+                return category
+        return None
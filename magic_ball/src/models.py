@@ -20,6 +20,29 @@ class TileType(StrEnum):
     wall = "#"
 
 
+class MoveKind(IntEnum):
+    push = 0
+    move_tile = 1  # Move any tile from source to target
+    tank = 2  # Push the target tile one more step in the same direction, then move source to target
+    eliminate = 3  # Vacate target
+    eliminate_pair = 4  # Vacate both source (player pawn) and target (opponent pawn)
+    spawn = 5  # Player pawn at target
+    wall = 6  # Wall at target
+    fire = 7  # Vacate the target's whole row
+    pull = 8  # Ball only
+
+
+class BoundType(IntEnum):
+    exact = 0
+    lower = 1  # Fail-high, score is at least the stored one
+    upper = 2  # Fail-low, score is at most the stored one
+
+
+class ReplacementPolicy(StrEnum):
+    depth_preferred = "depth_preferred"  # Keep the deeper entry on index collisions
+    always_replace = "always_replace"
+
+
 class PlayerSign(StrEnum):
     white = "white"
     black = "black"
@@ -29,3 +52,21 @@ class BallPosition(StrEnum):
     white = "white"
     middle = "middle"
     black = "black"
+
+
+class BenchmarkKind(StrEnum):
+    micro = "micro"  # A single engine call over a corpus of positions
+    macro = "macro"  # Full AI-vs-AI games
+    throughput = "throughput"  # GameSimulator.run
+    memory = "memory"  # Traced memory of AI-vs-AI games
+
+
+class InstrumentationCategory(StrEnum):
+    movegen = "movegen"  # Card move generation, by card name
+    moves_cache = "moves_cache"  # Helper.get_available_moves cache hit / miss
+    scoring = "scoring"  # Scorer.score_board and batch scoring calls
+    board_copies = "board_copies"  # Board.clone / Board.copy_board
+    status_checks = "status_checks"  # Helper.get_game_status
+    find_move = "find_move"  # By player class
+    moves = "moves"  # Played moves, by card name (push for a push move)
+    games = "games"  # Finished games, by winner
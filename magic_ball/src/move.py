@@ -1,19 +1,151 @@
-from dataclasses import dataclass, field
+from __future__ import annotations
 
-from models import BoardType, PlayerSign, BallPosition
+from typing import TYPE_CHECKING
+
+from bitboard_utils import BitboardUtils
+from models import PlayerSign, BallPosition, MoveKind
+from zobrist import Zobrist
+
+if TYPE_CHECKING:
+    from board import Board
+    from cards.card import Card
 
 
-@dataclass
 class Move:
-    player_sign: PlayerSign
-    result_board: BoardType
-    result_ball_position: BallPosition
-    description: str
-    used_card_index: int | None = None
+    """
+    A move is packed into a single int code: source square (bits 0-4), target square (bits 5-9),
+    move kind (bits 10-13) and used card index + 1 (bits 14+, 0 for a push move).
+    The result board and description are built only when accessed,
+    from the (never mutated) board snapshot the move was generated from.
+    """
+
+    __slots__ = ("player_sign", "code", "_source_board", "_card", "_result_board")
+
+    def __init__(
+        self,
+        player_sign: PlayerSign,
+        code: int,
+        source_board: Board,
+        card: Card | None = None,
+    ):
+        self.player_sign = player_sign
+        self.code = code
+        self._source_board = source_board
+        self._card = card
+        self._result_board: Board | None = None
+
+    @classmethod
+    def encode(
+        cls,
+        kind: MoveKind,
+        source_square: int = 0,
+        target_square: int = 0,
+        card_index: int | None = None,
+    ) -> int:
+        card_slot = 0 if card_index is None else card_index + 1
+        return card_slot << 14 | kind << 10 | target_square << 5 | source_square
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.player_sign}: {self.description})"
+
+    @property
+    def kind(self) -> MoveKind:
+        return MoveKind(self.code >> 10 & 0b1111)
+
+    @property
+    def source_square(self) -> int:
+        return self.code & 0b11111
+
+    @property
+    def target_square(self) -> int:
+        return self.code >> 5 & 0b11111
+
+    @property
+    def used_card_index(self) -> int | None:
+        card_slot = self.code >> 14
+        return card_slot - 1 if card_slot else None
+
+    @property
+    def source_board(self) -> Board:
+        return self._source_board
+
+    @property
+    def result_masks(self) -> tuple[int, int, int]:
+        return BitboardUtils.apply_move(
+            player_sign=self.player_sign,
+            kind=self.code >> 10 & 0b1111,
+            source_square=self.code & 0b11111,
+            target_square=self.code >> 5 & 0b11111,
+            white=self._source_board.white_mask,
+            black=self._source_board.black_mask,
+            wall=self._source_board.wall_mask,
+        )
+
+    @property
+    def result_ball_position(self) -> BallPosition:
+        if self._card is None:
+            return self._source_board.ball_position
+        return self._card.result_ball_position(
+            player_sign=self.player_sign,
+            ball_position=self._source_board.ball_position,
+        )
+
+    @property
+    def result_hash(self) -> int:
+        """
+        Position hash after the move, updated from the source board hash without building the result board.
+        """
+        white, black, wall = self.result_masks
+        source_board = self._source_board
+        return source_board.position_hash ^ Zobrist.masks_delta(
+            white_delta=white ^ source_board.white_mask,
+            black_delta=black ^ source_board.black_mask,
+            wall_delta=wall ^ source_board.wall_mask,
+        ) ^ Zobrist.ball_delta(
+            old_ball_position=source_board.ball_position,
+            new_ball_position=self.result_ball_position,
+        ) ^ Zobrist.card_used_delta(
+            player_sign=self.player_sign,
+            card_index=self.used_card_index,
+        )
+
+    @property
+    def result_board(self) -> Board:
+        if self._result_board is None:
+            self._result_board = self._source_board.next_board(
+                move=self,
+            )
+        return self._result_board
+
+    @property
+    def description(self) -> str:
+        if self._card is None:
+            return BitboardUtils.square_to_tile(
+                square=self.target_square,
+            )
+        return self._card.describe_move(
+            move=self,
+        )
 
 
-@dataclass
 class CardMove(Move):
-    tile_marker_1: str | None = None
-    tile_marker_2: str | None = None
-    extra: dict = field(default_factory=dict)
+
+    __slots__ = ()
+
+    @property
+    def tile_marker_1(self) -> str | None:
+        tile_marker_1, _ = self._card.tile_markers(
+            move=self,
+        )
+        return tile_marker_1
+
+    @property
+    def tile_marker_2(self) -> str | None:
+        _, tile_marker_2 = self._card.tile_markers(
+            move=self,
+        )
+        return tile_marker_2
+
+    @property
+    def extra(self) -> dict:
+        return {}
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import time
+from collections import Counter
+
+from pydantic import BaseModel
+
+from bitboard_utils import BitboardUtils
+from board import Board
+from board_utils import BoardUtils
+from cards.card import Card
+from cards.compendium import Compendium
+from helper import Helper
+from models import BoardType, BallPosition, PlayerSign, MoveKind
+from move import Move
+
+PUSH_MOVE_NAME = "push"
+
+
+class PerftPosition(BaseModel):
+    """
+    A position to walk from: board (rows from row 1, as in Board), ball position, side to move and fixed decks,
+    with its known number of leaf nodes per depth.
+    """
+    name: str
+    board: BoardType
+    ball_position: BallPosition = BallPosition.middle
+    player_turn: PlayerSign = PlayerSign.white
+    white_card_names: list[str] = []
+    black_card_names: list[str] = []
+    expected_num_nodes: dict[int, int] = {}
+
+    def new_board(self) -> Board:
+        return Board(
+            board=self.board,
+            ball_position=self.ball_position,
+        )
+
+    def cards(self) -> tuple[list[Card], list[Card]]:
+        # Separate instances per player, both may hold the same card.
+        return (
+            self._new_cards(card_names=self.white_card_names),
+            self._new_cards(card_names=self.black_card_names),
+        )
+
+    @classmethod
+    def _new_cards(
+        cls,
+        card_names: list[str],
+    ) -> list[Card]:
+        return Compendium.new_cards(
+            card_ids=Compendium.card_ids(
+                card_names=card_names,
+            ),
+        )
+
+
+class PerftResult(BaseModel):
+    position_name: str
+    depth: int
+    num_nodes: int  # Leaf nodes, at depth
+    num_terminal_nodes: int  # Games over before depth (a win, or no available moves), not counted as leaves
+    num_nodes_per_card: dict[str, int]  # By the card of the last move (push for a push move)
+    num_nodes_per_kind: dict[str, int]  # By the MoveKind of the last move
+    num_nodes_per_root_move: dict[str, int] | None = None  # Set when divided by root move
+    runtime_sec: float
+
+    def nodes_per_sec(self) -> float:
+        return self.num_nodes / self.runtime_sec if self.runtime_sec else 0.0
+
+
+class Perft:
+    """
+    Walk the full game tree to a fixed depth and count the leaf nodes, by card and move kind of the last move.
+    Moves are generated with Helper.get_available_moves and made / unmade on a single board, as in search.
+
+    A position is a leaf at depth, or earlier once the game is over: a win of the last mover,
+    or no available moves for the side to move (pass turn is not walked).
+    The counts of the reference positions are the regression oracle of move generation,
+    the runtime its throughput benchmark.
+    """
+
+    # Known counts, must stay the same under any move generation change.
+    REFERENCE_POSITIONS = [
+        PerftPosition(
+            name="start_no_cards",
+            board=Board.new().copy_board(),
+            expected_num_nodes={1: 5, 2: 25, 3: 125, 4: 620},
+        ),
+        PerftPosition(
+            name="start_3_cards",
+            board=Board.new().copy_board(),
+            white_card_names=["knight", "tank", "wall"],
+            black_card_names=["bishop", "fire", "spawn"],
+            expected_num_nodes={1: 24, 2: 786, 3: 11575, 4: 215079},
+        ),
+        PerftPosition(
+            name="middlegame_5_cards",
+            board=[
+                ["W", "W", ".", "W", "#"],
+                [".", ".", "W", ".", "."],
+                [".", "B", ".", ".", "."],
+                [".", ".", ".", "B", "."],
+                ["B", ".", "B", ".", "B"],
+            ],
+            white_card_names=["kamikaze", "forklift", "jump", "dagger", "charge"],
+            black_card_names=["knife", "catapult", "sidestep", "peace", "wall"],
+            expected_num_nodes={1: 41, 2: 1117, 3: 21826, 4: 354964},
+        ),
+    ]
+
+    @classmethod
+    def get_reference_position(
+        cls,
+        name: str,
+    ) -> PerftPosition:
+        for position in cls.REFERENCE_POSITIONS:
+            if position.name == name:
+                return position
+        raise KeyError(name)
+
+    @classmethod
+    def run_position(
+        cls,
+        position: PerftPosition,
+        depth: int,
+        divide: bool = False,
+    ) -> PerftResult:
+        white_cards, black_cards = position.cards()
+        return cls.run(
+            board=position.new_board(),
+            white_cards=white_cards,
+            black_cards=black_cards,
+            depth=depth,
+            player_turn=position.player_turn,
+            divide=divide,
+            position_name=position.name,
+        )
+
+    @classmethod
+    def run(
+        cls,
+        board: Board,
+        white_cards: list[Card],
+        black_cards: list[Card],
+        depth: int,
+        player_turn: PlayerSign = PlayerSign.white,
+        divide: bool = False,
+        position_name: str = "",
+    ) -> PerftResult:
+        """
+        The board is walked in-place and restored.
+        """
+        assert depth >= 1
+        walk = _PerftWalk(
+            cards_per_player={
+                PlayerSign.white: white_cards,
+                PlayerSign.black: black_cards,
+            },
+            num_allowed_playable_cards=min(len(white_cards), len(black_cards)),
+        )
+        num_nodes_per_root_move = Counter() if divide else None
+        start_time = time.perf_counter()
+        for move in walk.get_moves(
+            board=board,
+            player_sign=player_turn,
+        ):
+            num_nodes_before = walk.num_nodes
+            walk.visit(
+                board=board,
+                move=move,
+                depth=depth - 1,
+            )
+            if divide:
+                num_nodes_per_root_move[walk.move_name(move=move)] += walk.num_nodes - num_nodes_before
+        runtime_sec = time.perf_counter() - start_time
+        return PerftResult(
+            position_name=position_name,
+            depth=depth,
+            num_nodes=walk.num_nodes,
+            num_terminal_nodes=walk.num_terminal_nodes,
+            num_nodes_per_card=dict(walk.num_nodes_per_card),
+            num_nodes_per_kind={
+                MoveKind(kind).name: num_nodes
+                for kind, num_nodes in sorted(walk.num_nodes_per_kind.items())
+            },
+            num_nodes_per_root_move=dict(num_nodes_per_root_move) if divide else None,
+            runtime_sec=runtime_sec,
+        )
+
+
+class _PerftWalk:
+    __slots__ = (
+        "_cards_per_player",
+        "_num_allowed_playable_cards",
+        "num_nodes",
+        "num_terminal_nodes",
+        "num_nodes_per_card",
+        "num_nodes_per_kind",
+    )
+
+    def __init__(
+        self,
+        cards_per_player: dict[PlayerSign, list[Card]],
+        num_allowed_playable_cards: int,
+    ):
+        self._cards_per_player = cards_per_player
+        self._num_allowed_playable_cards = num_allowed_playable_cards
+        self.num_nodes = 0
+        self.num_terminal_nodes = 0
+        self.num_nodes_per_card: Counter[str] = Counter()
+        self.num_nodes_per_kind: Counter[int] = Counter()
+
+    def get_moves(
+        self,
+        board: Board,
+        player_sign: PlayerSign,
+    ) -> list[Move]:
+        return Helper.get_available_moves(
+            player_sign=player_sign,
+            board=board,
+            cards=self._cards_per_player[player_sign],
+            num_allowed_playable_cards=self._num_allowed_playable_cards,
+        )
+
+    def move_name(
+        self,
+        move: Move,
+    ) -> str:
+        card_index = move.used_card_index
+        if card_index is None:
+            return f"{PUSH_MOVE_NAME}: {move.description}"
+        return f"{self._cards_per_player[move.player_sign][card_index].name}: {move.description}"
+
+    def visit(
+        self,
+        board: Board,
+        move: Move,
+        depth: int,
+    ):
+        if depth == 0:
+            self._count_leaf(
+                move=move,
+            )
+            return
+
+        board.make_move(
+            move=move,
+        )
+        try:
+            if BitboardUtils.is_player_win(
+                player_sign=move.player_sign,
+                pawns=board.pawns_mask(
+                    player_sign=move.player_sign,
+                ),
+            ):
+                self.num_terminal_nodes += 1
+                return
+            moves = self.get_moves(
+                board=board,
+                player_sign=BoardUtils.inverse_player_sign(player_sign=move.player_sign),
+            )
+            if not moves:
+                self.num_terminal_nodes += 1
+                return
+            for child_move in moves:
+                self.visit(
+                    board=board,
+                    move=child_move,
+                    depth=depth - 1,
+                )
+        finally:
+            board.unmake_move()
+
+    def _count_leaf(
+        self,
+        move: Move,
+    ):
+        code = move.code
+        self.num_nodes += 1
+        self.num_nodes_per_kind[code >> 10 & 0b1111] += 1
+        card_slot = code >> 14
+        self.num_nodes_per_card[
+            self._cards_per_player[move.player_sign][card_slot - 1].name
+            if card_slot
+            else PUSH_MOVE_NAME
+        ] += 1
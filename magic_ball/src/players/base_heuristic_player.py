@@ -1,11 +1,14 @@
+import numpy as np
+
 from board import Board
+from board_utils import BoardUtils
 from cards.card import Card
 from helper import Helper
 from models import PlayerSign
 from move import Move
 from players.player import Player, NoAvailableMoves
 from players.player_config import PlayerConfig
-from scores.scorer import Scorer
+from scores.batch_scorer import BatchScorer, CandidateBatch
 
 
 class BaseHeuristicPlayer(Player):
@@ -20,17 +23,49 @@ class BaseHeuristicPlayer(Player):
         super().__init__(
             player_sign=player_sign,
         )
-        self._scorer = Scorer(
+        self._scorer = BatchScorer(
             player_sign=player_sign,
             config=config,
         )
 
+    @property
+    def scorer(self) -> BatchScorer:
+        return self._scorer
+
     def find_move(
         self,
         board: Board,
         player_cards: list[Card],
         opponent_cards: list[Card],
     ) -> Move:
+        candidates = self.get_candidates(
+            board=board,
+            player_cards=player_cards,
+            opponent_cards=opponent_cards,
+        )
+        scores = self._scorer.score_candidates(
+            candidates=candidates,
+        )
+        # First best move on ties, as max() would pick.
+        best_move = candidates.moves[int(np.argmax(scores))]
+
+        # Debug logs:
+        # print(f"{best_move.description}: {scores.max()}")
+        # if best_move.used_card_index is not None:
+        #     for score, move in zip(scores, candidates.moves):
+        #         print(f"\t{move.description}: {score}")
+
+        return best_move
+
+    def get_candidates(
+        self,
+        board: Board,
+        player_cards: list[Card],
+        opponent_cards: list[Card],
+    ) -> CandidateBatch:
+        """
+        All available moves, to be scored in one batch (the game board is left untouched).
+        """
         num_allowed_playable_cards = min(len(player_cards), len(opponent_cards))
         available_moves = Helper.get_available_moves(
             board=board,
@@ -41,40 +76,13 @@ class BaseHeuristicPlayer(Player):
         if not available_moves:
             raise NoAvailableMoves()
 
-        used_player_cards = [
-            card
-            for card in player_cards
-            if card.already_used
-        ]
-        used_opponent_cards = [
-            card
-            for card in opponent_cards
-            if card.already_used
-        ]
-
-        scores_and_moves = [
-            (
-                self._scorer.score_board(
-                    board=move.result_board,
-                    ball_position=move.result_ball_position,
-                    num_used_player_cards=len(used_player_cards) + 1 if move.used_card_index is not None else 0,
-                    num_used_opponent_cards=len(used_opponent_cards),
-                    num_allowed_playable_cards=num_allowed_playable_cards,
-                ),
-                move,
-            )
-            for move in available_moves
-        ]
-
-        best_score, best_move = max(
-            scores_and_moves,
-            key=lambda scores_and_move: scores_and_move[0],
+        return CandidateBatch.from_moves(
+            moves=available_moves,
+            num_used_player_cards=board.num_used_cards(
+                player_sign=self._player_sign,
+            ),
+            num_used_opponent_cards=board.num_used_cards(
+                player_sign=BoardUtils.inverse_player_sign(player_sign=self._player_sign),
+            ),
+            num_allowed_playable_cards=num_allowed_playable_cards,
         )
-
-        # Debug logs:
-        # print(f"{best_move.description}: {best_score}")
-        # if best_move.used_card_index is not None:
-        #     for score, move in scores_and_moves:
-        #         print(f"\t{move.description}: {score}")
-
-        return best_move
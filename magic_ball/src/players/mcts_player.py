@@ -0,0 +1,393 @@
+from __future__ import annotations
+
+import math
+import random
+import time
+
+from bitboard_utils import BitboardUtils
+from board import Board
+from board_utils import BoardUtils
+from cards.card import Card
+from cards.cards_config import RulesConfig
+from helper import Helper
+from models import PlayerSign, MoveKind
+from move import Move
+from players.player import Player, NoAvailableMoves
+from players.player_config import PlayerConfig, MctsConfig, RolloutPolicy
+from zobrist import Zobrist
+
+
+class MctsNode:
+    """
+    Value is counted for the player who moved into the node: 1 per won playout, 0.5 per draw.
+    """
+
+    __slots__ = ("move", "player_sign", "key", "parent", "children", "untried_moves", "num_visits", "value")
+
+    def __init__(
+        self,
+        move: Move | None,
+        player_sign: PlayerSign,
+        key: int,
+        parent: MctsNode | None = None,
+    ):
+        self.move = move
+        self.player_sign = player_sign  # Player who played the move into this node
+        self.key = key  # Position hash, with the side to move
+        self.parent = parent
+        self.children: list[MctsNode] = []
+        self.untried_moves: list[Move] | None = None  # Generated on first expansion
+        self.num_visits = 0
+        self.value = 0.0
+
+    def uct_child(
+        self,
+        exploration_constant: float,
+    ) -> MctsNode:
+        log_num_visits = math.log(self.num_visits)
+        return max(
+            self.children,
+            key=lambda child: (
+                child.value / child.num_visits
+                + exploration_constant * math.sqrt(log_num_visits / child.num_visits)
+            ),
+        )
+
+
+class MctsPlayer(Player):
+    """
+    Monte Carlo tree search with UCT selection and cheap random rollouts.
+    Runs playouts until the playout budget or the per-move deadline, whatever comes first,
+    then plays the most visited move.
+
+    The tree below the played move is kept, and reused on the next turn if the opponent's move is in it.
+    Moves are made and unmade on the game board itself (card usage included), it is restored after every playout.
+    A position with no available moves for the side to move ends the game: pass turn is not searched,
+    games that allow it are rejected.
+    """
+
+    def __init__(
+        self,
+        player_sign: PlayerSign,
+        config: PlayerConfig,
+        rules_config: RulesConfig | None = None,
+    ):
+        if rules_config is not None and rules_config.allow_pass_turn:
+            raise ValueError("MCTS player does not support allow_pass_turn.")
+        super().__init__(
+            player_sign=player_sign,
+        )
+        self._mcts_config = config.mcts_config or MctsConfig()
+        # Own generator, seeded from the global one unless set, so simulations remain reproducible.
+        self._random = random.Random(
+            self._mcts_config.seed
+            if self._mcts_config.seed is not None
+            else random.getrandbits(64)
+        )
+        self._cards_per_player: dict[PlayerSign, list[Card]] = {}
+        self._num_allowed_playable_cards = 0
+        self._root: MctsNode | None = None
+        self._num_playouts = 0
+
+    def set_cards(self, cards: list[Card]):
+        super().set_cards(
+            cards=cards,
+        )
+        self._root = None
+
+    @property
+    def num_playouts(self) -> int:
+        """
+        Number of playouts run by the last search.
+        """
+        return self._num_playouts
+
+    @property
+    def root(self) -> MctsNode | None:
+        return self._root
+
+    def find_move(
+        self,
+        board: Board,
+        player_cards: list[Card],
+        opponent_cards: list[Card],
+    ) -> Move:
+        self._num_allowed_playable_cards = min(len(player_cards), len(opponent_cards))
+        self._cards_per_player = {
+            self._player_sign: self._cards,
+            BoardUtils.inverse_player_sign(player_sign=self._player_sign): opponent_cards,
+        }
+        root = self._get_root(
+            board=board,
+        )
+        if root.untried_moves is None:
+            root.untried_moves = self._get_available_moves(
+                player_sign=self._player_sign,
+                board=board,
+            )
+        if not root.children and not root.untried_moves:
+            raise NoAvailableMoves()
+
+        self._num_playouts = 0
+        # Rollouts from any move may all be wins, don't leave an immediate win to chance.
+        for move in root.untried_moves + [child.move for child in root.children]:
+            if self._is_winning_move(move=move):
+                self._root = None
+                return move
+
+        if self._mcts_config.num_playouts is None and self._mcts_config.time_budget_ms is None:
+            raise RuntimeError("MCTS player requires a playout budget or a time budget.")
+        deadline = (
+            time.perf_counter() + self._mcts_config.time_budget_ms / 1000
+            if self._mcts_config.time_budget_ms is not None
+            else None
+        )
+        while (
+            (self._mcts_config.num_playouts is None or self._num_playouts < self._mcts_config.num_playouts)
+            and (deadline is None or time.perf_counter() < deadline)
+        ):
+            self._playout(
+                root=root,
+                board=board,
+            )
+            self._num_playouts += 1
+
+        if root.children:
+            best_child = max(
+                root.children,
+                key=lambda child: child.num_visits,
+            )
+        else:
+            # Not even one playout within the budget.
+            best_child = self._add_child(
+                node=root,
+                move=root.untried_moves.pop(),
+            )
+
+        # Keep the subtree of the played move for the next turn.
+        best_child.parent = None
+        self._root = best_child
+        return best_child.move
+
+    def _get_root(
+        self,
+        board: Board,
+    ) -> MctsNode:
+        key = board.position_hash ^ Zobrist.side_to_move_key(
+            player_turn=self._player_sign,
+        )
+        if self._root is not None:
+            if self._root.key == key:
+                return self._root
+            for child in self._root.children:
+                if child.key == key:
+                    child.parent = None
+                    return child
+        return MctsNode(
+            move=None,
+            player_sign=BoardUtils.inverse_player_sign(player_sign=self._player_sign),
+            key=key,
+        )
+
+    def _playout(
+        self,
+        root: MctsNode,
+        board: Board,
+    ):
+        num_made_moves = 0
+        try:
+            # Selection.
+            node = root
+            while not node.untried_moves and node.children:
+                node = node.uct_child(
+                    exploration_constant=self._mcts_config.exploration_constant,
+                )
+                board.make_move(move=node.move)
+                num_made_moves += 1
+
+            # Expansion.
+            player_sign = BoardUtils.inverse_player_sign(player_sign=node.player_sign)
+            winner = self._winner(
+                board=board,
+            )
+            if winner is None and node.untried_moves is None:
+                node.untried_moves = self._get_available_moves(
+                    player_sign=player_sign,
+                    board=board,
+                )
+            if winner is None and node.untried_moves:
+                move = node.untried_moves.pop(self._random.randrange(len(node.untried_moves)))
+                node = self._add_child(
+                    node=node,
+                    move=move,
+                )
+                board.make_move(move=move)
+                num_made_moves += 1
+                player_sign = BoardUtils.inverse_player_sign(player_sign=player_sign)
+
+            # Rollout.
+            if winner is None:
+                winner, num_rollout_moves = self._rollout(
+                    board=board,
+                    player_sign=player_sign,
+                )
+                num_made_moves += num_rollout_moves
+        finally:
+            for _ in range(num_made_moves):
+                board.unmake_move()
+
+        # Backpropagation.
+        while node is not None:
+            node.num_visits += 1
+            if winner is None:
+                node.value += 0.5
+            elif winner == node.player_sign:
+                node.value += 1
+            node = node.parent
+
+    @classmethod
+    def _add_child(
+        cls,
+        node: MctsNode,
+        move: Move,
+    ) -> MctsNode:
+        child = MctsNode(
+            move=move,
+            player_sign=move.player_sign,
+            key=move.result_hash ^ Zobrist.side_to_move_key(
+                player_turn=BoardUtils.inverse_player_sign(player_sign=move.player_sign),
+            ),
+            parent=node,
+        )
+        node.children.append(child)
+        return child
+
+    def _rollout(
+        self,
+        board: Board,
+        player_sign: PlayerSign,
+    ) -> tuple[PlayerSign | None, int]:
+        """
+        Play random moves until the game ends, return the winner (None for a draw) and the number of made moves.
+        """
+        for num_made_moves in range(self._mcts_config.max_rollout_plies):
+            winner = self._winner(
+                board=board,
+            )
+            if winner is not None:
+                return winner, num_made_moves
+            move = self._rollout_move(
+                board=board,
+                player_sign=player_sign,
+            )
+            if move is None:
+                return self._no_available_moves_winner(), num_made_moves
+            board.make_move(move=move)
+            player_sign = BoardUtils.inverse_player_sign(player_sign=player_sign)
+        return None, self._mcts_config.max_rollout_plies
+
+    def _rollout_move(
+        self,
+        board: Board,
+        player_sign: PlayerSign,
+    ) -> Move | None:
+        if self._mcts_config.rollout_policy == RolloutPolicy.heuristic:
+            # Push moves straight from the masks, full move generation only for card moves.
+            push_targets = BitboardUtils.push_targets(
+                player_sign=player_sign,
+                pawns=board.pawns_mask(
+                    player_sign=player_sign,
+                ),
+                vacant=board.vacant_mask,
+            )
+            winning_push_targets = push_targets & BitboardUtils.ROW_MASKS[4 if player_sign == PlayerSign.white else 0]
+            if winning_push_targets:
+                return self._push_move(
+                    player_sign=player_sign,
+                    target_square=next(BitboardUtils.iter_squares(mask=winning_push_targets)),
+                    board=board,
+                )
+            if push_targets and self._random.random() < self._mcts_config.rollout_push_probability:
+                return self._push_move(
+                    player_sign=player_sign,
+                    target_square=self._random.choice(list(BitboardUtils.iter_squares(mask=push_targets))),
+                    board=board,
+                )
+
+        moves = self._get_available_moves(
+            player_sign=player_sign,
+            board=board,
+        )
+        if not moves:
+            return None
+        return self._random.choice(moves)
+
+    @classmethod
+    def _push_move(
+        cls,
+        player_sign: PlayerSign,
+        target_square: int,
+        board: Board,
+    ) -> Move:
+        """
+        Rollout moves are played right away and dropped, so the live board is used as the source board (no clone).
+        """
+        return Move(
+            player_sign=player_sign,
+            code=Move.encode(
+                kind=MoveKind.push,
+                source_square=target_square + (-1 if player_sign == PlayerSign.white else 1),
+                target_square=target_square,
+            ),
+            source_board=board,
+        )
+
+    def _get_available_moves(
+        self,
+        player_sign: PlayerSign,
+        board: Board,
+    ) -> list[Move]:
+        return Helper.get_available_moves(
+            player_sign=player_sign,
+            board=board,
+            cards=self._cards_per_player[player_sign],
+            num_allowed_playable_cards=self._num_allowed_playable_cards,
+        )
+
+    @classmethod
+    def _is_winning_move(
+        cls,
+        move: Move,
+    ) -> bool:
+        white, black, _ = move.result_masks
+        return BitboardUtils.is_player_win(
+            player_sign=move.player_sign,
+            pawns=white if move.player_sign == PlayerSign.white else black,
+        )
+
+    @classmethod
+    def _winner(
+        cls,
+        board: Board,
+    ) -> PlayerSign | None:
+        for winner_player_sign in PlayerSign:
+            if BitboardUtils.is_player_win(
+                player_sign=winner_player_sign,
+                pawns=board.pawns_mask(
+                    player_sign=winner_player_sign,
+                ),
+            ):
+                return winner_player_sign
+        return None
+
+    def _no_available_moves_winner(self) -> PlayerSign | None:
+        """
+        Same outcome as the game status: defensive win (white first) or draw.
+        """
+        for defensive_player_sign in PlayerSign:
+            if all(
+                card.is_defensive
+                for card in self._cards_per_player[defensive_player_sign]
+            ):
+                return defensive_player_sign
+        return None
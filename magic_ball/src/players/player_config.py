@@ -4,11 +4,20 @@ from enum import StrEnum
 
 from pydantic import BaseModel
 
+from constants import DEFAULT_TRANSPOSITION_TABLE_NUM_ENTRIES
+
 
 class PlayerType(StrEnum):
     human = "human"
     random = "random"
     base_heuristic = "base_heuristic"
+    search = "search"
+    mcts = "mcts"
+
+
+class RolloutPolicy(StrEnum):
+    random = "random"
+    heuristic = "heuristic"  # Always play an immediately winning push, prefer pushes over card moves
 
 
 class ScoreMultipliers(BaseModel):
@@ -20,11 +29,51 @@ class ScoreMultipliers(BaseModel):
     no_cards_play_available_penalty_score: int
 
 
+class SearchConfig(BaseModel):
+    max_depth: int = 8
+    time_budget_ms: int | None = 200  # Per-move deadline, None for no deadline
+    max_nodes: int | None = None  # Per-move node budget, None for no budget
+    transposition_table_num_entries: int = DEFAULT_TRANSPOSITION_TABLE_NUM_ENTRIES
+
+
+class MctsConfig(BaseModel):
+    num_playouts: int | None = 2000  # Per-move playout budget, None for no budget
+    time_budget_ms: int | None = 200  # Per-move deadline, None for no deadline
+    exploration_constant: float = 1.4
+    rollout_policy: RolloutPolicy = RolloutPolicy.heuristic
+    rollout_push_probability: float = 0.8  # Heuristic policy: chance to play a random push if any
+    max_rollout_plies: int = 60  # Rollouts longer than that are scored as draws
+    seed: int | None = None
+
+
 class PlayerConfig(BaseModel):
     type: PlayerType
     score_multipliers: ScoreMultipliers | None = None
+    search_config: SearchConfig | None = None
+    mcts_config: MctsConfig | None = None
     random_tie_break: bool = True
 
+    def is_deterministic(self) -> bool:
+        """
+        True if the player's moves are a pure function of the game position and cards (no randomness, no clock).
+        """
+        match self.type:
+            case PlayerType.base_heuristic:
+                return not self.random_tie_break
+            case PlayerType.search:
+                return (
+                    self.search_config is not None
+                    and self.search_config.time_budget_ms is None
+                    and not self.random_tie_break
+                )
+            case PlayerType.mcts:
+                return (
+                    self.mcts_config is not None
+                    and self.mcts_config.seed is not None
+                    and self.mcts_config.time_budget_ms is None
+                )
+        return False
+
     @classmethod
     def human(cls) -> PlayerConfig:
         return PlayerConfig(
@@ -45,3 +94,24 @@ class PlayerConfig(BaseModel):
             ),
             random_tie_break=random_tie_break,
         )
+
+    @classmethod
+    def default_search_opponent(cls, time_budget_ms: int | None = 200) -> PlayerConfig:
+        return PlayerConfig(
+            type=PlayerType.search,
+            score_multipliers=cls.default_ai_opponent().score_multipliers,
+            search_config=SearchConfig(
+                time_budget_ms=time_budget_ms,
+            ),
+            # Leaf scores are stored in the transposition table, they must not be noisy.
+            random_tie_break=False,
+        )
+
+    @classmethod
+    def default_mcts_opponent(cls, time_budget_ms: int | None = 200) -> PlayerConfig:
+        return PlayerConfig(
+            type=PlayerType.mcts,
+            mcts_config=MctsConfig(
+                time_budget_ms=time_budget_ms,
+            ),
+        )
@@ -1,9 +1,12 @@
+from cards.cards_config import RulesConfig
 from models import PlayerSign
 from players.base_heuristic_player import BaseHeuristicPlayer
 from players.human_player import HumanPlayer
+from players.mcts_player import MctsPlayer
 from players.player import Player
 from players.player_config import PlayerConfig, PlayerType
 from players.random_player import RandomPlayer
+from players.search_player import SearchPlayer
 
 
 class PlayerFactory:
@@ -12,6 +15,7 @@ class PlayerFactory:
         cls,
         player_config: PlayerConfig,
         player_sign: PlayerSign,
+        rules_config: RulesConfig | None = None,
     ) -> Player:
         match player_config.type:
             case PlayerType.human:
@@ -27,4 +31,16 @@ class PlayerFactory:
                     player_sign=player_sign,
                     config=player_config,
                 )
+            case PlayerType.mcts:
+                return MctsPlayer(
+                    player_sign=player_sign,
+                    config=player_config,
+                    rules_config=rules_config,
+                )
+            case PlayerType.search:
+                return SearchPlayer(
+                    player_sign=player_sign,
+                    config=player_config,
+                    rules_config=rules_config,
+                )
         assert f"Invalid player type: {player_config.type}"
@@ -0,0 +1,371 @@
+import time
+
+from bitboard_utils import BitboardUtils
+from board import Board
+from board_utils import BoardUtils
+from cards.card import Card
+from cards.cards_config import RulesConfig
+from helper import Helper
+from models import PlayerSign, BoundType
+from move import Move
+from players.player import Player, NoAvailableMoves
+from players.player_config import PlayerConfig, SearchConfig
+from scores.scorer import Scorer
+from transposition_table import TranspositionTable
+from zobrist import Zobrist
+
+
+class SearchAborted(Exception):
+    pass
+
+
+class SearchPlayer(Player):
+    """
+    Negamax alpha-beta search over push and card moves, with the Scorer at the leaves.
+    Iterative deepening until max depth, the per-move deadline or the node budget, whatever comes first.
+    The best move of the last completed iteration is played.
+
+    Moves are made and unmade on the game board itself (card usage included), it is restored when the search ends.
+    The search sees the opponent cards it is given.
+    A position with no available moves for the side to move ends the game: pass turn is not searched,
+    games that allow it are rejected.
+    """
+
+    # Above any Scorer score, decreased per ply so the fastest win (and the slowest loss) is preferred.
+    TERMINAL_SCORE = 2 * Scorer.WINNING_SCORE
+    # Scores beyond it (either sign) are terminal, any Scorer score is below it.
+    TERMINAL_SCORE_THRESHOLD = 3 * Scorer.WINNING_SCORE // 2
+
+    def __init__(
+        self,
+        player_sign: PlayerSign,
+        config: PlayerConfig,
+        transposition_table: TranspositionTable | None = None,
+        rules_config: RulesConfig | None = None,
+    ):
+        if rules_config is not None and rules_config.allow_pass_turn:
+            raise ValueError("Search player does not support allow_pass_turn.")
+        super().__init__(
+            player_sign=player_sign,
+        )
+        self._search_config = config.search_config or SearchConfig()
+        self._scorers = {
+            sign: Scorer(
+                player_sign=sign,
+                config=config,
+            )
+            for sign in PlayerSign
+        }
+        self._transposition_table = transposition_table or TranspositionTable(
+            num_entries=self._search_config.transposition_table_num_entries,
+        )
+        self._cards_per_player: dict[PlayerSign, list[Card]] = {}
+        self._num_allowed_playable_cards = 0
+        self._deadline: float | None = None
+        self._num_nodes = 0
+        self._last_search_depth = 0
+        self._root_best_move: Move | None = None  # Of the current iteration, so far
+
+    def set_cards(self, cards: list[Card]):
+        super().set_cards(
+            cards=cards,
+        )
+        # Card indices of the position hash refer to the new cards.
+        self._transposition_table.clear()
+
+    @property
+    def transposition_table(self) -> TranspositionTable:
+        return self._transposition_table
+
+    @property
+    def num_nodes(self) -> int:
+        """
+        Number of nodes visited by the last search.
+        """
+        return self._num_nodes
+
+    @property
+    def last_search_depth(self) -> int:
+        """
+        Depth of the last completed iteration of the last search.
+        """
+        return self._last_search_depth
+
+    def find_move(
+        self,
+        board: Board,
+        player_cards: list[Card],
+        opponent_cards: list[Card],
+    ) -> Move:
+        self._num_allowed_playable_cards = min(len(player_cards), len(opponent_cards))
+        self._cards_per_player = {
+            self._player_sign: self._cards,
+            BoardUtils.inverse_player_sign(player_sign=self._player_sign): opponent_cards,
+        }
+        root_moves = self._get_available_moves(
+            player_sign=self._player_sign,
+            board=board,
+        )
+        if not root_moves:
+            raise NoAvailableMoves()
+
+        self._deadline = (
+            time.perf_counter() + self._search_config.time_budget_ms / 1000
+            if self._search_config.time_budget_ms is not None
+            else None
+        )
+        self._num_nodes = 0
+        self._last_search_depth = 0
+
+        best_move = root_moves[0]
+        for depth in range(1, self._search_config.max_depth + 1):
+            try:
+                best_move = self._search_root(
+                    board=board,
+                    root_moves=root_moves,
+                    depth=depth,
+                    first_move=best_move,
+                )
+            except SearchAborted:
+                if depth == 1 and self._root_best_move is not None:
+                    # Best of the root moves scored before the abort, rather than an unscored one.
+                    best_move = self._root_best_move
+                break
+            self._last_search_depth = depth
+        return best_move
+
+    def _search_root(
+        self,
+        board: Board,
+        root_moves: list[Move],
+        depth: int,
+        first_move: Move,
+    ) -> Move:
+        # Previous iteration best move first, for the most alpha-beta cutoffs.
+        ordered_moves = [first_move] + [
+            move
+            for move in root_moves
+            if move is not first_move
+        ]
+        alpha = -self.TERMINAL_SCORE - 1
+        beta = self.TERMINAL_SCORE + 1
+        self._root_best_move = None
+        for move in ordered_moves:
+            score = -self._negamax_child(
+                board=board,
+                move=move,
+                depth=depth - 1,
+                ply=1,
+                alpha=-beta,
+                beta=-alpha,
+            )
+            if score > alpha:
+                alpha = score
+                self._root_best_move = move
+        return self._root_best_move
+
+    def _negamax_child(
+        self,
+        board: Board,
+        move: Move,
+        depth: int,
+        ply: int,
+        alpha: float,
+        beta: float,
+    ) -> float:
+        board.make_move(
+            move=move,
+        )
+        try:
+            return self._negamax(
+                board=board,
+                player_sign=BoardUtils.inverse_player_sign(player_sign=move.player_sign),
+                depth=depth,
+                ply=ply,
+                alpha=alpha,
+                beta=beta,
+            )
+        finally:
+            board.unmake_move()
+
+    def _negamax(
+        self,
+        board: Board,
+        player_sign: PlayerSign,
+        depth: int,
+        ply: int,
+        alpha: float,
+        beta: float,
+    ) -> float:
+        """
+        Return the score of the board for the input player (to move).
+        """
+        self._check_budget()
+
+        if BitboardUtils.is_player_win(
+            player_sign=BoardUtils.inverse_player_sign(player_sign=player_sign),
+            pawns=board.pawns_mask(
+                player_sign=BoardUtils.inverse_player_sign(player_sign=player_sign),
+            ),
+        ):
+            return -(self.TERMINAL_SCORE - ply)
+
+        if depth == 0:
+            return self._evaluate(
+                board=board,
+                player_sign=player_sign,
+            )
+
+        key = board.position_hash ^ Zobrist.side_to_move_key(
+            player_turn=player_sign,
+        )
+        entry = self._transposition_table.probe(
+            key=key,
+        )
+        tt_move_code = None
+        if entry is not None:
+            tt_move_code = entry.move_code
+            if entry.depth >= depth:
+                entry_score = self._score_from_transposition_table(
+                    score=entry.score,
+                    ply=ply,
+                )
+                if entry.bound == BoundType.exact:
+                    return entry_score
+                if entry.bound == BoundType.lower and entry_score >= beta:
+                    return entry_score
+                if entry.bound == BoundType.upper and entry_score <= alpha:
+                    return entry_score
+
+        moves = self._get_available_moves(
+            player_sign=player_sign,
+            board=board,
+        )
+        if not moves:
+            return self._no_available_moves_score(
+                player_sign=player_sign,
+                ply=ply,
+            )
+        if tt_move_code is not None:
+            moves.sort(key=lambda move: move.code != tt_move_code)
+
+        original_alpha = alpha
+        best_score = -self.TERMINAL_SCORE - 1
+        best_move_code = None
+        for move in moves:
+            score = -self._negamax_child(
+                board=board,
+                move=move,
+                depth=depth - 1,
+                ply=ply + 1,
+                alpha=-beta,
+                beta=-alpha,
+            )
+            if score > best_score:
+                best_score = score
+                best_move_code = move.code
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+
+        if best_score <= original_alpha:
+            bound = BoundType.upper
+            best_move_code = None
+        elif best_score >= beta:
+            bound = BoundType.lower
+        else:
+            bound = BoundType.exact
+        self._transposition_table.store(
+            key=key,
+            depth=depth,
+            score=self._score_to_transposition_table(
+                score=best_score,
+                ply=ply,
+            ),
+            bound=bound,
+            move_code=best_move_code,
+        )
+        return best_score
+
+    @classmethod
+    def _score_to_transposition_table(
+        cls,
+        score: float,
+        ply: int,
+    ) -> float:
+        """
+        Terminal scores are stored relative to the stored position (plies to the end of the game from it),
+        not to the root, so that they stay right when the position is reached at another ply.
+        """
+        if score > cls.TERMINAL_SCORE_THRESHOLD:
+            return score + ply
+        if score < -cls.TERMINAL_SCORE_THRESHOLD:
+            return score - ply
+        return score
+
+    @classmethod
+    def _score_from_transposition_table(
+        cls,
+        score: float,
+        ply: int,
+    ) -> float:
+        if score > cls.TERMINAL_SCORE_THRESHOLD:
+            return score - ply
+        if score < -cls.TERMINAL_SCORE_THRESHOLD:
+            return score + ply
+        return score
+
+    def _check_budget(self):
+        self._num_nodes += 1
+        if self._search_config.max_nodes is not None and self._num_nodes > self._search_config.max_nodes:
+            raise SearchAborted()
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise SearchAborted()
+
+    def _get_available_moves(
+        self,
+        player_sign: PlayerSign,
+        board: Board,
+    ) -> list[Move]:
+        return Helper.get_available_moves(
+            player_sign=player_sign,
+            board=board,
+            cards=self._cards_per_player[player_sign],
+            num_allowed_playable_cards=self._num_allowed_playable_cards,
+        )
+
+    def _evaluate(
+        self,
+        board: Board,
+        player_sign: PlayerSign,
+    ) -> float:
+        return self._scorers[player_sign].score_board(
+            board=board,
+            ball_position=board.ball_position,
+            num_used_player_cards=board.num_used_cards(player_sign=player_sign),
+            num_used_opponent_cards=board.num_used_cards(
+                player_sign=BoardUtils.inverse_player_sign(player_sign=player_sign),
+            ),
+            num_allowed_playable_cards=self._num_allowed_playable_cards,
+        )
+
+    def _no_available_moves_score(
+        self,
+        player_sign: PlayerSign,
+        ply: int,
+    ) -> float:
+        """
+        Same outcome as the game status: defensive win (white first) or draw.
+        """
+        for defensive_player_sign in PlayerSign:
+            if all(
+                card.is_defensive
+                for card in self._cards_per_player[defensive_player_sign]
+            ):
+                return (
+                    self.TERMINAL_SCORE - ply
+                    if defensive_player_sign == player_sign
+                    else -(self.TERMINAL_SCORE - ply)
+                )
+        return 0
@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+import numpy as np
+
+from column_tables import ColumnTables
+from instrumentation import Instrumentation
+from models import PlayerSign, BallPosition, InstrumentationCategory
+from move import Move
+from scores.scorer import Scorer
+
+BALL_POSITION_CODES = {
+    BallPosition.white: 0,
+    BallPosition.middle: 1,
+    BallPosition.black: 2,
+}
+
+
+def _column_table_arrays(
+    player_sign: PlayerSign,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    ColumnTables entries as (free pawns, farthest free pawn distance, is single push to win, is win) arrays.
+    Impossible column codes are never looked up, they're left as no free pawns.
+    """
+    entries = [
+        entry if entry is not None else (0, -1, False, False)
+        for entry in ColumnTables.TABLES[player_sign]
+    ]
+    free_pawns, farthest, single_push_to_win, win = zip(*entries)
+    return (
+        np.array(free_pawns, dtype=np.int64),
+        np.array(farthest, dtype=np.int64),
+        np.array(single_push_to_win, dtype=bool),
+        np.array(win, dtype=bool),
+    )
+
+
+@dataclass(slots=True)
+class CandidateBatch:
+    """
+    Candidate moves with their result boards stacked into arrays, one entry per move, ready for BatchScorer.
+    """
+    moves: list[Move]
+    white: np.ndarray
+    black: np.ndarray
+    wall: np.ndarray
+    ball_positions: np.ndarray
+    num_used_player_cards: np.ndarray
+    num_used_opponent_cards: np.ndarray
+    num_allowed_playable_cards: np.ndarray
+
+    @classmethod
+    def from_moves(
+        cls,
+        moves: list[Move],
+        num_used_player_cards: int,
+        num_used_opponent_cards: int,
+        num_allowed_playable_cards: int,
+    ) -> CandidateBatch:
+        """
+        num_used_player_cards is the number of cards used before the move.
+        A card move is scored with one more used card, a push move with none (as the heuristic player always did).
+        """
+        masks = np.array(
+            [move.result_masks for move in moves],
+            dtype=np.int64,
+        ).reshape(-1, 3)
+        return CandidateBatch(
+            moves=moves,
+            white=masks[:, 0],
+            black=masks[:, 1],
+            wall=masks[:, 2],
+            ball_positions=np.array(
+                [BALL_POSITION_CODES[move.result_ball_position] for move in moves],
+                dtype=np.int64,
+            ),
+            num_used_player_cards=np.array(
+                [
+                    num_used_player_cards + 1 if move.used_card_index is not None else 0
+                    for move in moves
+                ],
+                dtype=np.int64,
+            ),
+            num_used_opponent_cards=np.full(len(moves), num_used_opponent_cards, dtype=np.int64),
+            num_allowed_playable_cards=np.full(len(moves), num_allowed_playable_cards, dtype=np.int64),
+        )
+
+    @classmethod
+    def concatenate(
+        cls,
+        batches: list[CandidateBatch],
+    ) -> CandidateBatch:
+        return CandidateBatch(
+            moves=[move for batch in batches for move in batch.moves],
+            white=np.concatenate([batch.white for batch in batches]),
+            black=np.concatenate([batch.black for batch in batches]),
+            wall=np.concatenate([batch.wall for batch in batches]),
+            ball_positions=np.concatenate([batch.ball_positions for batch in batches]),
+            num_used_player_cards=np.concatenate([batch.num_used_player_cards for batch in batches]),
+            num_used_opponent_cards=np.concatenate([batch.num_used_opponent_cards for batch in batches]),
+            num_allowed_playable_cards=np.concatenate([batch.num_allowed_playable_cards for batch in batches]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.moves)
+
+
+class BatchScorer(Scorer):
+    """
+    Score many boards at once with NumPy, same scores as Scorer.score_board for each board.
+    Boards are given as arrays of their white / black / wall masks, e.g. the result masks of all candidate moves.
+
+    The random tie-break values are drawn from the global random generator (unless given a draw_tie_breaks function),
+    as one list, in the same order score_board would draw them (player then opponent, for every board not won or lost),
+    so seeded games are identical with either scorer.
+    """
+
+    COLUMN_TABLE_ARRAYS = {
+        player_sign: _column_table_arrays(
+            player_sign=player_sign,
+        )
+        for player_sign in PlayerSign
+    }
+
+    def score_boards(
+        self,
+        white: np.ndarray,
+        black: np.ndarray,
+        wall: np.ndarray,
+        ball_positions: np.ndarray,
+        num_used_player_cards: np.ndarray,
+        num_used_opponent_cards: int | np.ndarray,
+        num_allowed_playable_cards: int | np.ndarray,
+        draw_tie_breaks: Callable[[np.ndarray], Sequence[float]] | None = None,
+    ) -> np.ndarray:
+        """
+        Masks are int64 arrays, ball positions are coded with BALL_POSITION_CODES.
+        Returns a float64 array of scores.
+
+        draw_tie_breaks gets the mask of the boards that need a tie-break,
+        and returns two values (player, opponent) per such board, in order.
+        """
+        occupied = white | black | wall
+        player_pawns, opponent_pawns = (
+            (white, black)
+            if self._player_sign == PlayerSign.white
+            else (black, white)
+        )
+        player_num_pawns, player_num_free_pawns, player_farthest, player_single_push_to_win, player_win = (
+            self._features(
+                player_sign=self._player_sign,
+                pawns=player_pawns,
+                occupied=occupied,
+            )
+        )
+        opponent_num_pawns, opponent_num_free_pawns, opponent_farthest, opponent_single_push_to_win, _ = (
+            self._features(
+                player_sign=self._opponent_player_sign,
+                pawns=opponent_pawns,
+                occupied=occupied,
+            )
+        )
+        is_ball_at_player = ball_positions == BALL_POSITION_CODES[BallPosition(self._player_sign)]
+        is_ball_at_opponent = ball_positions == BALL_POSITION_CODES[BallPosition(self._opponent_player_sign)]
+
+        # Winning / losing scores, see _num_moves_to_win and _num_opponent_moves_to_win.
+        is_player_free_push_to_win = (
+            is_ball_at_player
+            & (player_farthest >= 0)
+            & ((opponent_farthest < 0) | (player_farthest > opponent_farthest))
+        )
+        is_won = player_win | is_player_free_push_to_win
+        num_moves_to_win = np.where(player_win, 0, 4 - player_farthest)
+
+        is_opponent_free_push_to_win = (
+            is_ball_at_opponent
+            & (opponent_farthest >= 0)
+            & ((player_farthest < 0) | (opponent_farthest >= player_farthest))
+        )
+        is_lost = ~is_won & (opponent_single_push_to_win | is_opponent_free_push_to_win)
+        num_opponent_moves_to_win = np.where(opponent_single_push_to_win, 1, 4 - opponent_farthest)
+
+        # Not won yet by either side, see _score_board_for_player.
+        is_ongoing = ~(is_won | is_lost)
+        score_multipliers = self._config.score_multipliers
+        player_score = (
+            self._board_scores(
+                num_pawns=player_num_pawns,
+                num_free_pawns=player_num_free_pawns,
+                farthest=player_farthest,
+            )
+            + np.where(is_ball_at_player, score_multipliers.ball_position_score, 0)
+            + self._used_cards_scores(
+                num_used_cards=num_used_player_cards,
+                num_allowed_playable_cards=num_allowed_playable_cards,
+            )
+        )
+        opponent_score = (
+            self._board_scores(
+                num_pawns=opponent_num_pawns,
+                num_free_pawns=opponent_num_free_pawns,
+                farthest=opponent_farthest,
+            )
+            + np.where(is_ball_at_opponent, score_multipliers.ball_position_score, 0)
+            + self._used_cards_scores(
+                num_used_cards=np.asarray(num_used_opponent_cards, dtype=np.int64),
+                num_allowed_playable_cards=num_allowed_playable_cards,
+            )
+        )
+        player_tie_break = np.zeros(len(white))
+        opponent_tie_break = np.zeros(len(white))
+        if self._config.random_tie_break:
+            tie_breaks = np.array(
+                draw_tie_breaks(is_ongoing)
+                if draw_tie_breaks is not None
+                else [random.random() for _ in range(2 * int(is_ongoing.sum()))],
+                dtype=np.float64,
+            )
+            player_tie_break[is_ongoing] = tie_breaks[0::2]
+            opponent_tie_break[is_ongoing] = tie_breaks[1::2]
+        ongoing_scores = (player_score + player_tie_break) - (opponent_score + opponent_tie_break)
+
+        return np.where(
+            is_won,
+            self.WINNING_SCORE - 10 * num_moves_to_win,
+            np.where(
+                is_lost,
+                self.LOSING_SCORE + 10 * num_opponent_moves_to_win,
+                ongoing_scores,
+            ),
+        ).astype(np.float64)
+
+    def score_candidates(
+        self,
+        candidates: CandidateBatch,
+        draw_tie_breaks: Callable[[np.ndarray], Sequence[float]] | None = None,
+    ) -> np.ndarray:
+        if Instrumentation.counters is not None:
+            Instrumentation.counters.count(
+                category=InstrumentationCategory.scoring,
+                key="batch_boards",
+                num=len(candidates),
+            )
+        with Instrumentation.timer(
+            category=InstrumentationCategory.scoring,
+            key="score_candidates",
+        ):
+            return self.score_boards(
+                white=candidates.white,
+                black=candidates.black,
+                wall=candidates.wall,
+                ball_positions=candidates.ball_positions,
+                num_used_player_cards=candidates.num_used_player_cards,
+                num_used_opponent_cards=candidates.num_used_opponent_cards,
+                num_allowed_playable_cards=candidates.num_allowed_playable_cards,
+                draw_tie_breaks=draw_tie_breaks,
+            )
+
+    @classmethod
+    def _features(
+        cls,
+        player_sign: PlayerSign,
+        pawns: np.ndarray,
+        occupied: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return number of pawns, number of free pawns, farthest free pawn distance (-1 if none),
+        is single push to win and is win arrays, see BoardFeatures.
+        """
+        free_pawns_table, farthest_table, single_push_to_win_table, win_table = cls.COLUMN_TABLE_ARRAYS[player_sign]
+        free_pawns = np.zeros_like(pawns)
+        farthest = np.full(len(pawns), -1, dtype=np.int64)
+        single_push_to_win = np.zeros(len(pawns), dtype=bool)
+        win = np.zeros(len(pawns), dtype=bool)
+        for shift in ColumnTables.COLUMN_SHIFTS:
+            codes = (pawns >> shift) & 0b11111 | ((occupied >> shift) & 0b11111) << 5
+            free_pawns |= free_pawns_table[codes] << shift
+            np.maximum(farthest, farthest_table[codes], out=farthest)
+            single_push_to_win |= single_push_to_win_table[codes]
+            win |= win_table[codes]
+        return (
+            np.bitwise_count(pawns).astype(np.int64),
+            np.bitwise_count(free_pawns).astype(np.int64),
+            farthest,
+            single_push_to_win,
+            win,
+        )
+
+    def _board_scores(
+        self,
+        num_pawns: np.ndarray,
+        num_free_pawns: np.ndarray,
+        farthest: np.ndarray,
+    ) -> np.ndarray:
+        score_multipliers = self._config.score_multipliers
+        return (
+            num_pawns * score_multipliers.score_per_pawn
+            + num_free_pawns * score_multipliers.score_per_free_pawn
+            + np.where(
+                farthest >= 0,
+                farthest * score_multipliers.free_pawn_score_per_distance_from_start_tile,
+                0,
+            )
+        )
+
+    def _used_cards_scores(
+        self,
+        num_used_cards: np.ndarray,
+        num_allowed_playable_cards: int | np.ndarray,
+    ) -> np.ndarray:
+        score_multipliers = self._config.score_multipliers
+        return (
+            score_multipliers.penalty_score_per_used_card * num_used_cards
+            + np.where(
+                num_used_cards == num_allowed_playable_cards,
+                score_multipliers.no_cards_play_available_penalty_score,
+                0,
+            )
+        )
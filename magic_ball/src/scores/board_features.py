@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from board import Board
+from column_tables import ColumnTables
+from models import PlayerSign
+
+
+@dataclass(slots=True)
+class PlayerFeatures:
+    num_pawns: int
+    free_pawns: int  # Mask, see BitboardUtils.free_pawns
+    num_free_pawns: int
+    farthest_free_pawn_distance: int | None  # Rows from the start row, None if there are no free pawns
+    is_win: bool
+    is_single_push_to_win: bool
+
+
+@dataclass(slots=True)
+class BoardFeatures:
+    """
+    Everything the Scorer reads from the board, for both players, computed once per scored board
+    in a single scan of the columns (see ColumnTables).
+    """
+    white: PlayerFeatures
+    black: PlayerFeatures
+
+    @classmethod
+    def extract(
+        cls,
+        board: Board,
+    ) -> BoardFeatures:
+        white = board.white_mask
+        black = board.black_mask
+        occupied = board.occupied_mask
+        white_table = ColumnTables.TABLES[PlayerSign.white]
+        black_table = ColumnTables.TABLES[PlayerSign.black]
+
+        white_free_pawns = black_free_pawns = 0
+        white_farthest = black_farthest = -1
+        white_single_push_to_win = black_single_push_to_win = False
+        white_win = black_win = False
+        for shift in ColumnTables.COLUMN_SHIFTS:
+            occupied_code = ((occupied >> shift) & 0b11111) << 5
+            free_pawns, farthest, single_push_to_win, win = white_table[(white >> shift) & 0b11111 | occupied_code]
+            white_free_pawns |= free_pawns << shift
+            white_farthest = max(white_farthest, farthest)
+            white_single_push_to_win |= single_push_to_win
+            white_win |= win
+            free_pawns, farthest, single_push_to_win, win = black_table[(black >> shift) & 0b11111 | occupied_code]
+            black_free_pawns |= free_pawns << shift
+            black_farthest = max(black_farthest, farthest)
+            black_single_push_to_win |= single_push_to_win
+            black_win |= win
+
+        return BoardFeatures(
+            white=PlayerFeatures(
+                num_pawns=white.bit_count(),
+                free_pawns=white_free_pawns,
+                num_free_pawns=white_free_pawns.bit_count(),
+                farthest_free_pawn_distance=white_farthest if white_farthest >= 0 else None,
+                is_win=white_win,
+                is_single_push_to_win=white_single_push_to_win,
+            ),
+            black=PlayerFeatures(
+                num_pawns=black.bit_count(),
+                free_pawns=black_free_pawns,
+                num_free_pawns=black_free_pawns.bit_count(),
+                farthest_free_pawn_distance=black_farthest if black_farthest >= 0 else None,
+                is_win=black_win,
+                is_single_push_to_win=black_single_push_to_win,
+            ),
+        )
+
+    def player(
+        self,
+        player_sign: PlayerSign,
+    ) -> PlayerFeatures:
+        return (
+            self.white
+            if player_sign == PlayerSign.white
+            else self.black
+        )
@@ -1,9 +1,12 @@
 import random
+import time
 
+from board import Board
 from board_utils import BoardUtils
-from helper import Helper
-from models import PlayerSign, BoardType, BallPosition, TileType
+from instrumentation import Instrumentation
+from models import PlayerSign, BoardType, BallPosition, InstrumentationCategory
 from players.player_config import PlayerConfig
+from scores.board_features import BoardFeatures, PlayerFeatures
 
 
 class Scorer:
@@ -22,7 +25,7 @@ class Scorer:
 
     def score_board(
         self,
-        board: BoardType,
+        board: Board | BoardType,
         ball_position: BallPosition,
         num_used_player_cards: int,
         num_used_opponent_cards: int,
@@ -33,18 +36,54 @@ class Scorer:
         Method: score board for each player and reduce the opponent score from the player score.
         This means: positive score means player has the advantage and negative score means the opponent has advantage.
         """
+        counters = Instrumentation.counters
+        if counters is None:
+            return self._score_board(
+                board=board,
+                ball_position=ball_position,
+                num_used_player_cards=num_used_player_cards,
+                num_used_opponent_cards=num_used_opponent_cards,
+                num_allowed_playable_cards=num_allowed_playable_cards,
+            )
+        start_time = time.perf_counter()
+        score = self._score_board(
+            board=board,
+            ball_position=ball_position,
+            num_used_player_cards=num_used_player_cards,
+            num_used_opponent_cards=num_used_opponent_cards,
+            num_allowed_playable_cards=num_allowed_playable_cards,
+        )
+        counters.add_time(
+            category=InstrumentationCategory.scoring,
+            key="score_board",
+            runtime_sec=time.perf_counter() - start_time,
+        )
+        return score
+
+    def _score_board(
+        self,
+        board: Board | BoardType,
+        ball_position: BallPosition,
+        num_used_player_cards: int,
+        num_used_opponent_cards: int,
+        num_allowed_playable_cards: int,
+    ) -> float:
+        features = BoardFeatures.extract(
+            board=Board.wrap(board),
+        )
+
         # Return winning/losing score is board is won by either side.
         # For player win, decrease score if number of moves to win is higher.
         # For opponent win, increase score if number of opponent moves to win is higher.
         winning_score = self._winning_score(
-            board=board,
+            features=features,
             ball_position=ball_position,
         )
         if winning_score is not None:
             return winning_score
 
         losing_score = self._losing_score(
-            board=board,
+            features=features,
             ball_position=ball_position,
         )
         if losing_score is not None:
@@ -53,17 +92,19 @@ class Scorer:
         # Game is not won yet by either side.
 
         board_score_for_player = self._score_board_for_player(
+            player_features=features.player(
+                player_sign=self._player_sign,
+            ),
             player_sign=self._player_sign,
-            board=board,
             ball_position=ball_position,
             num_used_cards=num_used_player_cards,
             num_allowed_playable_cards=num_allowed_playable_cards,
         )
         board_score_for_opponent = self._score_board_for_player(
-            player_sign=BoardUtils.inverse_player_sign(
-                player_sign=self._player_sign,
+            player_features=features.player(
+                player_sign=self._opponent_player_sign,
             ),
-            board=board,
+            player_sign=self._opponent_player_sign,
             ball_position=ball_position,
             num_used_cards=num_used_opponent_cards,
             num_allowed_playable_cards=num_allowed_playable_cards,
@@ -72,11 +113,11 @@ class Scorer:
 
     def _winning_score(
         self,
-        board: BoardType,
+        features: BoardFeatures,
         ball_position: BallPosition,
     ) -> int | None:
         num_moves_to_win = self._num_moves_to_win(
-            board=board,
+            features=features,
             ball_position=ball_position,
         )
         if num_moves_to_win is None:
@@ -85,36 +126,32 @@ class Scorer:
 
     def _num_moves_to_win(
         self,
-        board: BoardType,
+        features: BoardFeatures,
         ball_position: BallPosition,
     ) -> int | None:
-        # No more moves, the board is won by player.
-        if BoardUtils.is_player_win(
+        player_features = features.player(
             player_sign=self._player_sign,
-            board=board,
-        ):
+        )
+        # No more moves, the board is won by player.
+        if player_features.is_win:
             return 0
 
         if not self._is_player_free_push_to_win(
-            board=board,
+            features=features,
             ball_position=ball_position,
         ):
             # Game is not won.
             return None
 
-        free_player_pawn_distances_from_start_tile = self._get_free_pawn_distances_from_start_tile(
-            player_sign=self._player_sign,
-            board=board,
-        )
-        return 4 - max(free_player_pawn_distances_from_start_tile)
+        return 4 - player_features.farthest_free_pawn_distance
 
     def _losing_score(
         self,
-        board: BoardType,
+        features: BoardFeatures,
         ball_position: BallPosition,
     ) -> int | None:
         num_opponent_moves_to_win = self._num_opponent_moves_to_win(
-            board=board,
+            features=features,
             ball_position=ball_position,
         )
         if num_opponent_moves_to_win is None:
@@ -123,32 +160,28 @@ class Scorer:
 
     def _num_opponent_moves_to_win(
         self,
-        board: BoardType,
+        features: BoardFeatures,
         ball_position: BallPosition,
     ) -> int | None:
-        # The opponent has a single push move to win.
-        if BoardUtils.is_player_single_push_to_win(
+        opponent_features = features.player(
             player_sign=self._opponent_player_sign,
-            board=board,
-        ):
+        )
+        # The opponent has a single push move to win.
+        if opponent_features.is_single_push_to_win:
             return 1
 
         if not self._is_opponent_free_push_to_win(
-            board=board,
+            features=features,
             ball_position=ball_position,
         ):
             # Game is not lost.
             return None
 
-        free_opponent_pawn_distances_from_start_tile = self._get_free_pawn_distances_from_start_tile(
-            player_sign=self._opponent_player_sign,
-            board=board,
-        )
-        return 4 - max(free_opponent_pawn_distances_from_start_tile)
+        return 4 - opponent_features.farthest_free_pawn_distance
 
     def _is_player_free_push_to_win(
         self,
-        board: BoardType,
+        features: BoardFeatures,
         ball_position: BallPosition,
     ) -> bool:
         """
@@ -164,27 +197,23 @@ class Scorer:
         ):
             return False
 
-        free_player_pawn_distances_from_start_tile = self._get_free_pawn_distances_from_start_tile(
+        farthest_free_player_pawn_distance = features.player(
             player_sign=self._player_sign,
-            board=board,
-        )
-        if not free_player_pawn_distances_from_start_tile:
+        ).farthest_free_pawn_distance
+        if farthest_free_player_pawn_distance is None:
             return False
 
-        free_opponent_pawn_distances_from_start_tile = self._get_free_pawn_distances_from_start_tile(
+        farthest_free_opponent_pawn_distance = features.player(
             player_sign=self._opponent_player_sign,
-            board=board,
-        )
-        if not free_opponent_pawn_distances_from_start_tile:
+        ).farthest_free_pawn_distance
+        if farthest_free_opponent_pawn_distance is None:
             return True
 
-        farthest_free_opponent_pawn_distance = max(free_opponent_pawn_distances_from_start_tile)
-        farthest_free_player_pawn_distance = max(free_player_pawn_distances_from_start_tile)
         return farthest_free_player_pawn_distance > farthest_free_opponent_pawn_distance
 
     def _is_opponent_free_push_to_win(
         self,
-        board: BoardType,
+        features: BoardFeatures,
         ball_position: BallPosition,
     ) -> bool:
         """
@@ -200,28 +229,24 @@ class Scorer:
         ):
             return False
 
-        free_opponent_pawn_distances_from_start_tile = self._get_free_pawn_distances_from_start_tile(
+        farthest_free_opponent_pawn_distance = features.player(
             player_sign=self._opponent_player_sign,
-            board=board,
-        )
-        if not free_opponent_pawn_distances_from_start_tile:
+        ).farthest_free_pawn_distance
+        if farthest_free_opponent_pawn_distance is None:
             return False
 
-        free_player_pawn_distances_from_start_tile = self._get_free_pawn_distances_from_start_tile(
+        farthest_free_player_pawn_distance = features.player(
             player_sign=self._player_sign,
-            board=board,
-        )
-        if not free_player_pawn_distances_from_start_tile:
+        ).farthest_free_pawn_distance
+        if farthest_free_player_pawn_distance is None:
             return True
 
-        farthest_free_opponent_pawn_distance = max(free_opponent_pawn_distances_from_start_tile)
-        farthest_free_player_pawn_distance = max(free_player_pawn_distances_from_start_tile)
         return farthest_free_opponent_pawn_distance >= farthest_free_player_pawn_distance
 
     def _score_board_for_player(
         self,
+        player_features: PlayerFeatures,
         player_sign: PlayerSign,
-        board: BoardType,
         ball_position: BallPosition,
         num_used_cards: int,
         num_allowed_playable_cards: int,
@@ -229,8 +254,7 @@ class Scorer:
 
         return (
             self._board_score(
-                player_sign=player_sign,
-                board=board,
+                player_features=player_features,
             )
             + self._ball_score(
                 player_sign=player_sign,
@@ -245,81 +269,17 @@ class Scorer:
 
     def _board_score(
         self,
-        player_sign: PlayerSign,
-        board: BoardType,
+        player_features: PlayerFeatures,
     ) -> int:
-        pawn_indices = Helper.get_pawn_indices(
-            player_sign=player_sign,
-            board=board,
-        )
-        free_pawn_distances_from_start_tile = self._get_free_pawn_distances_from_start_tile(
-            player_sign=player_sign,
-            board=board,
-        )
-
-        num_pawns_score = len(pawn_indices) * self._config.score_multipliers.score_per_pawn
-        free_pawns_score = len(free_pawn_distances_from_start_tile) * self._config.score_multipliers.score_per_free_pawn
+        num_pawns_score = player_features.num_pawns * self._config.score_multipliers.score_per_pawn
+        free_pawns_score = player_features.num_free_pawns * self._config.score_multipliers.score_per_free_pawn
         free_pawns_distance_score = (
-            max(free_pawn_distances_from_start_tile) * self._config.score_multipliers.free_pawn_score_per_distance_from_start_tile
-            if free_pawn_distances_from_start_tile
+            player_features.farthest_free_pawn_distance * self._config.score_multipliers.free_pawn_score_per_distance_from_start_tile
+            if player_features.farthest_free_pawn_distance is not None
             else 0
         )
         return num_pawns_score + free_pawns_score + free_pawns_distance_score
 
-    @classmethod
-    def _get_free_pawn_distances_from_start_tile(
-        cls,
-        player_sign: PlayerSign,
-        board: BoardType,
-    ) -> list[int]:
-        """
-        Return list of "free pawns" distances from start tile for input player.
-        Every distance value represents a free pawn and how many tiles it's from the starting tile.
-        Example:
-            - player (white or black) has 2 free pawns, one at the starting row and one at row 3 (middle row).
-            - Return value: [0, 2]
-        """
-        pawn_indices = Helper.get_pawn_indices(
-            player_sign=player_sign,
-            board=board,
-        )
-        free_pawn_row_indices = [
-            row_i
-            for col_i, row_i in pawn_indices
-            if cls._is_free_pawn(
-                player_sign=player_sign,
-                board=board,
-                col_i=col_i,
-                row_i=row_i,
-            )
-        ]
-        return (
-            free_pawn_row_indices
-            if player_sign == PlayerSign.white
-            else [
-                4 - free_pawn_row_index
-                for free_pawn_row_index in free_pawn_row_indices
-            ]
-        )
-
-    @classmethod
-    def _is_free_pawn(
-        cls,
-        player_sign: PlayerSign,
-        board: BoardType,
-        col_i: int,
-        row_i: int,
-    ) -> bool:
-        rows_range = (
-            range(row_i + 1, 5)
-            if player_sign == PlayerSign.white
-            else range(row_i - 1, -1, -1)
-        )
-        return all(
-            board[target_row_i][col_i] == TileType.vacant
-            for target_row_i in rows_range
-        )
-
     def _ball_score(
         self,
         player_sign: PlayerSign,
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import os
+import pstats
+import re
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class SimulationProfiler:
+    """
+    Profile segments of a simulation script (a card, a strategy cell...), each with cProfile
+    and a periodic stack sampler. Per segment, in the output directory:
+    - <segment>.collapsed: sampled stacks, "frame;...;frame count" lines, for flamegraph tools
+      (flamegraph.pl, inferno, speedscope)
+    - <segment>.prof: cProfile stats, for pstats / snakeviz
+    - <segment>.txt: top functions by own time and by cumulative time
+
+    Only the calling thread is profiled, run the simulations in-process (a single worker).
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        top_n: int = 20,
+        sampling_interval_sec: float = 0.001,
+    ):
+        self._output_dir = output_dir
+        self._top_n = top_n
+        self._sampling_interval_sec = sampling_interval_sec
+        os.makedirs(output_dir, exist_ok=True)
+
+    @contextmanager
+    def profile(
+        self,
+        segment: str,
+    ) -> Iterator[None]:
+        sampler = _StackSampler(
+            thread_id=threading.get_ident(),
+            interval_sec=self._sampling_interval_sec,
+        )
+        profiler = cProfile.Profile()
+        sampler.start()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            sampler.stop()
+            self._write(
+                segment=segment,
+                profiler=profiler,
+                stack_counts=sampler.stack_counts,
+            )
+
+    def segment_path(
+        self,
+        segment: str,
+        extension: str,
+    ) -> str:
+        file_name = re.sub(r"[^\w.-]", "_", segment)
+        return os.path.join(self._output_dir, f"{file_name}.{extension}")
+
+    def _write(
+        self,
+        segment: str,
+        profiler: cProfile.Profile,
+        stack_counts: Counter[str],
+    ):
+        with open(self.segment_path(segment=segment, extension="collapsed"), 'w') as collapsed_file:
+            for stack, count in stack_counts.most_common():
+                collapsed_file.write(f"{stack} {count}\n")
+
+        profiler.dump_stats(self.segment_path(segment=segment, extension="prof"))
+
+        report = io.StringIO()
+        report.write(f"{segment}: {sum(stack_counts.values())} stack samples\n")
+        stats = pstats.Stats(profiler, stream=report)
+        stats.strip_dirs()
+        for sort_key in ["tottime", "cumulative"]:
+            report.write(f"\nTop {self._top_n} functions by {sort_key}:\n")
+            stats.sort_stats(sort_key).print_stats(self._top_n)
+        open(self.segment_path(segment=segment, extension="txt"), 'w').write(report.getvalue())
+
+
+class _StackSampler(threading.Thread):
+    """
+    Sample the stack of a thread every interval (as the GIL allows), counting each distinct stack.
+    """
+
+    def __init__(
+        self,
+        thread_id: int,
+        interval_sec: float,
+    ):
+        super().__init__(
+            daemon=True,
+        )
+        self._thread_id = thread_id
+        self._interval_sec = interval_sec
+        self._stop_event = threading.Event()
+        self.stack_counts: Counter[str] = Counter()
+
+    def run(self):
+        while not self._stop_event.wait(self._interval_sec):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            frame_names = []
+            while frame is not None:
+                code = frame.f_code
+                frame_names.append(f"{os.path.basename(code.co_filename)}:{code.co_qualname}")
+                frame = frame.f_back
+            # Root first, spaces would break the collapsed format.
+            self.stack_counts[";".join(reversed(frame_names)).replace(" ", "_")] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
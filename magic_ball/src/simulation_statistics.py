@@ -0,0 +1,59 @@
+import math
+from statistics import NormalDist
+
+
+class SimulationStatistics:
+    """
+    Binomial estimates of game outcome rates, for stopping simulations once results are clear.
+    """
+
+    @classmethod
+    def z_score(
+        cls,
+        confidence: float,
+    ) -> float:
+        """
+        Two-sided critical value, e.g. 1.96 for 0.95.
+        """
+        return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+    @classmethod
+    def wilson_interval(
+        cls,
+        num_successes: int,
+        num_trials: int,
+        confidence: float,
+    ) -> tuple[float, float]:
+        """
+        Wilson score interval of a rate, well behaved for rates close to 0 or 1 and for few trials.
+        """
+        if num_trials == 0:
+            return 0.0, 1.0
+        z = cls.z_score(
+            confidence=confidence,
+        )
+        rate = num_successes / num_trials
+        denominator = 1 + z ** 2 / num_trials
+        center = (rate + z ** 2 / (2 * num_trials)) / denominator
+        half_width = z * math.sqrt(rate * (1 - rate) / num_trials + z ** 2 / (4 * num_trials ** 2)) / denominator
+        return max(0.0, center - half_width), min(1.0, center + half_width)
+
+    @classmethod
+    def two_proportions_p_value(
+        cls,
+        num_successes_1: int,
+        num_trials_1: int,
+        num_successes_2: int,
+        num_trials_2: int,
+    ) -> float:
+        """
+        Two-sided p-value of the pooled two-proportion z-test (rates are equal under the null hypothesis).
+        """
+        if num_trials_1 == 0 or num_trials_2 == 0:
+            return 1.0
+        pooled_rate = (num_successes_1 + num_successes_2) / (num_trials_1 + num_trials_2)
+        standard_error = math.sqrt(pooled_rate * (1 - pooled_rate) * (1 / num_trials_1 + 1 / num_trials_2))
+        if standard_error == 0:
+            return 1.0
+        z = (num_successes_1 / num_trials_1 - num_successes_2 / num_trials_2) / standard_error
+        return 2 * (1 - NormalDist().cdf(abs(z)))
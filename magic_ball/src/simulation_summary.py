@@ -1,7 +1,10 @@
+from __future__ import annotations
+
 from pydantic import BaseModel
 
 from game_config import GameConfig
 from models import PlayerSign
+from simulation_statistics import SimulationStatistics
 
 
 class SimulationSummary(BaseModel):
@@ -11,6 +14,28 @@ class SimulationSummary(BaseModel):
     num_draws: int
     num_black_wins: int
     runtime_sec: float = 0.0
+    num_memoized_games: int = 0  # Deterministic games whose result was known from an earlier identical matchup
+    # Set by early-stopping runs: confidence level and interval of each outcome rate.
+    confidence: float | None = None
+    white_win_interval: tuple[float, float] | None = None
+    draw_interval: tuple[float, float] | None = None
+    black_win_interval: tuple[float, float] | None = None
+
+    @classmethod
+    def merge(
+        cls,
+        config: GameConfig,
+        summaries: list[SimulationSummary],
+    ) -> SimulationSummary:
+        return SimulationSummary(
+            config=config,
+            num_games=sum(summary.num_games for summary in summaries),
+            num_white_wins=sum(summary.num_white_wins for summary in summaries),
+            num_draws=sum(summary.num_draws for summary in summaries),
+            num_black_wins=sum(summary.num_black_wins for summary in summaries),
+            runtime_sec=sum(summary.runtime_sec for summary in summaries),
+            num_memoized_games=sum(summary.num_memoized_games for summary in summaries),
+        )
 
     def white_win_percentage(self) -> float:
         return self.num_white_wins / self.num_games * 100
@@ -24,3 +49,48 @@ class SimulationSummary(BaseModel):
             if player_sign == PlayerSign.white
             else self.black_win_percentage()
         )
+
+    def set_confidence_intervals(
+        self,
+        confidence: float,
+    ):
+        self.confidence = confidence
+        self.white_win_interval, self.draw_interval, self.black_win_interval = [
+            SimulationStatistics.wilson_interval(
+                num_successes=num_outcomes,
+                num_trials=self.num_games,
+                confidence=confidence,
+            )
+            for num_outcomes in [self.num_white_wins, self.num_draws, self.num_black_wins]
+        ]
+
+    def max_interval_half_width(self) -> float:
+        return max(
+            (high - low) / 2
+            for low, high in [self.white_win_interval, self.draw_interval, self.black_win_interval]
+        )
+
+    def num_wins(self, player_sign: PlayerSign) -> int:
+        return (
+            self.num_white_wins
+            if player_sign == PlayerSign.white
+            else self.num_black_wins
+        )
+
+
+class SimulationComparison(BaseModel):
+    summary: SimulationSummary
+    other_summary: SimulationSummary
+    player_sign: PlayerSign  # Compared win rate
+    confidence: float
+    p_value: float
+    is_decided: bool
+
+    def win_rate_difference(self) -> float:
+        """
+        Positive if the player wins more with the first config.
+        """
+        return (
+            self.summary.num_wins(player_sign=self.player_sign) / self.summary.num_games
+            - self.other_summary.num_wins(player_sign=self.player_sign) / self.other_summary.num_games
+        )
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from pydantic import BaseModel
+
+from constants import DEFAULT_TRANSPOSITION_TABLE_NUM_ENTRIES
+from models import BoundType, ReplacementPolicy
+
+
+class TranspositionTableEntry(NamedTuple):
+    key: int
+    depth: int
+    score: float
+    bound: BoundType
+    move_code: int | None  # Packed Move.code of the best move, if any
+
+
+class TranspositionTableStats(BaseModel):
+    num_entries: int
+    num_used_entries: int
+    num_probes: int
+    num_hits: int
+    num_misses: int
+    num_collisions: int  # Probes which found a different position in the entry slot
+    num_stores: int
+    num_replacements: int  # Stores which evicted a different position
+
+    def hit_rate(self) -> float:
+        return self.num_hits / self.num_probes if self.num_probes else 0.0
+
+
+class TranspositionTable:
+    """
+    Fixed size table of search results keyed by position hash (see Zobrist).
+    Entries live in a preallocated array, indexed by the low bits of the key, so memory never grows
+    beyond num_entries no matter how many positions are stored.
+    The full key is kept in the entry to tell index collisions apart from hits.
+    One table can be shared by several players (and by consecutive games of a simulation).
+    """
+
+    def __init__(
+        self,
+        num_entries: int = DEFAULT_TRANSPOSITION_TABLE_NUM_ENTRIES,
+        replacement_policy: ReplacementPolicy = ReplacementPolicy.depth_preferred,
+    ):
+        if num_entries < 1:
+            raise ValueError(f"Invalid number of entries: {num_entries}")
+        # Round down to a power of 2 so the index is a mask of the key.
+        self._num_entries = 1 << (num_entries.bit_length() - 1)
+        self._index_mask = self._num_entries - 1
+        self._replacement_policy = replacement_policy
+        self._entries: list[TranspositionTableEntry | None] = [None] * self._num_entries
+        self._num_used_entries = 0
+        self.reset_stats()
+
+    @property
+    def num_entries(self) -> int:
+        return self._num_entries
+
+    @property
+    def replacement_policy(self) -> ReplacementPolicy:
+        return self._replacement_policy
+
+    def probe(
+        self,
+        key: int,
+    ) -> TranspositionTableEntry | None:
+        self._num_probes += 1
+        entry = self._entries[key & self._index_mask]
+        if entry is None:
+            self._num_misses += 1
+            return None
+        if entry.key != key:
+            self._num_misses += 1
+            self._num_collisions += 1
+            return None
+        self._num_hits += 1
+        return entry
+
+    def store(
+        self,
+        key: int,
+        depth: int,
+        score: float,
+        bound: BoundType,
+        move_code: int | None = None,
+    ):
+        index = key & self._index_mask
+        entry = self._entries[index]
+        if entry is None:
+            self._num_used_entries += 1
+        elif entry.key != key:
+            if (
+                self._replacement_policy == ReplacementPolicy.depth_preferred
+                and entry.depth > depth
+            ):
+                return
+            self._num_replacements += 1
+        elif move_code is None:
+            # Same position searched again without a best move (e.g. fail-low), keep the known one.
+            move_code = entry.move_code
+
+        self._num_stores += 1
+        self._entries[index] = TranspositionTableEntry(
+            key=key,
+            depth=depth,
+            score=score,
+            bound=bound,
+            move_code=move_code,
+        )
+
+    def clear(self):
+        self._entries = [None] * self._num_entries
+        self._num_used_entries = 0
+
+    def reset_stats(self):
+        self._num_probes = 0
+        self._num_hits = 0
+        self._num_misses = 0
+        self._num_collisions = 0
+        self._num_stores = 0
+        self._num_replacements = 0
+
+    def stats(self) -> TranspositionTableStats:
+        return TranspositionTableStats(
+            num_entries=self._num_entries,
+            num_used_entries=self._num_used_entries,
+            num_probes=self._num_probes,
+            num_hits=self._num_hits,
+            num_misses=self._num_misses,
+            num_collisions=self._num_collisions,
+            num_stores=self._num_stores,
+            num_replacements=self._num_replacements,
+        )
@@ -0,0 +1,95 @@
+import random
+
+from bitboard_utils import BitboardUtils
+from constants import MAX_NUM_CARDS_PER_PLAYER, ZOBRIST_SEED
+from models import BallPosition, PlayerSign
+
+# Dedicated generator: the keys are fixed across runs and never touch the global random state.
+_keys_random = random.Random(ZOBRIST_SEED)
+
+
+class Zobrist:
+    """
+    64-bit Zobrist position hash: XOR of one random key per (tile type, square), ball position,
+    used card (per player and card index) and side to move (black).
+    Playing a move only XORs the keys of what changed, so the hash is maintained incrementally.
+    """
+
+    WHITE_KEYS = tuple(_keys_random.getrandbits(64) for _ in range(25))
+    BLACK_KEYS = tuple(_keys_random.getrandbits(64) for _ in range(25))
+    WALL_KEYS = tuple(_keys_random.getrandbits(64) for _ in range(25))
+    BALL_KEYS = {
+        ball_position: _keys_random.getrandbits(64)
+        for ball_position in BallPosition
+    }
+    CARD_USED_KEYS = {
+        player_sign: tuple(_keys_random.getrandbits(64) for _ in range(MAX_NUM_CARDS_PER_PLAYER))
+        for player_sign in PlayerSign
+    }
+    SIDE_TO_MOVE_KEY = _keys_random.getrandbits(64)
+
+    @classmethod
+    def hash_board(
+        cls,
+        white: int,
+        black: int,
+        wall: int,
+        ball_position: BallPosition,
+        white_used_cards: int = 0,
+        black_used_cards: int = 0,
+    ) -> int:
+        position_hash = cls.BALL_KEYS[ball_position] ^ cls.masks_delta(
+            white_delta=white,
+            black_delta=black,
+            wall_delta=wall,
+        )
+        for player_sign, used_cards in [(PlayerSign.white, white_used_cards), (PlayerSign.black, black_used_cards)]:
+            for card_index in BitboardUtils.iter_squares(mask=used_cards):
+                position_hash ^= cls.CARD_USED_KEYS[player_sign][card_index]
+        return position_hash
+
+    @classmethod
+    def masks_delta(
+        cls,
+        white_delta: int,
+        black_delta: int,
+        wall_delta: int,
+    ) -> int:
+        """
+        Return the XOR of the keys of all changed squares, deltas are XORs of old and new masks.
+        """
+        position_hash = 0
+        for square in BitboardUtils.iter_squares(mask=white_delta):
+            position_hash ^= cls.WHITE_KEYS[square]
+        for square in BitboardUtils.iter_squares(mask=black_delta):
+            position_hash ^= cls.BLACK_KEYS[square]
+        for square in BitboardUtils.iter_squares(mask=wall_delta):
+            position_hash ^= cls.WALL_KEYS[square]
+        return position_hash
+
+    @classmethod
+    def ball_delta(
+        cls,
+        old_ball_position: BallPosition,
+        new_ball_position: BallPosition,
+    ) -> int:
+        if old_ball_position == new_ball_position:
+            return 0
+        return cls.BALL_KEYS[old_ball_position] ^ cls.BALL_KEYS[new_ball_position]
+
+    @classmethod
+    def card_used_delta(
+        cls,
+        player_sign: PlayerSign,
+        card_index: int | None,
+    ) -> int:
+        if card_index is None:
+            return 0
+        return cls.CARD_USED_KEYS[player_sign][card_index]
+
+    @classmethod
+    def side_to_move_key(
+        cls,
+        player_turn: PlayerSign,
+    ) -> int:
+        return cls.SIDE_TO_MOVE_KEY if player_turn == PlayerSign.black else 0
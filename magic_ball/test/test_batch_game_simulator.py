@@ -0,0 +1,57 @@
+import random
+import unittest
+
+from parameterized import parameterized
+
+from batch_game_simulator import BatchGameSimulator
+from game_config import GameConfig
+from game_simulator import GameSimulator
+from players.player_config import PlayerConfig, PlayerType
+
+
+class TestBatchGameSimulator(unittest.TestCase):
+    @parameterized.expand([
+        (PlayerConfig.default_ai_opponent(), PlayerConfig.default_ai_opponent()),
+        (PlayerConfig.default_ai_opponent(), PlayerConfig(type=PlayerType.random)),
+        (PlayerConfig(type=PlayerType.random), PlayerConfig.default_ai_opponent(random_tie_break=False)),
+    ])
+    def test_same_summary_as_game_simulator(self, white_player: PlayerConfig, black_player: PlayerConfig):
+        config = GameConfig(
+            white_player=white_player,
+            black_player=black_player,
+        )
+        expected_summary = GameSimulator(
+            config=config,
+            memoize=False,
+        ).run(
+            num_games=20,
+            seed=5,
+        )
+        # Small batches, so finished games are replaced along the way.
+        summary = BatchGameSimulator(
+            config=config,
+            batch_size=6,
+        ).run(
+            num_games=20,
+            seed=5,
+        )
+        self.assertEqual(20, summary.num_games)
+        self.assertEqual(
+            (expected_summary.num_white_wins, expected_summary.num_draws, expected_summary.num_black_wins),
+            (summary.num_white_wins, summary.num_draws, summary.num_black_wins),
+        )
+
+    def test_run_keeps_global_random_state(self):
+        random.seed(1)
+        expected_value = random.random()
+        random.seed(1)
+        BatchGameSimulator(
+            config=GameConfig(
+                white_player=PlayerConfig.default_ai_opponent(),
+                black_player=PlayerConfig.default_ai_opponent(),
+            ),
+        ).run(
+            num_games=3,
+            seed=7,
+        )
+        self.assertEqual(expected_value, random.random())
@@ -0,0 +1,86 @@
+import random
+import unittest
+
+import numpy as np
+from parameterized import parameterized
+
+from board import Board
+from models import PlayerSign, BallPosition
+from players.player_config import PlayerConfig
+from scores.batch_scorer import BatchScorer, BALL_POSITION_CODES
+
+
+class TestBatchScorer(unittest.TestCase):
+    NUM_BOARDS = 300
+    NUM_ALLOWED_PLAYABLE_CARDS = 3
+
+    @classmethod
+    def _random_boards(cls, rng: random.Random) -> list[Board]:
+        boards = []
+        for _ in range(cls.NUM_BOARDS):
+            white = black = wall = 0
+            for square in range(25):
+                tile = rng.choice("WB#...")
+                if tile == "W":
+                    white |= 1 << square
+                elif tile == "B":
+                    black |= 1 << square
+                elif tile == "#":
+                    wall |= 1 << square
+            boards.append(
+                Board.from_masks(
+                    white=white,
+                    black=black,
+                    wall=wall,
+                    ball_position=rng.choice(list(BallPosition)),
+                )
+            )
+        return boards
+
+    @parameterized.expand([
+        (PlayerSign.white, False),
+        (PlayerSign.black, False),
+        (PlayerSign.white, True),
+        (PlayerSign.black, True),
+    ])
+    def test_same_scores_as_scorer(self, player_sign: PlayerSign, random_tie_break: bool):
+        scorer = BatchScorer(
+            player_sign=player_sign,
+            config=PlayerConfig.default_ai_opponent(
+                random_tie_break=random_tie_break,
+            ),
+        )
+        rng = random.Random(7)
+        boards = self._random_boards(rng=rng)
+        num_used_player_cards = [rng.randrange(self.NUM_ALLOWED_PLAYABLE_CARDS + 1) for _ in boards]
+
+        random.seed(11)
+        expected_scores = [
+            scorer.score_board(
+                board=board,
+                ball_position=board.ball_position,
+                num_used_player_cards=num_used_cards,
+                num_used_opponent_cards=1,
+                num_allowed_playable_cards=self.NUM_ALLOWED_PLAYABLE_CARDS,
+            )
+            for board, num_used_cards in zip(boards, num_used_player_cards)
+        ]
+        expected_next_random = random.random()
+
+        random.seed(11)
+        scores = scorer.score_boards(
+            white=np.array([board.white_mask for board in boards], dtype=np.int64),
+            black=np.array([board.black_mask for board in boards], dtype=np.int64),
+            wall=np.array([board.wall_mask for board in boards], dtype=np.int64),
+            ball_positions=np.array([BALL_POSITION_CODES[board.ball_position] for board in boards], dtype=np.int64),
+            num_used_player_cards=np.array(num_used_player_cards, dtype=np.int64),
+            num_used_opponent_cards=1,
+            num_allowed_playable_cards=self.NUM_ALLOWED_PLAYABLE_CARDS,
+        )
+        self.assertListEqual(expected_scores, scores.tolist())
+        # Same number of tie-break values drawn.
+        self.assertEqual(expected_next_random, random.random())
+        # Both won and lost boards are covered.
+        self.assertIn(BatchScorer.WINNING_SCORE, expected_scores)
+        self.assertTrue(any(score <= BatchScorer.LOSING_SCORE + 100 for score in expected_scores))
+
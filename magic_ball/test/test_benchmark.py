@@ -0,0 +1,65 @@
+import random
+import unittest
+
+from benchmark import Benchmark, BenchmarkReport, BenchmarkResult
+from models import BenchmarkKind
+
+
+class TestBenchmark(unittest.TestCase):
+    def setUp(self):
+        self.benchmark = Benchmark(
+            num_corpus_games=1,
+            num_macro_games=1,
+            num_throughput_games=2,
+            repeat=1,
+        )
+
+    def test_run(self):
+        random.seed(1)
+        expected_random_value = random.random()
+        random.seed(1)
+        report = self.benchmark.run(
+            kinds=[BenchmarkKind.micro, BenchmarkKind.throughput],
+        )
+        self.assertEqual(expected_random_value, random.random())
+        self.assertIn("card_moves_knight", report.results)
+        self.assertIn("helper_available_moves", report.results)
+        self.assertNotIn("ai_vs_ai_game_3v3_cards", report.results)
+        self.assertEqual(2, report.results["game_simulator_run"].num_iterations)
+        self.assertTrue(all(result.runtime_sec > 0 for result in report.results.values()))
+        self.assertEqual(report, BenchmarkReport.model_validate_json(report.model_dump_json()))
+
+    def test_compare(self):
+        baseline = self._report(
+            runtime_sec_per_case={"a": 1.0, "b": 1.0, "c": 1.0},
+        )
+        report = self._report(
+            runtime_sec_per_case={"a": 1.05, "b": 1.5, "c": 0.5, "new": 1.0},
+        )
+        comparisons = Benchmark.compare(
+            baseline=baseline,
+            report=report,
+            threshold=0.1,
+        )
+        self.assertEqual(["a", "b", "c"], [comparison.name for comparison in comparisons])
+        self.assertEqual([False, True, False], [comparison.is_regression for comparison in comparisons])
+        self.assertEqual([False, False, True], [comparison.is_improvement for comparison in comparisons])
+        self.assertAlmostEqual(1.5, comparisons[1].ratio())
+
+    @classmethod
+    def _report(
+        cls,
+        runtime_sec_per_case: dict[str, float],
+    ) -> BenchmarkReport:
+        return BenchmarkReport(
+            python_version="3",
+            results={
+                name: BenchmarkResult(
+                    name=name,
+                    kind=BenchmarkKind.micro,
+                    num_iterations=10,
+                    runtime_sec=runtime_sec,
+                )
+                for name, runtime_sec in runtime_sec_per_case.items()
+            },
+        )
@@ -0,0 +1,202 @@
+import unittest
+
+from parameterized import parameterized
+
+from board import Board
+from cards.card import Card
+from cards.compendium import Compendium
+from helper import Helper
+from models import PlayerSign, BallPosition
+
+
+class TestBoard(unittest.TestCase):
+    def setUp(self):
+        self.board = Board(
+            board=[
+                ["W", "W", ".", "W", "#"],
+                [".", ".", "W", ".", "."],
+                [".", "B", ".", ".", "."],
+                [".", ".", ".", "B", "."],
+                ["B", ".", "B", ".", "B"],
+            ],
+            ball_position=BallPosition.middle,
+        )
+
+    @parameterized.expand(PlayerSign.__members__.keys())
+    def test_make_unmake_all_moves(self, player_sign: PlayerSign):
+        cards = Compendium.get_cards()
+        available_moves = Helper.get_available_moves(
+            player_sign=player_sign,
+            board=self.board,
+            cards=cards,
+            num_allowed_playable_cards=len(cards),
+        )
+        self.assertTrue(available_moves)
+        expected_board = self.board.copy_board()
+        for move in available_moves:
+            self.board.make_move(
+                move=move,
+                cards=cards,
+            )
+            self.assertEqual(move.result_board.copy_board(), self.board.copy_board())
+            self.assertEqual(move.result_ball_position, self.board.ball_position)
+            if move.used_card_index is not None:
+                self.assertTrue(cards[move.used_card_index].already_used)
+                self.assertEqual(1 << move.used_card_index, self.board.used_cards_mask(player_sign=player_sign))
+
+            self.board.unmake_move()
+            self.assertEqual(expected_board, self.board.copy_board())
+            self.assertEqual(BallPosition.middle, self.board.ball_position)
+            self.assertFalse(any(card.already_used for card in cards))
+            self.assertEqual(0, self.board.used_cards_mask(player_sign=player_sign))
+
+    def test_nested_make_unmake(self):
+        expected_board = self.board.copy_board()
+        white_move, *_ = Helper.get_available_moves(
+            player_sign=PlayerSign.white,
+            board=self.board,
+            cards=[],
+            num_allowed_playable_cards=0,
+        )
+        self.board.make_move(
+            move=white_move,
+        )
+        black_move, *_ = Helper.get_available_moves(
+            player_sign=PlayerSign.black,
+            board=self.board,
+            cards=[],
+            num_allowed_playable_cards=0,
+        )
+        self.board.make_move(
+            move=black_move,
+        )
+        self.board.unmake_move()
+        self.assertEqual(white_move.result_board.copy_board(), self.board.copy_board())
+        self.board.unmake_move()
+        self.assertEqual(expected_board, self.board.copy_board())
+
+    def test_moves_cache(self):
+        cards = Compendium.get_cards()[:3]
+        available_moves = Helper.get_available_moves(
+            player_sign=PlayerSign.white,
+            board=self.board,
+            cards=cards,
+            num_allowed_playable_cards=len(cards),
+        )
+        cached_moves = Helper.get_available_moves(
+            player_sign=PlayerSign.white,
+            board=self.board,
+            cards=cards,
+            num_allowed_playable_cards=len(cards),
+        )
+        self.assertEqual(available_moves, cached_moves)
+        self.assertIsNot(available_moves, cached_moves)
+
+        # Other cards, other moves.
+        self.assertNotEqual(
+            available_moves,
+            Helper.get_available_moves(
+                player_sign=PlayerSign.white,
+                board=self.board,
+                cards=Compendium.get_cards()[3:6],
+                num_allowed_playable_cards=len(cards),
+            ),
+        )
+
+        # Cache is cleared once the board changes.
+        self.board.make_move(
+            move=available_moves[0],
+        )
+        self.assertNotIn(
+            available_moves[0].code,
+            [
+                move.code
+                for move in Helper.get_available_moves(
+                    player_sign=PlayerSign.white,
+                    board=self.board,
+                    cards=cards,
+                    num_allowed_playable_cards=len(cards),
+                )
+            ],
+        )
+
+    def test_used_cards_moves(self):
+        cards = Compendium.get_cards()[:3]
+        used_card_board = Board.from_masks(
+            white=self.board.white_mask,
+            black=self.board.black_mask,
+            wall=self.board.wall_mask,
+            ball_position=self.board.ball_position,
+            white_used_cards=0b1,
+        )
+        self.assertEqual(1, used_card_board.num_used_cards(player_sign=PlayerSign.white))
+        self.assertEqual(0, used_card_board.num_used_cards(player_sign=PlayerSign.black))
+        card_indices = self._card_move_indices(
+            board=self.board,
+            cards=cards,
+            num_allowed_playable_cards=len(cards),
+        )
+        self.assertIn(0, card_indices)
+        self.assertEqual(
+            card_indices - {0},
+            self._card_move_indices(
+                board=used_card_board,
+                cards=cards,
+                num_allowed_playable_cards=len(cards),
+            ),
+        )
+        # No more cards allowed.
+        self.assertEqual(
+            set(),
+            self._card_move_indices(
+                board=used_card_board,
+                cards=cards,
+                num_allowed_playable_cards=1,
+            ),
+        )
+
+    def test_has_available_moves(self):
+        blocked_board = Board(
+            board=[
+                ["W", ".", ".", ".", "."],
+                ["B", ".", ".", ".", "."],
+                [".", ".", ".", ".", "."],
+                [".", ".", ".", ".", "."],
+                [".", ".", ".", ".", "."],
+            ],
+            ball_position=BallPosition.middle,
+        )
+        self.assertFalse(
+            Helper.has_available_moves(
+                player_sign=PlayerSign.white,
+                board=blocked_board,
+                cards=[],
+                num_allowed_playable_cards=0,
+            )
+        )
+        self.assertTrue(
+            Helper.has_available_moves(
+                player_sign=PlayerSign.white,
+                board=self.board,
+                cards=[],
+                num_allowed_playable_cards=0,
+            )
+        )
+
+    @classmethod
+    def _card_move_indices(
+        cls,
+        board: Board,
+        cards: list[Card],
+        num_allowed_playable_cards: int,
+    ) -> set[int]:
+        return {
+            move.used_card_index
+            for move in Helper.get_available_moves(
+                player_sign=PlayerSign.white,
+                board=board,
+                cards=cards,
+                num_allowed_playable_cards=num_allowed_playable_cards,
+            )
+            if move.used_card_index is not None
+        }
@@ -0,0 +1,111 @@
+import unittest
+
+from parameterized import parameterized
+
+from bitboard_utils import BitboardUtils
+from board import Board
+from models import PlayerSign, BallPosition, TileType
+
+
+class TestBitboardUtils(unittest.TestCase):
+    def setUp(self):
+        self._board_example = [
+            ["W", "#", ".", "W", "."],
+            [".", ".", "B", ".", "B"],
+            [".", ".", "W", ".", "."],
+            [".", ".", ".", ".", "B"],
+            [".", "B", ".", "B", "B"],
+        ]
+
+    def test_board_type_round_trip(self):
+        white, black, wall = BitboardUtils.from_board_type(
+            board=self._board_example,
+        )
+        self.assertEqual(
+            self._board_example,
+            BitboardUtils.to_board_type(
+                white=white,
+                black=black,
+                wall=wall,
+            ),
+        )
+
+    def test_square_order_is_column_major(self):
+        board = Board(
+            board=self._board_example,
+            ball_position=BallPosition.middle,
+        )
+        expected_white_pawn_indices = [
+            (col_i, row_i)
+            for col_i in range(5)
+            for row_i in range(5)
+            if self._board_example[row_i][col_i] == TileType.white
+        ]
+        self.assertListEqual(
+            expected_white_pawn_indices,
+            BitboardUtils.indices(
+                mask=board.white_mask,
+            ),
+        )
+
+    @parameterized.expand(PlayerSign.__members__.keys())
+    def test_free_pawns(self, player_sign: PlayerSign):
+        board = Board(
+            board=self._board_example,
+            ball_position=BallPosition.middle,
+        )
+        free_pawns = BitboardUtils.free_pawns(
+            player_sign=player_sign,
+            pawns=board.pawns_mask(
+                player_sign=player_sign,
+            ),
+            occupied=board.occupied_mask,
+        )
+        expected_free_pawn_indices = (
+            [(0, 0), (2, 2)]
+            if player_sign == PlayerSign.white
+            else [(2, 1), (4, 1)]
+        )
+        self.assertListEqual(
+            expected_free_pawn_indices,
+            BitboardUtils.indices(
+                mask=free_pawns,
+            ),
+        )
+
+    @parameterized.expand(PlayerSign.__members__.keys())
+    def test_push_targets_starting_board(self, player_sign: PlayerSign):
+        board = Board.new()
+        push_targets = BitboardUtils.push_targets(
+            player_sign=player_sign,
+            pawns=board.pawns_mask(
+                player_sign=player_sign,
+            ),
+            vacant=board.vacant_mask,
+        )
+        expected_row_i = 1 if player_sign == PlayerSign.white else 3
+        self.assertEqual(BitboardUtils.ROW_MASKS[expected_row_i], push_targets)
+
+    def test_is_player_win(self):
+        board = Board(
+            board=[
+                ["W", ".", ".", ".", "."],
+                [".", ".", ".", ".", "."],
+                [".", ".", ".", ".", "."],
+                [".", ".", ".", ".", "."],
+                [".", "W", ".", ".", "B"],
+            ],
+            ball_position=BallPosition.middle,
+        )
+        self.assertTrue(
+            BitboardUtils.is_player_win(
+                player_sign=PlayerSign.white,
+                pawns=board.white_mask,
+            )
+        )
+        self.assertFalse(
+            BitboardUtils.is_player_win(
+                player_sign=PlayerSign.black,
+                pawns=board.black_mask,
+            )
+        )
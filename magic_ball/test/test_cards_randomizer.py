@@ -1,6 +1,8 @@
+import random
 import unittest
 
 from cards.cards_randomizer import CardsRandomizer
+from cards.compendium import Compendium
 from constants import DEFAULT_NUM_CARDS_PER_PLAYER
 
 
@@ -38,3 +40,34 @@ class TestCardsRandomizer(unittest.TestCase):
         self.assertEqual(5, len(black_cards))
         common_card_names = {card.name for card in white_cards} & {card.name for card in black_cards}
         self.assertSetEqual(set(), common_card_names)
+
+    def test_draw_card_ids_same_as_draw_cards(self):
+        random.seed(3)
+        white_card_ids, black_card_ids = CardsRandomizer.draw_card_ids(
+            white_card_names=["knight"],
+            cards_pull=["knight", "tank", "wall", "fire", "spawn", "bishop", "dagger"],
+        )
+        random.seed(3)
+        white_cards, black_cards = CardsRandomizer.draw_cards(
+            white_card_names=["knight"],
+            cards_pull=["knight", "tank", "wall", "fire", "spawn", "bishop", "dagger"],
+        )
+        self.assertEqual(Compendium.NAME_TO_CARD_ID["knight"], white_card_ids[0])
+        self.assertEqual(
+            [Compendium.CARD_NAMES[card_id] for card_id in white_card_ids + black_card_ids],
+            [card.name for card in white_cards + black_cards],
+        )
+
+    def test_new_cards(self):
+        card_ids = Compendium.card_ids(
+            card_names=["tank", "knife"],
+        )
+        cards = Compendium.new_cards(
+            card_ids=card_ids,
+        )
+        self.assertEqual(["tank", "knife"], [card.name for card in cards])
+        other_cards = Compendium.new_cards(
+            card_ids=card_ids,
+        )
+        self.assertIsNot(cards[0], other_cards[0])
+        self.assertEqual(Compendium.CARD_NAMES, [card.name for card in Compendium.get_cards()])
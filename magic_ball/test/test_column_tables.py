@@ -0,0 +1,86 @@
+import random
+import unittest
+
+from bitboard_utils import BitboardUtils
+from board import Board
+from column_tables import ColumnTables
+from models import PlayerSign, BallPosition, TileType
+from scores.board_features import BoardFeatures
+
+
+class TestColumnTables(unittest.TestCase):
+    def test_column_code(self):
+        board = Board(
+            board=[
+                ["W", ".", ".", ".", "."],
+                ["B", ".", ".", ".", "."],
+                [".", ".", ".", ".", "."],
+                ["#", ".", ".", ".", "."],
+                [".", ".", ".", ".", "W"],
+            ],
+            ball_position=BallPosition.middle,
+        )
+        self.assertEqual(
+            0b01011_00001,
+            ColumnTables.column_code(
+                pawns=board.white_mask,
+                occupied=board.occupied_mask,
+                col_i=0,
+            ),
+        )
+        free_pawns, farthest, single_push_to_win, win = ColumnTables.TABLES[PlayerSign.white][0b01011_00001]
+        self.assertEqual(0, free_pawns)
+        self.assertEqual(-1, farthest)
+        self.assertFalse(single_push_to_win)
+        self.assertFalse(win)
+        self.assertIsNone(ColumnTables.TABLES[PlayerSign.white][0b00000_00001])
+
+    def test_features_match_mask_predicates(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            board = Board(
+                board=[
+                    [
+                        rng.choice([TileType.white, TileType.black, TileType.vacant, TileType.vacant, TileType.wall])
+                        for _ in range(5)
+                    ]
+                    for _ in range(5)
+                ],
+                ball_position=BallPosition.middle,
+            )
+            features = BoardFeatures.extract(
+                board=board,
+            )
+            for player_sign in PlayerSign:
+                player_features = features.player(
+                    player_sign=player_sign,
+                )
+                pawns = board.pawns_mask(
+                    player_sign=player_sign,
+                )
+                free_pawns = BitboardUtils.free_pawns(
+                    player_sign=player_sign,
+                    pawns=pawns,
+                    occupied=board.occupied_mask,
+                )
+                self.assertEqual(free_pawns, player_features.free_pawns)
+                self.assertEqual(
+                    BitboardUtils.is_player_single_push_to_win(
+                        player_sign=player_sign,
+                        pawns=pawns,
+                        vacant=board.vacant_mask,
+                    ),
+                    player_features.is_single_push_to_win,
+                )
+                self.assertEqual(
+                    BitboardUtils.is_player_win(
+                        player_sign=player_sign,
+                        pawns=pawns,
+                    ),
+                    player_features.is_win,
+                )
+                distances = [
+                    row_i if player_sign == PlayerSign.white else 4 - row_i
+                    for _, row_i in BitboardUtils.indices(mask=free_pawns)
+                ]
+                self.assertEqual(max(distances, default=None), player_features.farthest_free_pawn_distance)
@@ -1,3 +1,5 @@
+import itertools
+import json
 import os
 import unittest
 
@@ -125,6 +127,47 @@ class TestGameManager(unittest.TestCase):
         self.assertEqual(game_summary.num_white_moves, 13)
         self.assertEqual(game_summary.final_ball_position, "middle")
 
+    def test_step_fixed_game(self):
+        """
+        Same game as test_fixed_game, played step by step (webpage mode plays no AI plies by itself).
+        """
+        filename = os.path.dirname(os.path.abspath(__file__))
+        config = GameConfig.model_validate(json.load(open(f"{filename}/../config/fixed_game.json")))
+        gm = GameManager(
+            config=config,
+            webpage_mode=True,
+        )
+        self.assertEqual([], gm._game_log)
+
+        first_move = gm.step()
+        self.assertEqual("A2", first_move.description)
+        self.assertEqual(PlayerSign.black, gm.player_turn)
+
+        # Pause after a few plies, then resume.
+        moves = list(itertools.islice(gm.iter_moves(), 4))
+        self.assertEqual(["A4", "B2", "A3", "knight: B2->A4"], [move.description for move in moves])
+        self.assertEqual(GameStatus.ongoing, gm.game_status)
+
+        moves = list(gm.iter_moves())
+        self.assertEqual(3, moves.count(None))  # White passes
+        self.assertFalse(gm.is_ai_turn)
+        game_summary = gm.export_summary()
+        self.assertEqual(game_summary.winner, "black")
+        self.assertEqual(game_summary.num_white_moves, 13)
+
+    def test_used_card_has_no_available_moves(self):
+        filename = os.path.dirname(os.path.abspath(__file__))
+        config = GameConfig.model_validate(json.load(open(f"{filename}/../config/fixed_game.json")))
+        gm = GameManager(
+            config=config,
+            webpage_mode=True,
+        )
+        moves = list(itertools.islice(gm.iter_moves(), 6))
+        self.assertEqual("knight: B2->A4", moves[4].description)
+        self.assertEqual(PlayerSign.white, gm.player_turn)
+        # The knight is used on the board, the card itself does not check it.
+        self.assertEqual([], gm.get_available_card_moves(card_index=0))
+
     def test_fixed_position_fire_loses(self):
         """
         In position:
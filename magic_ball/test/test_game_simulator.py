@@ -0,0 +1,132 @@
+import random
+import unittest
+
+from cards.cards_config import CardsConfig
+from game_config import GameConfig
+from game_simulator import GameSimulator
+from models import PlayerSign
+from players.player_config import PlayerConfig, PlayerType
+
+
+class TestGameSimulator(unittest.TestCase):
+    def setUp(self):
+        self.simulator = GameSimulator(
+            config=GameConfig(
+                white_player=PlayerConfig.default_ai_opponent(),
+                black_player=PlayerConfig(
+                    type=PlayerType.random,
+                ),
+            ),
+        )
+
+    def test_seeded_run_independent_of_workers(self):
+        serial_summary = self.simulator.run(
+            num_games=12,
+            seed=7,
+        )
+        parallel_summary = self.simulator.run(
+            num_games=12,
+            workers=3,
+            seed=7,
+        )
+        self.assertEqual(12, parallel_summary.num_games)
+        self.assertEqual(
+            (serial_summary.num_white_wins, serial_summary.num_draws, serial_summary.num_black_wins),
+            (parallel_summary.num_white_wins, parallel_summary.num_draws, parallel_summary.num_black_wins),
+        )
+        self.assertEqual(
+            12,
+            parallel_summary.num_white_wins + parallel_summary.num_draws + parallel_summary.num_black_wins,
+        )
+
+    def test_seeded_run_keeps_global_random_state(self):
+        random.seed(1)
+        expected_value = random.random()
+        random.seed(1)
+        self.simulator.run(
+            num_games=2,
+            seed=7,
+        )
+        self.assertEqual(expected_value, random.random())
+
+    def test_split_game_indices(self):
+        chunks = GameSimulator._split_game_indices(
+            game_indices=range(10),
+            num_chunks=4,
+        )
+        self.assertEqual(list(range(10)), [game_index for chunk in chunks for game_index in chunk])
+        self.assertEqual(4, len(chunks))
+
+    def test_run_until_confident(self):
+        summary = self.simulator.run_until_confident(
+            max_num_games=200,
+            target_half_width=0.15,
+            batch_size=10,
+            seed=3,
+        )
+        self.assertLess(summary.num_games, 200)
+        self.assertEqual(0.95, summary.confidence)
+        self.assertLessEqual(summary.max_interval_half_width(), 0.15)
+        low, high = summary.white_win_interval
+        self.assertLessEqual(low, summary.num_white_wins / summary.num_games)
+        self.assertGreaterEqual(high, summary.num_white_wins / summary.num_games)
+
+    def test_compare(self):
+        random_config = GameConfig(
+            white_player=PlayerConfig(
+                type=PlayerType.random,
+            ),
+            black_player=PlayerConfig(
+                type=PlayerType.random,
+            ),
+        )
+        comparison = self.simulator.compare(
+            other_config=random_config,
+            player_sign=PlayerSign.white,
+            max_num_games=200,
+            batch_size=20,
+            seed=3,
+        )
+        self.assertTrue(comparison.is_decided)
+        self.assertLess(comparison.summary.num_games, 200)
+        self.assertEqual(comparison.summary.num_games, comparison.other_summary.num_games)
+        self.assertGreater(comparison.win_rate_difference(), 0)
+
+    def test_memoize_deterministic_games(self):
+        config = GameConfig(
+            white_player=PlayerConfig.default_ai_opponent(
+                random_tie_break=False,
+            ),
+            black_player=PlayerConfig.default_ai_opponent(
+                random_tie_break=False,
+            ),
+            cards_config=CardsConfig(
+                white_card_names=["knight", "kamikaze"],
+                cards_pull=["knight", "kamikaze", "wall", "bishop", "knife", "sidestep"],
+            ),
+        )
+        self.assertTrue(config.is_deterministic())
+        memoized_summary = GameSimulator(
+            config=config,
+        ).run(
+            num_games=30,
+            seed=5,
+        )
+        summary = GameSimulator(
+            config=config,
+            memoize=False,
+        ).run(
+            num_games=30,
+            seed=5,
+        )
+        self.assertEqual(0, summary.num_memoized_games)
+        # Only 4 * 3! = 24 matchups (third white card, black cards order).
+        self.assertGreater(memoized_summary.num_memoized_games, 0)
+        self.assertEqual(
+            (summary.num_white_wins, summary.num_draws, summary.num_black_wins),
+            (memoized_summary.num_white_wins, memoized_summary.num_draws, memoized_summary.num_black_wins),
+        )
+
+    def test_not_deterministic(self):
+        self.assertFalse(self.simulator._config.is_deterministic())
+        self.assertIsNone(self.simulator._outcome_cache)
@@ -0,0 +1,60 @@
+import random
+import unittest
+
+from cards.cards_config import RulesConfig
+from cards.fire import Fire
+from cards.tank import Tank
+from game_config import GameConfig
+from game_manager import GameManager
+from game_state import GameState
+from headless_game import HeadlessGame
+from models import GameStatus, PlayerSign
+from players.player_config import PlayerConfig, PlayerType
+
+
+class TestGameState(unittest.TestCase):
+    def test_play_move_and_pass(self):
+        state = GameState(
+            white_cards=[Fire()],
+            black_cards=[Tank()],
+            rules_config=RulesConfig(),
+        )
+        fire_move, = state.white_cards[0].get_available_card_moves(
+            player_sign=PlayerSign.white,
+            board=state.board,
+            card_index=0,
+        )
+        state.play_move(
+            move=fire_move,
+        )
+        self.assertEqual(1, state.board.used_cards_mask(player_sign=PlayerSign.white))
+        self.assertEqual(PlayerSign.black, state.player_turn)
+        self.assertEqual(0, state.board.white_mask)
+
+        clone = state.clone()
+        state.complete_turn()
+        self.assertEqual(PlayerSign.white, state.player_turn)
+        self.assertEqual(PlayerSign.black, clone.player_turn)
+        self.assertEqual(state.board.position_hash, clone.board.position_hash)
+
+    def test_headless_game_same_as_game_manager(self):
+        config = GameConfig(
+            white_player=PlayerConfig.default_ai_opponent(),
+            black_player=PlayerConfig(
+                type=PlayerType.random,
+            ),
+        )
+        for seed in range(5):
+            random.seed(seed)
+            gm = GameManager.new(
+                config=config,
+            )
+            random.seed(seed)
+            game = HeadlessGame(
+                config=config,
+            )
+            winner = game.run_until_done()
+            self.assertNotEqual(GameStatus.ongoing, game.state.status)
+            self.assertEqual(gm.export_summary().winner, winner)
+            self.assertEqual(gm.board.copy_board(), game.state.board.copy_board())
+            self.assertEqual(gm.game_status, game.state.status)
@@ -0,0 +1,38 @@
+import unittest
+
+from parameterized import parameterized
+
+from geometry import Geometry
+
+
+class TestGeometry(unittest.TestCase):
+    @parameterized.expand([
+        # col_i, row_i, neighbors, diagonal neighbors, knight targets
+        (0, 0, [(0, 1), (1, 0)], [(1, 1)], [(1, 2), (2, 1)]),
+        (2, 2, [(2, 3), (2, 1), (3, 2), (1, 2)], [(3, 3), (3, 1), (1, 1), (1, 3)], 8),
+        (4, 1, [(4, 2), (4, 0), (3, 1)], [(3, 0), (3, 2)], [(2, 0), (2, 2), (3, 3)]),
+    ])
+    def test_neighbors(self, col_i, row_i, expected_neighbors, expected_diagonal_neighbors, expected_knight_targets):
+        square = col_i * 5 + row_i
+        self.assertEqual(tuple(expected_neighbors), Geometry.NEIGHBORS[square])
+        self.assertEqual(tuple(expected_diagonal_neighbors), Geometry.DIAGONAL_NEIGHBORS[square])
+        self.assertEqual(
+            Geometry.NEIGHBORS[square] + Geometry.DIAGONAL_NEIGHBORS[square],
+            Geometry.ADJACENT[square],
+        )
+        if isinstance(expected_knight_targets, int):
+            self.assertEqual(expected_knight_targets, len(Geometry.KNIGHT_TARGETS[square]))
+        else:
+            self.assertEqual(tuple(expected_knight_targets), Geometry.KNIGHT_TARGETS[square])
+
+    def test_two_steps(self):
+        self.assertEqual(((0, 1, 0, 2), (1, 0, 2, 0)), Geometry.TWO_STEPS[0])
+        self.assertEqual(((2, 3, 2, 2), (3, 4, 4, 4), (1, 4, 0, 4)), Geometry.TWO_STEPS[2 * 5 + 4])
+
+    def test_rays(self):
+        rays = Geometry.RAYS[1 * 5 + 3]
+        self.assertEqual(((1, 4),), rays[(0, 1)])
+        self.assertEqual(((1, 2), (1, 1), (1, 0)), rays[(0, -1)])
+        self.assertEqual(((2, 2), (3, 1), (4, 0)), rays[(1, -1)])
+        self.assertEqual(((0, 4),), rays[(-1, 1)])
+        self.assertEqual(8, len(rays))
@@ -0,0 +1,84 @@
+import json
+import unittest
+
+from game_config import GameConfig
+from game_simulator import GameSimulator
+from instrumentation import Instrumentation
+from models import InstrumentationCategory
+from players.player_config import PlayerConfig, PlayerType
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.simulator = GameSimulator(
+            config=GameConfig(
+                white_player=PlayerConfig.default_ai_opponent(),
+                black_player=PlayerConfig(
+                    type=PlayerType.random,
+                ),
+            ),
+        )
+
+    def test_collect_simulation(self):
+        with Instrumentation.collect() as counters:
+            summary = self.simulator.run(
+                num_games=5,
+                seed=3,
+            )
+        self.assertIsNone(Instrumentation.counters)
+        report = counters.report()
+        self.assertEqual(5, report.num_games)
+        self.assertEqual(
+            {
+                "white": summary.num_white_wins,
+                "draw": summary.num_draws,
+                "black": summary.num_black_wins,
+            },
+            {
+                winner: report.counts[InstrumentationCategory.games].get(winner, 0)
+                for winner in ["white", "draw", "black"]
+            },
+        )
+        self.assertEqual(
+            sum(report.counts[InstrumentationCategory.moves].values()) / 5,
+            report.moves_per_game,
+        )
+        self.assertEqual(
+            {"BaseHeuristicPlayer", "RandomPlayer"},
+            set(report.counts[InstrumentationCategory.find_move]),
+        )
+        self.assertTrue(report.counts[InstrumentationCategory.movegen])
+        self.assertEqual(
+            set(report.counts[InstrumentationCategory.movegen]),
+            set(report.times_sec[InstrumentationCategory.movegen]),
+        )
+        self.assertEqual(report.model_dump(), json.loads(counters.to_json()))
+
+    def test_nested_collect(self):
+        with Instrumentation.collect() as counters:
+            with Instrumentation.collect() as inner_counters:
+                self.simulator.run(
+                    num_games=2,
+                    seed=3,
+                )
+            self.simulator.run(
+                num_games=1,
+                seed=4,
+            )
+        self.assertEqual(2, inner_counters.report().num_games)
+        self.assertEqual(3, counters.report().num_games)
+
+    def test_same_games_when_collecting(self):
+        summary = self.simulator.run(
+            num_games=5,
+            seed=5,
+        )
+        with Instrumentation.collect():
+            collected_summary = self.simulator.run(
+                num_games=5,
+                seed=5,
+            )
+        self.assertEqual(
+            (summary.num_white_wins, summary.num_draws, summary.num_black_wins),
+            (collected_summary.num_white_wins, collected_summary.num_draws, collected_summary.num_black_wins),
+        )
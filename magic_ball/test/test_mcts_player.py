@@ -0,0 +1,127 @@
+import unittest
+
+from board import Board
+from cards.cards_config import RulesConfig
+from cards.compendium import Compendium
+from game_config import GameConfig
+from game_manager import GameManager
+from helper import Helper
+from models import BallPosition, GameStatus, PlayerSign
+from players.mcts_player import MctsPlayer
+from players.player_config import PlayerConfig, PlayerType, MctsConfig
+
+
+class TestMctsPlayer(unittest.TestCase):
+    def setUp(self):
+        self.board = Board(
+            board=[
+                [".", "W", ".", "W", "."],
+                [".", ".", ".", ".", "."],
+                ["W", ".", ".", ".", "."],
+                ["B", ".", ".", ".", "W"],
+                [".", "B", "B", "B", "."],
+            ],
+            ball_position=BallPosition.middle,
+        )
+
+    def test_play_winning_push(self):
+        player = self._mcts_player()
+        move = player.find_move(
+            board=self.board,
+            player_cards=[],
+            opponent_cards=[],
+        )
+        self.assertEqual("E5", move.description)
+        self.assertEqual(0, player.num_playouts)
+
+    def test_board_and_cards_restored(self):
+        player = self._mcts_player()
+        white_cards = Compendium.get_cards()[:3]
+        black_cards = Compendium.get_cards()[3:6]
+        player.set_cards(
+            cards=white_cards,
+        )
+        expected_board = self.board.copy_board()
+        expected_hash = self.board.position_hash
+        player.find_move(
+            board=self.board,
+            player_cards=white_cards,
+            opponent_cards=black_cards,
+        )
+        self.assertEqual(expected_board, self.board.copy_board())
+        self.assertEqual(expected_hash, self.board.position_hash)
+        self.assertFalse(any(card.already_used for card in white_cards + black_cards))
+
+    def test_subtree_reuse(self):
+        player = self._mcts_player()
+        board = Board.new()
+        white_move = player.find_move(
+            board=board,
+            player_cards=[],
+            opponent_cards=[],
+        )
+        played_node = player.root
+        board.play_move(
+            move=white_move,
+        )
+        black_move, *_ = Helper.get_available_moves(
+            player_sign=PlayerSign.black,
+            board=board,
+            cards=[],
+            num_allowed_playable_cards=0,
+        )
+        board.play_move(
+            move=black_move,
+        )
+        reused_node, = [
+            child
+            for child in played_node.children
+            if child.move.code == black_move.code
+        ]
+        num_reused_visits = reused_node.num_visits
+        self.assertGreater(num_reused_visits, 0)
+
+        player.find_move(
+            board=board,
+            player_cards=[],
+            opponent_cards=[],
+        )
+        self.assertIsNone(reused_node.parent)
+        self.assertEqual(num_reused_visits + 300, reused_node.num_visits)
+
+    def test_full_game(self):
+        gm = GameManager.new(
+            config=GameConfig(
+                white_player=PlayerConfig.default_mcts_opponent(
+                    time_budget_ms=10,
+                ),
+                black_player=PlayerConfig.default_ai_opponent(),
+            ),
+        )
+        self.assertNotEqual(GameStatus.ongoing, gm.game_status)
+
+    def test_pass_turn_not_supported(self):
+        with self.assertRaises(ValueError):
+            GameManager.new(
+                config=GameConfig(
+                    white_player=PlayerConfig.default_mcts_opponent(),
+                    black_player=PlayerConfig.default_ai_opponent(),
+                    rules_config=RulesConfig(
+                        allow_pass_turn=True,
+                    ),
+                ),
+            )
+
+    @staticmethod
+    def _mcts_player() -> MctsPlayer:
+        return MctsPlayer(
+            player_sign=PlayerSign.white,
+            config=PlayerConfig(
+                type=PlayerType.mcts,
+                mcts_config=MctsConfig(
+                    num_playouts=300,
+                    time_budget_ms=None,
+                    seed=0,
+                ),
+            ),
+        )
@@ -0,0 +1,37 @@
+import random
+import tracemalloc
+import unittest
+
+from game_config import GameConfig
+from memory_tracker import MemoryTracker, ALLOCATION_SITE_CATEGORIES
+from players.player_config import PlayerConfig, PlayerType
+
+
+class TestMemoryTracker(unittest.TestCase):
+    def test_measure(self):
+        random.seed(1)
+        expected_random_value = random.random()
+        random.seed(1)
+        report = MemoryTracker(
+            snapshot_every_num_plies=2,
+        ).measure(
+            config=GameConfig(
+                white_player=PlayerConfig.default_ai_opponent(),
+                black_player=PlayerConfig(
+                    type=PlayerType.random,
+                ),
+            ),
+            num_games=2,
+        )
+        self.assertEqual(expected_random_value, random.random())
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(2, report.num_games)
+        self.assertGreater(report.num_plies, 0)
+        self.assertGreater(report.mean_peak_bytes_per_ply, 0)
+        self.assertGreaterEqual(report.peak_bytes, report.mean_peak_bytes_per_game)
+        self.assertTrue(report.mean_live_bytes_per_category)
+        self.assertLessEqual(
+            set(report.mean_live_bytes_per_category),
+            set(ALLOCATION_SITE_CATEGORIES.values()) | {"other"},
+        )
+        self.assertTrue(report.top_sites)
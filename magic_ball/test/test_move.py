@@ -0,0 +1,104 @@
+import unittest
+
+from board import Board
+from cards.dagger import Dagger
+from cards.fire import Fire
+from cards.tank import Tank
+from helper import Helper
+from models import PlayerSign, BallPosition, MoveKind, TileType
+from move import Move
+
+
+class TestMove(unittest.TestCase):
+    def test_encode_decode(self):
+        code = Move.encode(
+            kind=MoveKind.tank,
+            source_square=7,
+            target_square=24,
+            card_index=9,
+        )
+        move = Move(
+            player_sign=PlayerSign.white,
+            code=code,
+            source_board=Board.new(),
+        )
+        self.assertEqual(MoveKind.tank, move.kind)
+        self.assertEqual(7, move.source_square)
+        self.assertEqual(24, move.target_square)
+        self.assertEqual(9, move.used_card_index)
+
+    def test_push_move(self):
+        board = Board.new()
+        move = Helper.generate_push_move(
+            player_sign=PlayerSign.black,
+            target_tile="C4",
+            board=board,
+        )
+        self.assertIsNone(move.used_card_index)
+        self.assertEqual("C4", move.description)
+        self.assertEqual(TileType.black, move.result_board[3][2])
+        self.assertEqual(TileType.vacant, move.result_board[4][2])
+        self.assertEqual(BallPosition.middle, move.result_ball_position)
+
+        # Source board is left untouched.
+        self.assertEqual(Board.new().copy_board(), board.copy_board())
+
+    def test_card_move_description_and_markers(self):
+        board = Board(
+            board=[
+                ["W", ".", ".", ".", "."],
+                [".", "B", ".", ".", "."],
+                [".", ".", ".", ".", "."],
+                [".", ".", ".", ".", "."],
+                [".", ".", ".", ".", "B"],
+            ],
+            ball_position=BallPosition.middle,
+        )
+        move, = Dagger().get_available_card_moves(
+            player_sign=PlayerSign.white,
+            board=board,
+            card_index=2,
+        )
+        self.assertEqual("dagger pawn: B2", move.description)
+        self.assertEqual("B2", move.tile_marker_1)
+        self.assertIsNone(move.tile_marker_2)
+        self.assertEqual(2, move.used_card_index)
+        self.assertEqual(TileType.vacant, move.result_board[1][1])
+        self.assertEqual(BallPosition.black, move.result_ball_position)
+
+    def test_tank_result_board(self):
+        board = Board(
+            board=[
+                [".", "W", ".", ".", "."],
+                [".", "#", ".", ".", "."],
+                [".", ".", ".", ".", "."],
+                [".", ".", ".", ".", "."],
+                [".", ".", ".", ".", "B"],
+            ],
+            ball_position=BallPosition.middle,
+        )
+        move, = Tank().get_available_card_moves(
+            player_sign=PlayerSign.white,
+            board=board,
+            card_index=0,
+        )
+        self.assertEqual("tank: B1->B2", move.description)
+        self.assertEqual(
+            [
+                [".", ".", ".", ".", "."],
+                [".", "W", ".", ".", "."],
+                [".", "#", ".", ".", "."],
+                [".", ".", ".", ".", "."],
+                [".", ".", ".", ".", "B"],
+            ],
+            move.result_board.copy_board(),
+        )
+
+    def test_fire_result_board(self):
+        moves = Fire().get_available_card_moves(
+            player_sign=PlayerSign.black,
+            board=Board.new(),
+            card_index=0,
+        )
+        self.assertEqual(["fire in row: 5"], [move.description for move in moves])
+        self.assertEqual(0, moves[0].result_board.black_mask)
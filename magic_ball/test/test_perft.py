@@ -0,0 +1,47 @@
+import unittest
+
+from parameterized import parameterized
+
+from perft import Perft
+
+
+class TestPerft(unittest.TestCase):
+    @parameterized.expand([
+        (position.name, depth)
+        for position in Perft.REFERENCE_POSITIONS
+        for depth in [1, 2, 3]
+    ])
+    def test_reference_positions(self, position_name: str, depth: int):
+        position = Perft.get_reference_position(
+            name=position_name,
+        )
+        result = Perft.run_position(
+            position=position,
+            depth=depth,
+        )
+        self.assertEqual(position.expected_num_nodes[depth], result.num_nodes)
+        self.assertEqual(result.num_nodes, sum(result.num_nodes_per_card.values()))
+        self.assertEqual(result.num_nodes, sum(result.num_nodes_per_kind.values()))
+
+    def test_divide(self):
+        position = Perft.get_reference_position(
+            name="start_3_cards",
+        )
+        board = position.new_board()
+        white_cards, black_cards = position.cards()
+        expected_board = board.copy_board()
+        result = Perft.run(
+            board=board,
+            white_cards=white_cards,
+            black_cards=black_cards,
+            depth=2,
+            divide=True,
+        )
+        self.assertEqual(expected_board, board.copy_board())
+        self.assertEqual(position.expected_num_nodes[1], len(result.num_nodes_per_root_move))
+        self.assertEqual(result.num_nodes, sum(result.num_nodes_per_root_move.values()))
+        # Leaves are black replies.
+        self.assertEqual(
+            {"push": 120, "bishop": 402, "fire": 32, "spawn": 232},
+            result.num_nodes_per_card,
+        )
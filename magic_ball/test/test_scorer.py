@@ -1,10 +1,11 @@
 import unittest
 
+from bitboard_utils import BitboardUtils
 from board import Board
 from constants import DEFAULT_NUM_CARDS_PER_PLAYER
-from helper import Helper
 from models import PlayerSign, BallPosition
 from players.player_config import PlayerConfig
+from scores.board_features import BoardFeatures
 from scores.scorer import Scorer
 
 
@@ -34,57 +35,27 @@ class TestScorer(unittest.TestCase):
         )
         self.assertEqual(0, score)
 
-    def test_is_free_pawn(self):
-        white_pawn_indices = Helper.get_pawn_indices(
-            player_sign=PlayerSign.white,
-            board=self._board_example,
-        )
-        black_pawn_indices = Helper.get_pawn_indices(
-            player_sign=PlayerSign.black,
-            board=self._board_example,
+    def test_free_pawns(self):
+        features = BoardFeatures.extract(
+            board=Board.wrap(self._board_example),
         )
-        free_white_pawns_indices = {
-            (col_i, row_i)
-            for col_i, row_i in white_pawn_indices
-            if self.scorer._is_free_pawn(
-                player_sign=PlayerSign.white,
-                board=self._board_example,
-                col_i=col_i,
-                row_i=row_i,
-            )
-        }
-        free_black_pawns_indices = {
-            (col_i, row_i)
-            for col_i, row_i in black_pawn_indices
-            if self.scorer._is_free_pawn(
-                player_sign=PlayerSign.black,
-                board=self._board_example,
-                col_i=col_i,
-                row_i=row_i,
-            )
-        }
-        expected_free_white_pawns_indices = {
-            (0, 0),
-            (2, 2),
-        }
-        expected_free_black_pawns_indices = {
-            (2, 1),
-            (4, 1),
-        }
-        self.assertSetEqual(free_white_pawns_indices, expected_free_white_pawns_indices)
-        self.assertSetEqual(free_black_pawns_indices, expected_free_black_pawns_indices)
+        self.assertSetEqual({(0, 0), (2, 2)}, set(BitboardUtils.indices(mask=features.white.free_pawns)))
+        self.assertSetEqual({(2, 1), (4, 1)}, set(BitboardUtils.indices(mask=features.black.free_pawns)))
 
-    def test_get_free_pawn_distances_from_start_tile(self):
-        free_white_pawn_distances_from_start_tile = self.scorer._get_free_pawn_distances_from_start_tile(
-            player_sign=PlayerSign.white,
-            board=self._board_example,
+    def test_board_features(self):
+        features = BoardFeatures.extract(
+            board=Board.wrap(self._board_example),
         )
-        free_black_pawn_distances_from_start_tile = self.scorer._get_free_pawn_distances_from_start_tile(
-            player_sign=PlayerSign.black,
-            board=self._board_example,
-        )
-        self.assertListEqual([0, 2], free_white_pawn_distances_from_start_tile)
-        self.assertListEqual([3, 3], free_black_pawn_distances_from_start_tile)
+        self.assertEqual(3, features.white.num_pawns)
+        self.assertEqual(2, features.white.num_free_pawns)
+        self.assertEqual(2, features.white.farthest_free_pawn_distance)
+        self.assertFalse(features.white.is_win)
+        self.assertFalse(features.white.is_single_push_to_win)
+        self.assertEqual(6, features.black.num_pawns)
+        self.assertEqual(2, features.black.num_free_pawns)
+        self.assertEqual(3, features.black.farthest_free_pawn_distance)
+        self.assertFalse(features.black.is_win)
+        self.assertTrue(features.black.is_single_push_to_win)
 
     def test_winning_score(self):
         board = [
@@ -96,13 +67,13 @@ class TestScorer(unittest.TestCase):
         ]
         self.assertIsNotNone(
             self.scorer._winning_score(
-                board=board,
+                features=self._features(board=board),
                 ball_position=BallPosition.white,
             )
         )
         self.assertIsNone(
             self.scorer._winning_score(
-                board=board,
+                features=self._features(board=board),
                 ball_position=BallPosition.middle,
             )
         )
@@ -117,13 +88,13 @@ class TestScorer(unittest.TestCase):
         ]
         self.assertIsNotNone(
             self.scorer._losing_score(
-                board=board,
+                features=self._features(board=board),
                 ball_position=BallPosition.black,
             )
         )
         self.assertIsNone(
             self.scorer._losing_score(
-                board=board,
+                features=self._features(board=board),
                 ball_position=BallPosition.middle,
             )
         )
@@ -137,7 +108,7 @@ class TestScorer(unittest.TestCase):
             [".", "B", "B", "B", "B"],
         ]
         num_moves_to_win = self.scorer._num_moves_to_win(
-            board=board,
+            features=self._features(board=board),
             ball_position=BallPosition.white,
         )
         self.assertEqual(4, num_moves_to_win)
@@ -150,7 +121,7 @@ class TestScorer(unittest.TestCase):
             [".", "B", "B", "B", "B"],
         ]
         num_moves_to_win = self.scorer._num_moves_to_win(
-            board=board,
+            features=self._features(board=board),
             ball_position=BallPosition.white,
         )
         self.assertEqual(1, num_moves_to_win)
@@ -186,3 +157,9 @@ class TestScorer(unittest.TestCase):
             num_allowed_playable_cards=DEFAULT_NUM_CARDS_PER_PLAYER,
         )
         self.assertGreater(score_close_free_pawn, score_distant_free_pawn)
+
+    @staticmethod
+    def _features(board: list[list[str]]) -> BoardFeatures:
+        return BoardFeatures.extract(
+            board=Board.wrap(board),
+        )
@@ -0,0 +1,183 @@
+import unittest
+
+from board import Board
+from cards.cards_config import RulesConfig
+from cards.compendium import Compendium
+from game_config import GameConfig
+from game_manager import GameManager
+from models import BallPosition, GameStatus, PlayerSign
+from players.player_config import PlayerConfig, SearchConfig
+from players.search_player import SearchPlayer
+
+
+class TestSearchPlayer(unittest.TestCase):
+    def setUp(self):
+        self.board = Board(
+            board=[
+                [".", "W", ".", "W", "."],
+                [".", ".", ".", ".", "."],
+                ["W", ".", ".", ".", "."],
+                ["B", ".", ".", ".", "W"],
+                [".", "B", "B", "B", "."],
+            ],
+            ball_position=BallPosition.middle,
+        )
+
+    def test_play_winning_push(self):
+        player = self._search_player(
+            search_config=SearchConfig(
+                max_depth=3,
+                time_budget_ms=None,
+            ),
+        )
+        move = player.find_move(
+            board=self.board,
+            player_cards=[],
+            opponent_cards=[],
+        )
+        self.assertEqual("E5", move.description)
+
+    def test_board_and_cards_restored(self):
+        player = self._search_player(
+            search_config=SearchConfig(
+                max_depth=2,
+                time_budget_ms=None,
+            ),
+        )
+        white_cards = Compendium.get_cards()[:3]
+        black_cards = Compendium.get_cards()[3:6]
+        player.set_cards(
+            cards=white_cards,
+        )
+        expected_board = self.board.copy_board()
+        expected_hash = self.board.position_hash
+        player.find_move(
+            board=self.board,
+            player_cards=white_cards,
+            opponent_cards=black_cards,
+        )
+        self.assertEqual(2, player.last_search_depth)
+        self.assertEqual(expected_board, self.board.copy_board())
+        self.assertEqual(expected_hash, self.board.position_hash)
+        self.assertFalse(any(card.already_used for card in white_cards + black_cards))
+
+    def test_node_budget(self):
+        player = self._search_player(
+            search_config=SearchConfig(
+                max_depth=20,
+                time_budget_ms=None,
+                max_nodes=50,
+            ),
+        )
+        move = player.find_move(
+            board=Board.new(),
+            player_cards=[],
+            opponent_cards=[],
+        )
+        self.assertIsNotNone(move)
+        self.assertLessEqual(player.num_nodes, 51)
+        self.assertLess(player.last_search_depth, 20)
+
+    def test_node_budget_within_first_iteration(self):
+        # Only C2 and E3 are scored, out of C2, E3 and B4.
+        player = self._search_player(
+            search_config=SearchConfig(
+                max_depth=3,
+                time_budget_ms=None,
+                max_nodes=2,
+            ),
+        )
+        move = player.find_move(
+            board=Board(
+                board=[
+                    [".", ".", "W", ".", "."],
+                    ["B", ".", ".", "B", "W"],
+                    [".", "W", ".", ".", "."],
+                    [".", ".", ".", ".", "."],
+                    [".", "B", ".", ".", "."],
+                ],
+                ball_position=BallPosition.middle,
+            ),
+            player_cards=[],
+            opponent_cards=[],
+        )
+        self.assertEqual("E3", move.description)
+        self.assertEqual(0, player.last_search_depth)
+
+    def test_full_game(self):
+        gm = GameManager.new(
+            config=GameConfig(
+                white_player=PlayerConfig.default_search_opponent(
+                    time_budget_ms=20,
+                ),
+                black_player=PlayerConfig.default_ai_opponent(),
+            ),
+        )
+        self.assertNotEqual(GameStatus.ongoing, gm.game_status)
+
+    def test_pass_turn_not_supported(self):
+        with self.assertRaises(ValueError):
+            GameManager.new(
+                config=GameConfig(
+                    white_player=PlayerConfig.default_search_opponent(),
+                    black_player=PlayerConfig.default_ai_opponent(),
+                    rules_config=RulesConfig(
+                        allow_pass_turn=True,
+                    ),
+                ),
+            )
+
+    def test_is_deterministic(self):
+        config = PlayerConfig.default_search_opponent(
+            time_budget_ms=None,
+        )
+        self.assertTrue(config.is_deterministic())
+        config.random_tie_break = True
+        self.assertFalse(config.is_deterministic())
+        config.random_tie_break = False
+        config.search_config.time_budget_ms = 20
+        self.assertFalse(config.is_deterministic())
+
+    def test_transposition_table_terminal_scores(self):
+        # A win 2 plies below a position first reached at ply 3, then reached at ply 1.
+        stored_score = SearchPlayer._score_to_transposition_table(
+            score=SearchPlayer.TERMINAL_SCORE - 5,
+            ply=3,
+        )
+        self.assertEqual(SearchPlayer.TERMINAL_SCORE - 2, stored_score)
+        self.assertEqual(
+            SearchPlayer.TERMINAL_SCORE - 3,
+            SearchPlayer._score_from_transposition_table(
+                score=stored_score,
+                ply=1,
+            ),
+        )
+        self.assertEqual(
+            -(SearchPlayer.TERMINAL_SCORE - 3),
+            SearchPlayer._score_from_transposition_table(
+                score=SearchPlayer._score_to_transposition_table(
+                    score=-(SearchPlayer.TERMINAL_SCORE - 5),
+                    ply=3,
+                ),
+                ply=1,
+            ),
+        )
+        self.assertEqual(
+            42.5,
+            SearchPlayer._score_from_transposition_table(
+                score=SearchPlayer._score_to_transposition_table(
+                    score=42.5,
+                    ply=3,
+                ),
+                ply=1,
+            ),
+        )
+
+    @staticmethod
+    def _search_player(search_config: SearchConfig) -> SearchPlayer:
+        config = PlayerConfig.default_search_opponent()
+        config.search_config = search_config
+        return SearchPlayer(
+            player_sign=PlayerSign.white,
+            config=config,
+        )
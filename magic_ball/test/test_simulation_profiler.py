@@ -0,0 +1,40 @@
+import os
+import tempfile
+import unittest
+
+from game_config import GameConfig
+from game_simulator import GameSimulator
+from players.player_config import PlayerConfig
+from simulation_profiler import SimulationProfiler
+
+
+class TestSimulationProfiler(unittest.TestCase):
+    def test_profile_segment(self):
+        simulator = GameSimulator(
+            config=GameConfig(
+                white_player=PlayerConfig.default_ai_opponent(),
+                black_player=PlayerConfig.default_ai_opponent(),
+            ),
+        )
+        with tempfile.TemporaryDirectory() as output_dir:
+            profiler = SimulationProfiler(
+                output_dir=output_dir,
+                top_n=5,
+            )
+            with profiler.profile(segment="ai v ai"):
+                simulator.run(
+                    num_games=3,
+                    seed=0,
+                )
+            self.assertEqual(
+                ["ai_v_ai.collapsed", "ai_v_ai.prof", "ai_v_ai.txt"],
+                sorted(os.listdir(output_dir)),
+            )
+            collapsed_lines = open(profiler.segment_path(segment="ai v ai", extension="collapsed")).read().splitlines()
+            self.assertTrue(collapsed_lines)
+            for line in collapsed_lines:
+                stack, count = line.rsplit(" ", 1)
+                self.assertGreater(int(count), 0)
+                self.assertNotIn(" ", stack)
+            self.assertIn("GameSimulator.run", collapsed_lines[0])
+            self.assertIn("by cumulative", open(profiler.segment_path(segment="ai v ai", extension="txt")).read())
@@ -0,0 +1,45 @@
+import unittest
+
+from simulation_statistics import SimulationStatistics
+
+
+class TestSimulationStatistics(unittest.TestCase):
+    def test_z_score(self):
+        self.assertAlmostEqual(1.96, SimulationStatistics.z_score(confidence=0.95), places=2)
+
+    def test_wilson_interval(self):
+        low, high = SimulationStatistics.wilson_interval(
+            num_successes=50,
+            num_trials=100,
+            confidence=0.95,
+        )
+        self.assertAlmostEqual(0.404, low, places=3)
+        self.assertAlmostEqual(0.596, high, places=3)
+
+        low, high = SimulationStatistics.wilson_interval(
+            num_successes=0,
+            num_trials=10,
+            confidence=0.95,
+        )
+        self.assertAlmostEqual(0, low)
+        self.assertGreater(high, 0)
+
+    def test_two_proportions_p_value(self):
+        self.assertEqual(
+            1.0,
+            SimulationStatistics.two_proportions_p_value(
+                num_successes_1=30,
+                num_trials_1=100,
+                num_successes_2=30,
+                num_trials_2=100,
+            ),
+        )
+        self.assertLess(
+            SimulationStatistics.two_proportions_p_value(
+                num_successes_1=70,
+                num_trials_1=100,
+                num_successes_2=30,
+                num_trials_2=100,
+            ),
+            0.001,
+        )
@@ -0,0 +1,95 @@
+import unittest
+
+from models import BoundType, ReplacementPolicy
+from transposition_table import TranspositionTable
+
+
+class TestTranspositionTable(unittest.TestCase):
+    def test_store_and_probe(self):
+        table = TranspositionTable(
+            num_entries=100,
+        )
+        self.assertEqual(64, table.num_entries)
+        self.assertIsNone(table.probe(key=5))
+
+        table.store(
+            key=5,
+            depth=2,
+            score=1.5,
+            bound=BoundType.exact,
+            move_code=123,
+        )
+        entry = table.probe(key=5)
+        self.assertEqual(2, entry.depth)
+        self.assertEqual(1.5, entry.score)
+        self.assertEqual(BoundType.exact, entry.bound)
+        self.assertEqual(123, entry.move_code)
+
+        # Same index, different position.
+        self.assertIsNone(table.probe(key=5 + 64))
+
+        stats = table.stats()
+        self.assertEqual(3, stats.num_probes)
+        self.assertEqual(1, stats.num_hits)
+        self.assertEqual(2, stats.num_misses)
+        self.assertEqual(1, stats.num_collisions)
+        self.assertEqual(1, stats.num_used_entries)
+
+    def test_depth_preferred(self):
+        table = TranspositionTable(
+            num_entries=4,
+            replacement_policy=ReplacementPolicy.depth_preferred,
+        )
+        self._store(table=table, key=1, depth=3)
+        self._store(table=table, key=5, depth=1)
+        self.assertIsNone(table.probe(key=5))
+        self.assertEqual(3, table.probe(key=1).depth)
+
+        self._store(table=table, key=5, depth=3)
+        self.assertEqual(3, table.probe(key=5).depth)
+        self.assertEqual(1, table.stats().num_replacements)
+
+    def test_always_replace(self):
+        table = TranspositionTable(
+            num_entries=4,
+            replacement_policy=ReplacementPolicy.always_replace,
+        )
+        self._store(table=table, key=1, depth=3)
+        self._store(table=table, key=5, depth=1)
+        self.assertIsNone(table.probe(key=1))
+        self.assertEqual(1, table.probe(key=5).depth)
+
+    def test_keep_best_move_of_same_position(self):
+        table = TranspositionTable()
+        table.store(
+            key=7,
+            depth=1,
+            score=0,
+            bound=BoundType.exact,
+            move_code=42,
+        )
+        table.store(
+            key=7,
+            depth=2,
+            score=-10,
+            bound=BoundType.upper,
+        )
+        entry = table.probe(key=7)
+        self.assertEqual(2, entry.depth)
+        self.assertEqual(42, entry.move_code)
+
+    def test_clear(self):
+        table = TranspositionTable()
+        self._store(table=table, key=1, depth=1)
+        table.clear()
+        self.assertIsNone(table.probe(key=1))
+        self.assertEqual(0, table.stats().num_used_entries)
+
+    @staticmethod
+    def _store(table: TranspositionTable, key: int, depth: int):
+        table.store(
+            key=key,
+            depth=depth,
+            score=0,
+            bound=BoundType.exact,
+        )
@@ -0,0 +1,121 @@
+import unittest
+
+from parameterized import parameterized
+
+from board import Board
+from cards.compendium import Compendium
+from game_manager import GameManager
+from helper import Helper
+from models import PlayerSign, BallPosition, TileType
+from zobrist import Zobrist
+
+
+class TestZobrist(unittest.TestCase):
+    def setUp(self):
+        self.board = Board(
+            board=[
+                ["W", "W", ".", "W", "#"],
+                [".", ".", "W", ".", "."],
+                [".", "B", ".", ".", "."],
+                [".", ".", ".", "B", "."],
+                ["B", ".", "B", ".", "B"],
+            ],
+            ball_position=BallPosition.middle,
+        )
+
+    @parameterized.expand(PlayerSign.__members__.keys())
+    def test_incremental_hash(self, player_sign: PlayerSign):
+        cards = Compendium.get_cards()
+        available_moves = Helper.get_available_moves(
+            player_sign=player_sign,
+            board=self.board,
+            cards=cards,
+            num_allowed_playable_cards=len(cards),
+        )
+        source_hash = self.board.position_hash
+        for move in available_moves:
+            result_board = move.result_board
+            expected_hash = Zobrist.hash_board(
+                white=result_board.white_mask,
+                black=result_board.black_mask,
+                wall=result_board.wall_mask,
+                ball_position=result_board.ball_position,
+            ) ^ Zobrist.card_used_delta(
+                player_sign=player_sign,
+                card_index=move.used_card_index,
+            )
+            self.assertEqual(expected_hash, move.result_hash)
+            self.assertEqual(expected_hash, result_board.position_hash)
+            # Used cards are part of the result board.
+            self.assertEqual(
+                expected_hash,
+                Zobrist.hash_board(
+                    white=result_board.white_mask,
+                    black=result_board.black_mask,
+                    wall=result_board.wall_mask,
+                    ball_position=result_board.ball_position,
+                    white_used_cards=result_board.used_cards_mask(player_sign=PlayerSign.white),
+                    black_used_cards=result_board.used_cards_mask(player_sign=PlayerSign.black),
+                ),
+            )
+
+            self.board.make_move(
+                move=move,
+            )
+            self.assertEqual(expected_hash, self.board.position_hash)
+            self.board.unmake_move()
+            self.assertEqual(source_hash, self.board.position_hash)
+
+    def test_set_tile(self):
+        board = Board.new()
+        board.set_tile(
+            tile_type=TileType.wall,
+            col_i=2,
+            row_i=2,
+        )
+        board.set_tile(
+            tile_type=TileType.vacant,
+            col_i=0,
+            row_i=0,
+        )
+        expected_board = Board(
+            board=board.copy_board(),
+            ball_position=BallPosition.middle,
+        )
+        self.assertEqual(expected_board.position_hash, board.position_hash)
+        self.assertNotEqual(Board.new().position_hash, board.position_hash)
+
+    def test_transposition(self):
+        board = Board.new()
+        for target_tile in ["A2", "E4", "B2", "D4"]:
+            board.play_move(
+                move=self._push(board=board, target_tile=target_tile),
+            )
+        transposed_board = Board.new()
+        for target_tile in ["B2", "D4", "A2", "E4"]:
+            transposed_board.play_move(
+                move=self._push(board=transposed_board, target_tile=target_tile),
+            )
+        self.assertEqual(board.copy_board(), transposed_board.copy_board())
+        self.assertEqual(board.position_hash, transposed_board.position_hash)
+
+    def test_game_manager_side_to_move(self):
+        game_manager = GameManager.new()
+        white_hash = game_manager.position_hash
+        self.assertEqual(Board.new().position_hash, white_hash)
+        game_manager.push(
+            target_tile="A2",
+        )
+        self.assertEqual(
+            game_manager.board.position_hash ^ Zobrist.SIDE_TO_MOVE_KEY,
+            game_manager.position_hash,
+        )
+
+    @staticmethod
+    def _push(board: Board, target_tile: str):
+        player_sign = PlayerSign.white if target_tile[1] in "12" else PlayerSign.black
+        return Helper.generate_push_move(
+            player_sign=player_sign,
+            target_tile=target_tile,
+            board=board,
+        )